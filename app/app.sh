@@ -3,6 +3,13 @@
 # Change to app folder
 cd "/opt/app" || exit
 
+# Run the long-running Daemon (internal Scheduler) instead of Supercronic
+# exec is used so that SIGTERM is received directly by the Daemon
+if [[ "${RUN_MODE}" == "daemon" ]]
+then
+    exec python -u "/opt/app/sync_daemon.py" 1> /proc/1/fd/1 2> /proc/1/fd/2
+fi
+
 # Run Supercronic & Redirect Output of Children processes to Docker Log:
 # https://stackoverflow.com/questions/55444469/redirecting-script-output-to-docker-logs
 supercronic -split-logs /etc/supercronic/crontab 1> /proc/1/fd/1 2> /proc/1/fd/2 &
@@ -0,0 +1,583 @@
+# Local Stand-In for a Registry v2 Server used by the Benchmarks
+# Manifests are generated on Demand from a "Content Key", so that Registries with 100k Images stay small in Memory
+# Usage (standalone): python benchmarks/fake_registry.py --port 5000 --latency-ms 20
+
+# HTTP Server Library
+import http.server
+
+# Threading Library
+import threading
+
+# Hashing Library
+import hashlib
+
+# JSON Module
+import json
+
+# Random Number Generator Library
+import random
+
+# Regular Expressions Library
+import re
+
+# Time Library
+import time
+
+# UUID Library
+import uuid
+
+# Argument Parser Library
+import argparse
+
+# Collections Library
+from collections import Counter
+
+# URL Parsing Library
+from urllib.parse import urlparse, parse_qs, urlencode
+
+# Typing
+from typing import Any
+
+# Media Types used for the generated Images
+MEDIA_TYPE_INDEX = "application/vnd.oci.image.index.v1+json"
+MEDIA_TYPE_MANIFEST = "application/vnd.oci.image.manifest.v1+json"
+MEDIA_TYPE_CONFIG = "application/vnd.oci.image.config.v1+json"
+MEDIA_TYPE_LAYER = "application/vnd.oci.image.layer.v1.tar+gzip"
+
+# Layer shared by all generated Images (so that Blob Mounts can be measured)
+BASE_LAYER = b"benchmark-base-layer" * 512
+
+
+# Compute the Digest of some Content
+def get_digest(body: bytes) -> str:
+    return "sha256:" + hashlib.sha256(body).hexdigest()
+
+
+class FakeRegistry:
+    # Class Constructor
+    def __init__(self,
+                 latency: float = 0.0,
+                 error_rate: float = 0.0,
+                 ratelimit_limit: int | None = None,
+                 ratelimit_remaining: int | None = None,
+                 seed: int = 0,
+                 platforms: list[str] | None = None
+                 ) -> None:
+
+        # Delay added to every Request (in Seconds)
+        self.latency = latency
+
+        # Fraction of Requests answered with "503 Service Unavailable"
+        self.error_rate = error_rate
+
+        # Rate Limit advertised in the Headers of Manifest Requests (like Docker Hub)
+        # Each Manifest GET consumes one Pull, HEAD Requests are free. GET Requests are rejected with "429" once the Budget is exhausted.
+        self.ratelimit_limit = ratelimit_limit
+        self.ratelimit_remaining = ratelimit_remaining if ratelimit_remaining is not None else ratelimit_limit
+
+        # Random Number Generator (Errors are reproducible for a given Seed)
+        self.random = random.Random(seed)
+
+        # Platforms listed in the Index of each generated Image (e.g. ["linux/amd64", "linux/arm64"])
+        self.platforms = platforms if platforms is not None else ["linux/amd64"]
+
+        # Content Key of each Tag, keyed by Repository
+        self.tags = dict()
+
+        # Manifests uploaded by Clients, keyed by (Repository, Reference)
+        self.uploaded = dict()
+
+        # Tags uploaded by Clients, keyed by Repository
+        self.uploaded_tags = dict()
+
+        # Generated and uploaded Manifests, keyed by Digest
+        self.manifests = dict()
+
+        # Blobs, keyed by Digest
+        self.blobs = dict()
+
+        # Repositories containing each Blob
+        self.blob_repositories = dict()
+
+        # Number of Requests, keyed by "<Method> <Endpoint>"
+        self.counters = Counter()
+
+        # Lock protecting the State
+        self.lock = threading.Lock()
+
+        # HTTP Server
+        self.server = None
+
+    # Add an Image Tag (Images with the same Content Key share the same Digest)
+    def add_image(self,
+                  repository: str,
+                  tag: str,
+                  content_key: str
+                  ) -> None:
+
+        with self.lock:
+            self.tags.setdefault(repository, dict())[tag] = content_key
+
+    # Generate the Manifests & Blobs of a Content Key and return the Index (Body, Media Type)
+    # Lock must be held
+    def generate(self,
+                 content_key: str
+                 ) -> tuple[bytes, str]:
+
+        # Entries of the Index
+        descriptors = []
+
+        for platform in self.platforms:
+            os_name, architecture = platform.split("/")[0:2]
+
+            # Configuration & Layers
+            config = json.dumps({"architecture": architecture, "os": os_name, "config": {"Labels": {"benchmark": content_key}}}).encode()
+            layer = (content_key + platform).encode() * 16
+
+            # Image Manifest
+            manifest = json.dumps({"schemaVersion": 2,
+                                   "mediaType": MEDIA_TYPE_MANIFEST,
+                                   "config": {"mediaType": MEDIA_TYPE_CONFIG, "digest": get_digest(config), "size": len(config)},
+                                   "layers": [{"mediaType": MEDIA_TYPE_LAYER, "digest": get_digest(BASE_LAYER), "size": len(BASE_LAYER)},
+                                              {"mediaType": MEDIA_TYPE_LAYER, "digest": get_digest(layer), "size": len(layer)}]
+                                   }).encode()
+
+            descriptors.append({"mediaType": MEDIA_TYPE_MANIFEST,
+                                "digest": get_digest(manifest),
+                                "size": len(manifest),
+                                "platform": {"architecture": architecture, "os": os_name}})
+
+            # Store by Digest
+            for body in [config, layer, BASE_LAYER]:
+                self.blobs[get_digest(body)] = body
+            self.manifests[get_digest(manifest)] = (manifest, MEDIA_TYPE_MANIFEST)
+
+        # Image Index
+        index = json.dumps({"schemaVersion": 2,
+                            "mediaType": MEDIA_TYPE_INDEX,
+                            "manifests": descriptors
+                            }).encode()
+
+        self.manifests[get_digest(index)] = (index, MEDIA_TYPE_INDEX)
+
+        # Return Result
+        return (index, MEDIA_TYPE_INDEX)
+
+    # Get a Manifest (Body, Media Type) by Tag or Digest
+    def get_manifest(self,
+                     repository: str,
+                     reference: str
+                     ) -> tuple[bytes, str] | None:
+
+        with self.lock:
+            if (repository, reference) in self.uploaded:
+                return self.uploaded[(repository, reference)]
+
+            if reference.startswith("sha256:"):
+                return self.manifests.get(reference)
+
+            content_key = self.tags.get(repository, dict()).get(reference)
+
+            if content_key is None:
+                return None
+
+            return self.generate(content_key)
+
+    # Get all Tags of a Repository
+    def get_tags(self,
+                 repository: str
+                 ) -> list[str] | None:
+
+        with self.lock:
+            tags = set(self.tags.get(repository, dict()).keys()) | self.uploaded_tags.get(repository, set())
+
+        if len(tags) == 0:
+            return None
+
+        # Return Result
+        return sorted(tags)
+
+    # Get all Repositories
+    def get_repositories(self) -> list[str]:
+        with self.lock:
+            repositories = set(self.tags.keys()) | set(self.uploaded_tags.keys())
+
+        # Return Result
+        return sorted(repositories)
+
+    # Count a Request
+    def count(self,
+              key: str
+              ) -> None:
+
+        with self.lock:
+            self.counters[key] += 1
+
+    # Get Statistics (Number of Requests per Endpoint and in total)
+    def get_stats(self) -> dict[str, Any]:
+        with self.lock:
+            counters = dict(self.counters)
+
+        # Return Result
+        return dict(Requests=sum(counters.values()), Endpoints=dict(sorted(counters.items())))
+
+    # Reset Statistics
+    def reset_stats(self) -> None:
+        with self.lock:
+            self.counters = Counter()
+
+    # Get "host:port" of the running Server
+    @property
+    def address(self) -> str:
+        return f"127.0.0.1:{self.server.server_port}"
+
+    # Start Server in a Background Thread
+    def start(self,
+              port: int = 0
+              ) -> None:
+
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", port), make_handler(self))
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name="fake-registry", daemon=True).start()
+
+    # Stop Server
+    def stop(self) -> None:
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+# Build the Request Handler bound to a Registry
+def make_handler(registry: FakeRegistry) -> type:
+    class Handler(http.server.BaseHTTPRequestHandler):
+        # Keep Connections open (Clients reuse them)
+        protocol_version = "HTTP/1.1"
+
+        # Send Headers & Body in a single Packet (avoids Delays caused by delayed Acknowledgements)
+        wbufsize = -1
+        disable_nagle_algorithm = True
+
+        # Do not log every Request
+        def log_message(self, *args) -> None:
+            pass
+
+        # Send a Response
+        def reply(self,
+                  code: int,
+                  headers: dict[str, str] | None = None,
+                  body: bytes = b""
+                  ) -> None:
+
+            self.send_response(code)
+            for key, value in (headers or dict()).items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+
+            if self.command != "HEAD" and len(body) > 0:
+                self.wfile.write(body)
+
+        # Common Handling of all Requests: Latency, Errors, Authentication
+        # Returns the parsed URL if the Request must be processed, None if it was already answered
+        def prepare(self) -> Any:
+            # Parse URL
+            url = urlparse(self.path)
+
+            if registry.latency > 0:
+                time.sleep(registry.latency)
+
+            # Get Endpoint
+            if url.path == "/token":
+                endpoint = "token"
+            elif url.path == "/v2/" or url.path == "/v2":
+                endpoint = "ping"
+            elif url.path == "/v2/_catalog":
+                endpoint = "catalog"
+            elif url.path.startswith("/upload/"):
+                endpoint = "upload"
+            else:
+                match = re.match(r"^/v2/.+/(manifests|blobs|tags)/", url.path)
+                endpoint = match.group(1) if match is not None else "other"
+
+            registry.count(f"{self.command} {endpoint}")
+
+            # Injected Errors
+            if registry.error_rate > 0:
+                with registry.lock:
+                    failed = registry.random.random() < registry.error_rate
+
+                if failed:
+                    self.discard_body()
+                    self.reply(503, {"Content-Type": "application/json"}, b'{"errors":[{"code":"UNAVAILABLE"}]}')
+                    return None
+
+            # Token Endpoint (any Credentials are accepted)
+            if endpoint == "token":
+                self.reply(200, {"Content-Type": "application/json"}, json.dumps({"token": "benchmark", "expires_in": 300}).encode())
+                return None
+
+            # Bearer Authentication (Scope matching the Request, so that Clients can cache Tokens)
+            if not self.headers.get("Authorization", "").startswith("Bearer "):
+                match = re.match(r"^/v2/(.+)/(manifests|blobs|tags)/", url.path)
+                if match is not None:
+                    actions = "pull" if self.command in ["GET", "HEAD"] else "pull,push"
+                    scope = f"repository:{match.group(1)}:{actions}"
+                else:
+                    scope = "registry:catalog:*"
+
+                self.discard_body()
+                self.reply(401, {"WWW-Authenticate": f'Bearer realm="http://{registry.address}/token",service="fake-registry",scope="{scope}"'})
+                return None
+
+            # Return Result
+            return url
+
+        # Read the Body of the Request
+        def read_body(self) -> bytes:
+            return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        # Discard the Body of the Request (so that the Connection can be reused)
+        def discard_body(self) -> None:
+            if self.command in ["PUT", "POST", "PATCH"]:
+                self.read_body()
+
+        # Answer a paginated List
+        def reply_list(self,
+                       url: Any,
+                       key: str,
+                       items: list[str]
+                       ) -> None:
+
+            # Get Page
+            query = parse_qs(url.query)
+            size = int(query.get("n", ["100"])[0])
+            last = query.get("last", [None])[0]
+            start = 0 if last is None else next((index for index, item in enumerate(items) if item > last), len(items))
+            page = items[start:start + size]
+
+            # Link to the next Page
+            headers = {"Content-Type": "application/json"}
+            if start + size < len(items):
+                headers["Link"] = f'<{url.path}?{urlencode({"last": page[-1], "n": size})}>; rel="next"'
+
+            # Conditional Requests
+            body = json.dumps({key: page}).encode()
+            headers["ETag"] = '"' + hashlib.sha256(body + headers.get("Link", "").encode()).hexdigest()[0:32] + '"'
+
+            if self.headers.get("If-None-Match") == headers["ETag"]:
+                self.reply(304, dict(ETag=headers["ETag"]))
+                return
+
+            self.reply(200, headers, body)
+
+        # Answer a Manifest Request
+        def reply_manifest(self,
+                           repository: str,
+                           reference: str
+                           ) -> None:
+
+            manifest = registry.get_manifest(repository, reference)
+
+            if manifest is None:
+                self.reply(404, {"Content-Type": "application/json"}, b'{"errors":[{"code":"MANIFEST_UNKNOWN"}]}')
+                return
+
+            body, media_type = manifest
+            headers = {"Content-Type": media_type, "Docker-Content-Digest": get_digest(body)}
+
+            if registry.ratelimit_limit is not None:
+                with registry.lock:
+                    if self.command == "GET" and registry.ratelimit_remaining <= 0:
+                        exhausted = True
+                    else:
+                        exhausted = False
+                        if self.command == "GET":
+                            registry.ratelimit_remaining -= 1
+
+                    headers["ratelimit-limit"] = f"{registry.ratelimit_limit};w=21600"
+                    headers["ratelimit-remaining"] = f"{max(0, registry.ratelimit_remaining)};w=21600"
+
+                if exhausted:
+                    self.reply(429, headers | {"Content-Type": "application/json"}, b'{"errors":[{"code":"TOOMANYREQUESTS"}]}')
+                    return
+
+            if self.command == "HEAD":
+                # Same Headers as GET, without Body
+                self.send_response(200)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                return
+
+            self.reply(200, headers, body)
+
+        # Answer a Blob Request
+        def reply_blob(self,
+                       repository: str,
+                       digest: str
+                       ) -> None:
+
+            with registry.lock:
+                body = registry.blobs.get(digest)
+                uploaded_elsewhere = digest in registry.blob_repositories and repository not in registry.blob_repositories[digest]
+
+            # Blobs uploaded by Clients only exist in the Repositories they were uploaded to (or mounted into)
+            if body is None or uploaded_elsewhere:
+                self.reply(404)
+                return
+
+            self.reply(200, {"Content-Type": "application/octet-stream", "Docker-Content-Digest": digest}, body)
+
+        # GET Requests
+        def do_GET(self) -> None:
+            url = self.prepare()
+            if url is None:
+                return
+
+            if url.path in ["/v2/", "/v2"]:
+                self.reply(200, {"Content-Type": "application/json"}, b"{}")
+                return
+
+            if url.path == "/v2/_catalog":
+                self.reply_list(url, "repositories", registry.get_repositories())
+                return
+
+            match = re.match(r"^/v2/(.+)/tags/list$", url.path)
+            if match is not None:
+                tags = registry.get_tags(match.group(1))
+
+                if tags is None:
+                    self.reply(404, {"Content-Type": "application/json"}, b'{"errors":[{"code":"NAME_UNKNOWN"}]}')
+                    return
+
+                self.reply_list(url, "tags", tags)
+                return
+
+            match = re.match(r"^/v2/(.+)/(manifests|blobs)/([^/]+)$", url.path)
+            if match is None:
+                self.reply(404)
+                return
+
+            repository, kind, reference = match.groups()
+
+            if kind == "manifests":
+                self.reply_manifest(repository, reference)
+            else:
+                self.reply_blob(repository, reference)
+
+        # HEAD Requests
+        def do_HEAD(self) -> None:
+            self.do_GET()
+
+        # POST Requests (Blob Uploads & Mounts)
+        def do_POST(self) -> None:
+            url = self.prepare()
+            if url is None:
+                return
+
+            self.discard_body()
+
+            match = re.match(r"^/v2/(.+)/blobs/uploads/$", url.path)
+            if match is None:
+                self.reply(404)
+                return
+
+            repository = match.group(1)
+            query = parse_qs(url.query)
+
+            if "mount" in query:
+                digest = query["mount"][0]
+                source = query.get("from", [""])[0]
+
+                with registry.lock:
+                    repositories = registry.blob_repositories.get(digest)
+                    mounted = repositories is not None and source in repositories
+
+                    if mounted:
+                        repositories.add(repository)
+
+                if mounted:
+                    self.reply(201, {"Location": f"/v2/{repository}/blobs/{digest}", "Docker-Content-Digest": digest})
+                    return
+
+            # Open Upload Session
+            self.reply(202, {"Location": f"/upload/{uuid.uuid4()}?{urlencode({'repository': repository})}"})
+
+        # PUT Requests (Blob Uploads & Manifests)
+        def do_PUT(self) -> None:
+            url = self.prepare()
+            if url is None:
+                return
+
+            body = self.read_body()
+            query = parse_qs(url.query)
+
+            if url.path.startswith("/upload/"):
+                # Complete a monolithic Upload
+                digest = query.get("digest", [""])[0]
+                repository = query.get("repository", [""])[0]
+
+                if get_digest(body) != digest:
+                    self.reply(400, {"Content-Type": "application/json"}, b'{"errors":[{"code":"DIGEST_INVALID"}]}')
+                    return
+
+                with registry.lock:
+                    registry.blobs[digest] = body
+                    registry.blob_repositories.setdefault(digest, set()).add(repository)
+
+                self.reply(201, {"Location": f"/v2/{repository}/blobs/{digest}", "Docker-Content-Digest": digest})
+                return
+
+            match = re.match(r"^/v2/(.+)/manifests/([^/]+)$", url.path)
+            if match is None:
+                self.reply(404)
+                return
+
+            # Store Manifest (Blobs are not verified)
+            repository, reference = match.groups()
+            media_type = self.headers.get("Content-Type", MEDIA_TYPE_MANIFEST)
+            digest = get_digest(body)
+
+            with registry.lock:
+                registry.uploaded[(repository, reference)] = (body, media_type)
+                registry.manifests[digest] = (body, media_type)
+
+                if not reference.startswith("sha256:"):
+                    registry.uploaded_tags.setdefault(repository, set()).add(reference)
+
+            self.reply(201, {"Location": f"/v2/{repository}/manifests/{digest}", "Docker-Content-Digest": digest})
+
+    # Return Class
+    return Handler
+
+
+# Main Method (execution as a Script)
+if __name__ == "__main__":
+    # Parse Arguments
+    parser = argparse.ArgumentParser(description="Run a local Registry v2 Stand-In")
+    parser.add_argument("--port", type=int, default=5000, help="Port to listen on")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every Request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of Requests failing with 503")
+    parser.add_argument("--ratelimit-limit", type=int, default=None, help="Advertise a Docker Hub like Rate Limit")
+    parser.add_argument("--images", type=int, default=10, help="Number of generated Images (bench/imageNNNNN:latest)")
+    args = parser.parse_args()
+
+    # Setup Registry
+    fake_registry = FakeRegistry(latency=args.latency_ms / 1000,
+                                 error_rate=args.error_rate,
+                                 ratelimit_limit=args.ratelimit_limit
+                                 )
+
+    for number in range(args.images):
+        fake_registry.add_image(f"bench/image{number:05d}", "latest", f"image{number:05d}")
+
+    fake_registry.start(args.port)
+    print(f"[INFO] Fake Registry listening on {fake_registry.address} (Press Ctrl+C to stop)")
+
+    try:
+        while True:
+            time.sleep(60)
+    except KeyboardInterrupt:
+        fake_registry.stop()
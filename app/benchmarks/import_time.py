@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+# Measure the Startup Cost of the Application using "python -X importtime"
+# Usage: python benchmarks/import_time.py [--module docker_sync_registries.utils] [--runs 5] [--max-ms 300] [--json]
+
+# Subprocess Python Module
+import subprocess
+
+# Argument Parser Library
+import argparse
+
+# OS Library
+import os
+
+# sys Library
+import sys
+
+# JSON Module
+import json
+
+# Statistics Library
+import statistics
+
+# Application Folder (Parent of this Script's Folder)
+APP_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Run "python -X importtime" once and parse its Output
+# Returns (Cumulative Time of the Module in Microseconds, Dictionary of Cumulative Time per direct Dependency)
+def measure_import_time(module: str) -> tuple[int, dict[str, int]]:
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=APP_PATH,
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE,
+                            text=True,
+                            check=True
+                            )
+
+    # Declare Variables
+    total = 0
+    dependencies = dict()
+    pending = dict()
+
+    # Parse Lines in the Form "import time:       self [us] |  cumulative | imported package"
+    # Nested Imports are printed before their Parent and indented by two Spaces per Level
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        fields = line.removeprefix("import time:").split("|")
+
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+
+        # Get Name, Depth and Cumulative Time
+        name = fields[2].strip()
+        depth = (len(fields[2]) - len(fields[2].lstrip()) - 1) // 2
+        cumulative = int(fields[1])
+
+        if depth == 1:
+            # Direct Dependency of the next top-level Import
+            pending[name] = cumulative
+        elif depth == 0:
+            if name.split(".")[0] == module.split(".")[0]:
+                # Top-level Import belonging to the measured Module
+                total += cumulative
+                dependencies.update(pending)
+
+            pending = dict()
+
+    # Return Result
+    return (total, dependencies)
+
+
+# Main Method (execution as a Script)
+if __name__ == "__main__":
+    # Parse Arguments
+    parser = argparse.ArgumentParser(description="Measure the Import Time of the Application")
+    parser.add_argument("--module", default="docker_sync_registries.utils", help="Module to import")
+    parser.add_argument("--runs", type=int, default=5, help="Number of Runs (the Median is reported)")
+    parser.add_argument("--top", type=int, default=10, help="Number of heaviest Imports to display")
+    parser.add_argument("--max-ms", type=float, default=None, help="Exit with an Error if the Median exceeds this Value")
+    parser.add_argument("--json", action="store_true", help="Output Results as JSON (for Regression Tracking)")
+    args = parser.parse_args()
+
+    # Measure
+    totals = []
+    dependencies = dict()
+    for _ in range(args.runs):
+        total, dependencies = measure_import_time(args.module)
+        totals.append(total)
+
+    # Compute Median
+    median_ms = statistics.median(totals) / 1000
+
+    # Heaviest Imports of the last Run
+    heaviest = sorted(dependencies.items(), key=lambda item: item[1], reverse=True)[0:args.top]
+
+    if args.json:
+        print(json.dumps(dict(Module=args.module,
+                              Runs=args.runs,
+                              ImportTimeMedianMs=round(median_ms, 1),
+                              ImportTimeRunsMs=[round(total / 1000, 1) for total in totals],
+                              Heaviest={name: round(cumulative / 1000, 1) for name, cumulative in heaviest}
+                              ),
+                         indent=4
+                         )
+              )
+    else:
+        print(f"[INFO] Import Time of {args.module}: {median_ms:.1f} ms (Median of {args.runs} Runs)")
+        for name, cumulative in heaviest:
+            print(f"\t- {name}: {cumulative / 1000:.1f} ms")
+
+    # Regression Check
+    if args.max_ms is not None and median_ms > args.max_ms:
+        print(f"[ERROR] Import Time {median_ms:.1f} ms exceeds the Limit of {args.max_ms:.1f} ms")
+        sys.exit(1)
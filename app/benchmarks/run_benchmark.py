@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+
+# Measure Scan & Sync Throughput against local fake Registries and stub Tools (no real Registry needed)
+# Each Scenario runs in its own Process, so that its Peak Memory Usage can be reported.
+# Usage: python benchmarks/run_benchmark.py [--sizes 10,100,1000] [--scenarios sync,inventory] [--sync-tool skopeo] [--latency-ms 5] [--json]
+#
+# Scenarios:
+# - "sync": run_synchronization() with an empty Database (all Images are checked, STALE_RATIO of them are transferred)
+# - "inventory": find_old_images() walking the Destination Registry
+
+# Subprocess Python Module
+import subprocess
+
+# Argument Parser Library
+import argparse
+
+# OS Library
+import os
+
+# sys Library
+import sys
+
+# JSON Module
+import json
+
+# Time Library
+import time
+
+# Random Number Generator Library
+import random
+
+# Temporary Files Library
+import tempfile
+
+# Shell Utilities Library
+import shutil
+
+# Resource Usage Library
+import resource
+
+# Collections Library
+from collections import Counter
+
+# Typing
+from typing import Any
+
+# Benchmarks Folder
+BENCHMARKS_PATH = os.path.dirname(os.path.abspath(__file__))
+
+# Application Folder (Parent of this Script's Folder)
+APP_PATH = os.path.dirname(BENCHMARKS_PATH)
+
+# Make the Application & the fake Registry importable
+sys.path.insert(0, APP_PATH)
+sys.path.insert(0, BENCHMARKS_PATH)
+
+# Fake Registry
+from fake_registry import FakeRegistry  # noqa: E402
+
+# Tools replaced by the Stub
+STUB_TOOLS = ["regctl", "skopeo", "crane"]
+
+# Available Scenarios
+SCENARIOS = ["sync", "inventory"]
+
+
+# Get the Repository & Tag of each generated Image
+def generate_images(size: int,
+                    tags_per_image: int
+                    ) -> list[tuple[str, str]]:
+
+    # Declare List
+    images = []
+
+    for number in range(size):
+        # 100 Repositories per Namespace
+        repository = number // tags_per_image
+        images.append((f"ns{repository // 100:04d}/image{repository:06d}", f"v{number % tags_per_image}"))
+
+    # Return Result
+    return images
+
+
+# Write the Configuration File of the generated Images
+def write_config(filepath: str,
+                 namespace: str,
+                 images: list[tuple[str, str]]
+                 ) -> None:
+
+    # Group Tags by Repository (keeping the Order)
+    repositories = dict()
+    for repository, tag in images:
+        repositories.setdefault(repository, []).append(tag)
+
+    # Build Lines (written by Hand, dumping 100k Images with yaml is slow)
+    lines = [f"{namespace}:", "    images:"]
+    for repository, tags in repositories.items():
+        lines.append(f"        {repository}: [" + ", ".join(f'"{tag}"' for tag in tags) + "]")
+
+    with open(filepath, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+# Populate Source & Destination Registries
+# Returns the Number of Images that are outdated or missing in the Destination Registry
+def populate(source: FakeRegistry,
+             destination: FakeRegistry,
+             images: list[tuple[str, str]],
+             stale_ratio: float,
+             seed: int
+             ) -> int:
+
+    # Random Number Generator (the same Images are stale for a given Seed)
+    generator = random.Random(seed)
+
+    # Statistics
+    stale = 0
+
+    for repository, tag in images:
+        content_key = f"{repository}:{tag}"
+        source.add_image(f"bench/{repository}", tag, content_key)
+
+        # The Destination Repository contains the Source Registry & Namespace
+        destination_repository = f"{source.address}/bench/{repository}"
+
+        if generator.random() < stale_ratio:
+            stale += 1
+
+            # Half of the stale Images are outdated, the other Half is missing
+            if generator.random() < 0.5:
+                destination.add_image(destination_repository, tag, content_key + "-old")
+        else:
+            destination.add_image(destination_repository, tag, content_key)
+
+        # Some Tags that are not configured anymore (found by find_old_images)
+        if tag == "v0" and generator.random() < 0.1:
+            destination.add_image(destination_repository, "old", content_key + "-old")
+
+    # Return Result
+    return stale
+
+
+# Run a Scenario (inside the Worker Process) and write the Result to a File
+def run_worker(scenario: str,
+               result_filepath: str,
+               lock_filepath: str
+               ) -> None:
+
+    # Measure the Import as well (it is Part of every Run)
+    start = time.monotonic()
+
+    # Import Library
+    import docker_sync_registries.utils as utils
+
+    # Do not touch the Lock File of a real Installation
+    utils.LOCK_FILE = lock_filepath
+
+    # Initialize Object
+    app = utils.SyncRegistries()
+    initialized = time.monotonic()
+
+    if scenario == "sync":
+        app.run_synchronization()
+    elif scenario == "inventory":
+        app.find_old_images()
+
+    finished = time.monotonic()
+
+    # Resource Usage of this Process and of the Tools it started
+    usage_self = resource.getrusage(resource.RUSAGE_SELF)
+    usage_children = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+    with open(result_filepath, "w") as f:
+        json.dump(dict(WallTimeSeconds=round(finished - start, 3),
+                       SetupSeconds=round(initialized - start, 3),
+                       RunSeconds=round(finished - initialized, 3),
+                       CpuSeconds=round(usage_self.ru_utime + usage_self.ru_stime, 3),
+                       ToolCpuSeconds=round(usage_children.ru_utime + usage_children.ru_stime, 3),
+                       # ru_maxrss is reported in Kilobytes on Linux
+                       PeakRssMiB=round(usage_self.ru_maxrss / 1024, 1),
+                       Status=dict(Counter(item.get("Status") for item in app.current))
+                       ),
+                  f
+                  )
+
+
+# Run a Scenario for a given Number of Images
+def run_scenario(scenario: str,
+                 size: int,
+                 args: argparse.Namespace
+                 ) -> dict[str, Any]:
+
+    # Temporary Folder for Configuration, Database, Stub Tools and Logs
+    workdir = tempfile.mkdtemp(prefix=f"benchmark-{scenario}-{size}-")
+
+    try:
+        for folder in ["config", "database", "bin"]:
+            os.makedirs(os.path.join(workdir, folder))
+
+        # Stub Tools
+        for tool in STUB_TOOLS:
+            os.symlink(os.path.join(BENCHMARKS_PATH, "stub_tool.py"), os.path.join(workdir, "bin", tool))
+
+        # Start fake Registries
+        source = FakeRegistry(latency=args.latency_ms / 1000,
+                              error_rate=args.error_rate,
+                              ratelimit_limit=args.ratelimit_limit,
+                              ratelimit_remaining=args.ratelimit_remaining,
+                              seed=args.seed
+                              )
+        destination = FakeRegistry(latency=args.latency_ms / 1000,
+                                   error_rate=args.error_rate,
+                                   seed=args.seed
+                                   )
+        source.start()
+        destination.start()
+
+        # Generate Images
+        images = generate_images(size, args.tags_per_image)
+        stale = populate(source, destination, images, args.stale_ratio, args.seed)
+        write_config(os.path.join(workdir, "config", "sync.yml"), f"{source.address}/bench", images)
+
+        # Environment of the Worker
+        env = dict(os.environ)
+        env.update(CONFIG_BASE_PATH=os.path.join(workdir, "config"),
+                   DATABASE_BASE_PATH=os.path.join(workdir, "database"),
+                   DESTINATION_REGISTRY_HOSTNAME=destination.address,
+                   INSECURE_REGISTRIES=f"{source.address},{destination.address}",
+                   REGISTRY_AUTH_FILE=os.path.join(workdir, "auth.json"),
+                   LOCAL_APPS_RUN_INSIDE_CONTAINER="false",
+                   LOCAL_APPS_REGCTL_PATH=os.path.join(workdir, "bin", "regctl"),
+                   LOCAL_APPS_SKOPEO_PATH=os.path.join(workdir, "bin", "skopeo"),
+                   LOCAL_APPS_CRANE_PATH=os.path.join(workdir, "bin", "crane"),
+                   SYNC_TOOL=args.sync_tool,
+                   MANIFEST_BACKEND=args.manifest_backend,
+                   STUB_TOOL_LOG=os.path.join(workdir, "tools.log"),
+                   STUB_TOOL_DELAY=str(args.tool_delay_ms / 1000),
+                   PYTHONPATH=APP_PATH
+                   )
+
+        # Additional Settings of the Application
+        for item in args.env:
+            key, _, value = item.partition("=")
+            env[key] = value
+
+        # Run Worker
+        result_filepath = os.path.join(workdir, "result.json")
+        log_filepath = os.path.join(workdir, "output.log")
+
+        with open(log_filepath, "w") as log_handle:
+            process = subprocess.run([sys.executable, os.path.abspath(__file__),
+                                      "--worker", scenario,
+                                      "--result", result_filepath,
+                                      "--lock", os.path.join(workdir, "sync-registries.lock")],
+                                     cwd=workdir,
+                                     env=env,
+                                     stdout=log_handle,
+                                     stderr=subprocess.STDOUT
+                                     )
+
+        # Collect Results
+        result = dict(Scenario=scenario,
+                      Images=size,
+                      StaleImages=stale if scenario == "sync" else None,
+                      SyncTool=args.sync_tool,
+                      ManifestBackend=args.manifest_backend,
+                      LatencyMs=args.latency_ms,
+                      ErrorRate=args.error_rate
+                      )
+
+        if process.returncode != 0 or not os.path.exists(result_filepath):
+            # Keep the last Lines of the Output for Troubleshooting
+            with open(log_filepath, "r") as log_handle:
+                result["Error"] = dict(ReturnCode=process.returncode, Output=log_handle.readlines()[-20:])
+        else:
+            with open(result_filepath, "r") as f:
+                result.update(json.load(f))
+
+        # Processes spawned (one Line per Invocation of a Stub Tool)
+        processes = Counter()
+        if os.path.exists(os.path.join(workdir, "tools.log")):
+            with open(os.path.join(workdir, "tools.log"), "r") as f:
+                for line in f:
+                    processes[" ".join(line.split()[0:2])] += 1
+
+        result["Processes"] = sum(processes.values())
+        result["ProcessesByCommand"] = dict(sorted(processes.items()))
+
+        # Requests received by the Registries
+        result["Source"] = source.get_stats()
+        result["Destination"] = destination.get_stats()
+        result["Requests"] = result["Source"]["Requests"] + result["Destination"]["Requests"]
+
+        source.stop()
+        destination.stop()
+
+        if args.keep:
+            result["WorkDir"] = workdir
+
+        # Return Result
+        return result
+    finally:
+        if not args.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+# Main Method (execution as a Script)
+if __name__ == "__main__":
+    # Parse Arguments
+    parser = argparse.ArgumentParser(description="Benchmark Scan & Sync against local fake Registries")
+    parser.add_argument("--sizes", default="10,100,1000", help="Comma-separated Numbers of Images (e.g. 10,1000,100000)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help=f"Comma-separated Scenarios ({', '.join(SCENARIOS)})")
+    parser.add_argument("--sync-tool", default="skopeo", choices=["skopeo", "regctl", "crane", "native"], help="SYNC_TOOL of the Application")
+    parser.add_argument("--manifest-backend", default="native", choices=["native", "regctl"], help="MANIFEST_BACKEND of the Application")
+    parser.add_argument("--tags-per-image", type=int, default=2, help="Number of Tags configured per Repository")
+    parser.add_argument("--stale-ratio", type=float, default=0.1, help="Fraction of Images that are outdated or missing in the Destination Registry")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added by the fake Registries to every Request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of Requests failing with 503")
+    parser.add_argument("--ratelimit-limit", type=int, default=None, help="Rate Limit advertised by the Source Registry")
+    parser.add_argument("--ratelimit-remaining", type=int, default=None, help="Remaining Pulls at the Start (defaults to the Limit)")
+    parser.add_argument("--tool-delay-ms", type=float, default=0.0, help="Startup Time simulated by each Stub Tool Process")
+    parser.add_argument("--seed", type=int, default=0, help="Seed used to select stale Images and injected Errors")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE", help="Additional Setting of the Application (can be repeated)")
+    parser.add_argument("--keep", action="store_true", help="Keep the temporary Folders (Configuration, Database, Logs)")
+    parser.add_argument("--json", action="store_true", help="Output Results as JSON (for Regression Tracking)")
+    parser.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--result", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--lock", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # Worker Process
+    if args.worker is not None:
+        run_worker(args.worker, args.result, args.lock)
+        sys.exit(0)
+
+    # Get Sizes & Scenarios
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip() != ""]
+    scenarios = [scenario.strip() for scenario in args.scenarios.split(",") if scenario.strip() != ""]
+
+    for scenario in scenarios:
+        if scenario not in SCENARIOS:
+            print(f"[ERROR] Invalid Scenario {scenario}. Valid Scenarios are: {', '.join(SCENARIOS)}")
+            sys.exit(1)
+
+    # Run Benchmarks
+    results = []
+    for size in sizes:
+        for scenario in scenarios:
+            if not args.json:
+                print(f"[INFO] Run Scenario {scenario} with {size} Image(s)")
+
+            result = run_scenario(scenario, size, args)
+            results.append(result)
+
+            if not args.json:
+                if "Error" in result:
+                    print(f"[ERROR] Scenario {scenario} with {size} Image(s) failed (Return Code {result['Error']['ReturnCode']})")
+                    print("".join(result["Error"]["Output"]))
+                else:
+                    print(f"\t- Wall Time: {result['WallTimeSeconds']:.2f} s (Setup {result['SetupSeconds']:.2f} s, Run {result['RunSeconds']:.2f} s)")
+                    print(f"\t- Requests: {result['Requests']} (Source {result['Source']['Requests']}, Destination {result['Destination']['Requests']})")
+                    print(f"\t- Processes spawned: {result['Processes']}")
+                    print(f"\t- Peak RSS: {result['PeakRssMiB']:.1f} MiB")
+                    print(f"\t- Status: {', '.join(f'{key} = {value}' for key, value in result['Status'].items())}")
+
+    if args.json:
+        print(json.dumps(results, indent=4))
+
+    # Fail if any Scenario failed
+    if any("Error" in result for result in results):
+        sys.exit(1)
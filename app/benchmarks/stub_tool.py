@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+
+# Stub of "regctl", "skopeo" and "crane" used by the Benchmarks
+# The Tool is selected by the Name of the Link used to run this Script (e.g. "bin/skopeo -> stub_tool.py")
+# Supported Commands:
+# - regctl manifest head <Reference>
+# - regctl manifest get --format raw-body <Reference>
+# - regctl manifest put --content-type <Media Type> <Reference> (Manifest read from the standard Input)
+# - regctl image copy <Source> <Destination>
+# - regctl repo ls [--limit N] [--last Repository] <Registry>
+# - regctl tag ls [--limit N] [--last Tag] <Registry/Repository>
+# - crane copy <Source> <Destination>
+# - skopeo copy [Options] docker://<Source> docker://<Destination>
+# - skopeo sync [Options] <Source> <Destination Repository Prefix>
+# Copies only transfer the Manifests (the fake Registry does not verify Blobs).
+#
+# Environment Variables:
+# - STUB_TOOL_LOG: File where every Invocation is appended (one Line per Process)
+# - STUB_TOOL_DELAY: Seconds to wait before doing anything (simulates the Startup of the real Tool)
+
+# OS Library
+import os
+
+# sys Library
+import sys
+
+# Time Library
+import time
+
+# JSON Module
+import json
+
+# Regular Expressions Library
+import re
+
+# URL Library
+import urllib.parse
+import urllib.request
+import urllib.error
+
+# Media Types accepted when reading Manifests
+ACCEPT = ",".join([
+                   "application/vnd.oci.image.index.v1+json",
+                   "application/vnd.docker.distribution.manifest.list.v2+json",
+                   "application/vnd.oci.image.manifest.v1+json",
+                   "application/vnd.docker.distribution.manifest.v2+json",
+])
+
+# Media Types of Manifest Lists / Image Indexes
+INDEX_MEDIA_TYPES = ["application/vnd.oci.image.index.v1+json", "application/vnd.docker.distribution.manifest.list.v2+json"]
+
+# Tokens obtained during this Process, keyed by Scope
+TOKENS = dict()
+
+
+# Split "registry/repository:tag" or "registry/repository@digest"
+def parse_reference(reference: str) -> tuple[str, str, str]:
+    registry, _, remainder = reference.removeprefix("docker://").partition("/")
+
+    if "@" in remainder:
+        repository, _, tag = remainder.partition("@")
+    else:
+        repository, _, tag = remainder.rpartition(":") if ":" in remainder.rsplit("/", 1)[-1] else (remainder, "", "latest")
+
+    # Return Result
+    return (registry, repository, tag)
+
+
+# Perform an HTTP Request against the fake Registry (plain HTTP, Bearer Authentication)
+def request(method: str,
+            registry: str,
+            path: str,
+            body: bytes | None = None,
+            headers: dict[str, str] | None = None
+            ) -> tuple[int, dict[str, str], bytes]:
+
+    headers = dict(headers or dict())
+
+    for _ in range(2):
+        scope = path.split("/manifests/")[0].removeprefix("/v2/")
+        if scope in TOKENS:
+            headers["Authorization"] = f"Bearer {TOKENS[scope]}"
+
+        try:
+            with urllib.request.urlopen(urllib.request.Request(f"http://{registry}{path}", data=body, headers=headers, method=method)) as response:
+                return (response.status, dict(response.headers), response.read())
+        except urllib.error.HTTPError as e:
+            challenge = e.headers.get("WWW-Authenticate", "")
+
+            if e.code != 401 or scope in TOKENS or not challenge.startswith("Bearer "):
+                return (e.code, dict(e.headers), e.read())
+
+            # Get Token
+            realm = re.search(r'realm="([^"]+)"', challenge).group(1)
+            with urllib.request.urlopen(realm) as response:
+                TOKENS[scope] = json.loads(response.read())["token"]
+
+    # Return Result
+    return (401, dict(), b"")
+
+
+# Get a Manifest (Status, Body, Media Type)
+def get_manifest(reference: str,
+                 method: str = "GET"
+                 ) -> tuple[int, bytes, str, str]:
+
+    registry, repository, tag = parse_reference(reference)
+    status, headers, body = request(method, registry, f"/v2/{repository}/manifests/{tag}", headers={"Accept": ACCEPT})
+
+    # Return Result
+    return (status, body, headers.get("Content-Type", ""), headers.get("Docker-Content-Digest", ""))
+
+
+# Copy a Manifest (and the Manifests it references) from Source to Destination
+def copy(source: str,
+         destination: str
+         ) -> int:
+
+    status, body, media_type, digest = get_manifest(source)
+
+    if status != 200:
+        print(f"Error: reading {source} failed with HTTP {status}", file=sys.stderr)
+        return 1
+
+    source_registry, source_repository, _ = parse_reference(source)
+    destination_registry, destination_repository, destination_tag = parse_reference(destination)
+
+    # Copy the Manifest of each Platform first
+    if media_type in INDEX_MEDIA_TYPES:
+        for child in json.loads(body).get("manifests", []):
+            result = copy(f"{source_registry}/{source_repository}@{child['digest']}", f"{destination_registry}/{destination_repository}@{child['digest']}")
+
+            if result != 0:
+                return result
+
+    status, _, _ = request("PUT", destination_registry, f"/v2/{destination_repository}/manifests/{destination_tag}", body=body, headers={"Content-Type": media_type})
+
+    if status != 201:
+        print(f"Error: writing {destination} failed with HTTP {status}", file=sys.stderr)
+        return 1
+
+    # Return Result
+    return 0
+
+
+# Run the Command of a Tool
+def run(tool: str,
+        args: list[str]
+        ) -> int:
+
+    # Ignore Options
+    positional = [arg for arg in args if not arg.startswith("-")]
+
+    if tool == "regctl" and positional[0:2] == ["manifest", "head"]:
+        status, _, _, digest = get_manifest(positional[2], method="HEAD")
+
+        if status != 200:
+            print(f"failed to request manifest head {positional[2]}: HTTP {status}", file=sys.stderr)
+            return 1
+
+        print(digest)
+        return 0
+
+    if tool == "regctl" and positional[0:2] == ["manifest", "get"]:
+        status, body, _, _ = get_manifest(positional[-1])
+
+        if status != 200:
+            print(f"failed to get manifest {positional[-1]}: HTTP {status}", file=sys.stderr)
+            return 1
+
+        sys.stdout.write(body.decode())
+        return 0
+
+    if tool == "regctl" and positional[0:2] == ["manifest", "put"]:
+        registry, repository, tag = parse_reference(positional[-1])
+        status, _, _ = request("PUT", registry, f"/v2/{repository}/manifests/{tag}", body=sys.stdin.buffer.read(), headers={"Content-Type": args[args.index("--content-type") + 1]})
+
+        if status != 201:
+            print(f"failed to put manifest {positional[-1]}: HTTP {status}", file=sys.stderr)
+            return 1
+
+        return 0
+
+    if tool == "regctl" and positional[0:2] in [["repo", "ls"], ["tag", "ls"]]:
+        # Options taking a Value ("--limit 1000 --last alpine")
+        options = {args[index - 1]: arg for index, arg in enumerate(args) if index > 0 and args[index - 1] in ["--limit", "--last"]}
+        reference = [arg for index, arg in enumerate(args) if not arg.startswith("-") and args[index - 1] not in ["--limit", "--last"]][2]
+
+        if positional[0] == "repo":
+            (registry, path, key) = (reference, "/v2/_catalog", "repositories")
+        else:
+            registry, _, repository = reference.partition("/")
+            (path, key) = (f"/v2/{repository}/tags/list", "tags")
+
+        query = {"n": options.get("--limit", "100")}
+        if "--last" in options:
+            query["last"] = options["--last"]
+
+        status, _, body = request("GET", registry, path + "?" + urllib.parse.urlencode(query))
+
+        if status != 200:
+            print(f"failed to list {reference}: HTTP {status}", file=sys.stderr)
+            return 1
+
+        print(json.dumps({key: json.loads(body).get(key) or []}))
+        return 0
+
+    if tool == "regctl" and positional[0:2] == ["image", "copy"]:
+        return copy(positional[2], positional[3])
+
+    if tool == "crane" and positional[0:1] == ["copy"]:
+        return copy(positional[1], positional[2])
+
+    if tool == "skopeo" and positional[0:1] == ["copy"]:
+        return copy(positional[1], positional[2])
+
+    if tool == "skopeo" and positional[0:1] == ["sync"]:
+        # Options taking a Value ("--src docker --dest docker")
+        positional = [arg for index, arg in enumerate(args) if not arg.startswith("-") and args[index - 1] not in ["--src", "--dest"]]
+
+        # Without --scoped, the Image is stored below the Destination using the last Component of its Name
+        return copy(positional[1], positional[2].rstrip("/") + "/" + positional[1].rsplit("/", 1)[-1])
+
+    # Other Commands (e.g. "version") succeed without Output
+    return 0
+
+
+# Main Method (execution as a Script)
+if __name__ == "__main__":
+    # Get Tool
+    tool = os.path.basename(sys.argv[0]).removesuffix(".py")
+
+    # Record Invocation (a single Write in Append Mode, so that parallel Processes do not mix their Lines)
+    if os.environ.get("STUB_TOOL_LOG"):
+        with open(os.environ["STUB_TOOL_LOG"], "a") as log_handle:
+            log_handle.write(" ".join([tool] + sys.argv[1:]) + "\n")
+
+    # Simulate the Startup of the real Tool
+    if float(os.environ.get("STUB_TOOL_DELAY", "0")) > 0:
+        time.sleep(float(os.environ["STUB_TOOL_DELAY"]))
+
+    sys.exit(run(tool, sys.argv[1:]))
@@ -0,0 +1,66 @@
+# Threading Library
+import threading
+
+# Time Library
+import time
+
+# Typing
+from typing import Any, Callable
+
+
+class CheckpointWriter:
+    # Class Constructor
+    def __init__(self,
+                 flush_function: Callable[[list[dict[str, Any]]], None],
+                 batch_size: int = 50,
+                 interval: float = 10
+                 ) -> None:
+
+        # Function persisting a Batch of Items
+        self.flush_function = flush_function
+
+        # Flush after this many Items ...
+        self.batch_size = max(1, batch_size)
+
+        # ... or after this many Seconds, whatever comes first
+        self.interval = interval
+
+        # Items waiting to be persisted (keyed by Source Reference, only the latest Version is kept)
+        self.pending = dict()
+
+        # Time of the last Flush
+        self.last_flush = time.monotonic()
+
+        # Lock protecting the pending Items
+        self.lock = threading.Lock()
+
+        # Number of persisted Items
+        self.written = 0
+
+    # Register an Item that has been updated
+    def add(self,
+            item: dict[str, Any]
+            ) -> None:
+
+        with self.lock:
+            # Store a Copy, so that later in-Memory Changes do not affect the Batch
+            self.pending[item["SourceFullArtifactReference"]] = item.copy()
+
+            # Check if a Flush is due
+            due = len(self.pending) >= self.batch_size or time.monotonic() - self.last_flush >= self.interval
+
+        if due:
+            self.flush()
+
+    # Persist all pending Items
+    def flush(self) -> None:
+        with self.lock:
+            # Get pending Items
+            items = list(self.pending.values())
+            self.pending = dict()
+            self.last_flush = time.monotonic()
+
+            if len(items) > 0:
+                # Persist while holding the Lock, so that Batches are written in Order
+                self.flush_function(items)
+                self.written += len(items)
@@ -0,0 +1,130 @@
+# Concurrent Futures Library
+from concurrent.futures import ThreadPoolExecutor, Future
+
+# Threading Library
+import threading
+
+# Typing
+from typing import Any, Callable
+
+
+# Parse Per-Registry Limits in the Form "docker.io=4,ghcr.io=16"
+def parse_limits(text: str | None) -> dict[str, int]:
+    # Declare Dictionary
+    limits = dict()
+
+    if text is None:
+        return limits
+
+    for item in str(text).split(","):
+        # Skip empty Items
+        if item.strip() == "":
+            continue
+
+        # Separate Registry from Limit
+        registry, _, limit = item.partition("=")
+
+        try:
+            limits[registry.strip()] = int(limit)
+        except ValueError:
+            # Display Warning
+            print(f"[WARNING] Invalid Concurrency Limit {item.strip()}. Ignoring Entry.")
+
+    # Return Result
+    return limits
+
+
+# Get the Registry Part of a Fully Qualified Artifact Reference
+def get_registry(full_artifact_reference: str) -> str:
+    return full_artifact_reference.split("/", 1)[0]
+
+
+class RegistryExecutor:
+    # Class Constructor
+    def __init__(self,
+                 global_limit: int,
+                 registry_limits: dict[str, int] | None = None,
+                 default_limit: int = 8,
+                 name: str = "worker"
+                 ) -> None:
+
+        # Maximum Number of Tasks running at the same Time across all Registries
+        self.global_limit = max(1, int(global_limit))
+        self.global_semaphore = threading.BoundedSemaphore(self.global_limit)
+
+        # Maximum Number of Tasks running at the same Time for each Registry
+        self.registry_limits = registry_limits if registry_limits is not None else dict()
+        self.default_limit = max(1, int(default_limit))
+
+        # Prefix for the Thread Names
+        self.name = name
+
+        # One Executor per Registry, so that a slow Registry does not block the Queue of the others
+        self.executors = dict()
+        self.executors_lock = threading.Lock()
+
+    # Enter Context
+    def __enter__(self):
+        return self
+
+    # Exit Context
+    # If the Block was interrupted (e.g. SIGTERM), Tasks that did not start yet are cancelled
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown(wait=exc_type is None, cancel_futures=exc_type is not None)
+
+    # Get Limit for a given Registry
+    def get_limit(self,
+                  registry: str
+                  ) -> int:
+
+        return max(1, min(self.global_limit, self.registry_limits.get(registry, self.default_limit)))
+
+    # Get (or create) the Executor associated with a Registry
+    def get_executor(self,
+                     registry: str
+                     ) -> ThreadPoolExecutor:
+
+        with self.executors_lock:
+            executor = self.executors.get(registry)
+
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=self.get_limit(registry),
+                                              thread_name_prefix=f"{self.name}-{registry}"
+                                              )
+                self.executors[registry] = executor
+
+        # Return Value
+        return executor
+
+    # Run Task while holding the Global Semaphore
+    def run_task(self,
+                 function: Callable[..., Any],
+                 *args,
+                 **kwargs
+                 ) -> Any:
+
+        with self.global_semaphore:
+            return function(*args, **kwargs)
+
+    # Submit a Task for a given Registry
+    def submit(self,
+               registry: str,
+               function: Callable[..., Any],
+               *args,
+               **kwargs
+               ) -> Future:
+
+        return self.get_executor(registry).submit(self.run_task, function, *args, **kwargs)
+
+    # Shutdown all Executors
+    def shutdown(self,
+                 wait: bool = True,
+                 cancel_futures: bool = False
+                 ) -> None:
+
+        with self.executors_lock:
+            executors = list(self.executors.values())
+            self.executors = dict()
+
+        for executor in executors:
+            executor.shutdown(wait=wait, cancel_futures=cancel_futures)
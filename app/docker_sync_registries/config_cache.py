@@ -0,0 +1,130 @@
+# OS Library
+import os
+
+# Hash Library
+import hashlib
+
+# JSON Module
+import json
+
+# Typing
+from typing import Any
+
+# Format Version of the Cache File
+# Must be increased whenever the normalised Image Format changes, so that old Caches are discarded
+CONFIG_CACHE_VERSION = 3
+
+
+class ConfigCache:
+    # Class Constructor
+    def __init__(self,
+                 filepath: str
+                 ) -> None:
+
+        # Path to the Cache File
+        self.filepath = filepath
+
+        # Cached Entries keyed by Configuration File Path
+        # Each Entry contains MTime, Size, Hash and the normalised Images defined in the File
+        self.files = dict()
+
+        # Whether the Cache must be written back
+        self.dirty = False
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    # Load Cache File
+    def load(self) -> None:
+        if not os.path.exists(self.filepath):
+            return
+
+        try:
+            with open(self.filepath, "r", encoding="UTF-8") as cache_file_handle:
+                data = json.load(cache_file_handle)
+
+            if data.get("Version") == CONFIG_CACHE_VERSION:
+                self.files = data.get("Files", dict())
+        except Exception as e:
+            # Display Warning & Error Message
+            print(f"[WARNING] Loading Configuration Cache {self.filepath} failed! All Configuration Files will be parsed again.")
+            print(e)
+
+    # Save Cache File (only if it changed)
+    def save(self) -> None:
+        if not self.dirty:
+            return
+
+        try:
+            # Write to a temporary File and replace the Cache atomically
+            with open(self.filepath + ".tmp", "w", encoding="UTF-8") as cache_file_handle:
+                json.dump(dict(Version=CONFIG_CACHE_VERSION, Files=self.files), cache_file_handle)
+
+            os.replace(self.filepath + ".tmp", self.filepath)
+
+            self.dirty = False
+        except OSError as e:
+            # Display Warning & Error Message
+            print(f"[WARNING] Saving Configuration Cache {self.filepath} failed!")
+            print(e)
+
+    # Lookup the Images defined in a Configuration File
+    # Returns (Images or None if the File must be parsed, File Contents if they were read, Hash of the Contents)
+    def lookup(self,
+               filepath: str
+               ) -> tuple[list[dict[str, Any]] | None, bytes | None, str | None]:
+
+        # Get File Information
+        stat = os.stat(filepath)
+        entry = self.files.get(filepath)
+
+        if entry is not None and entry["MTime"] == stat.st_mtime_ns and entry["Size"] == stat.st_size:
+            # File did not change since it was cached
+            self.hits += 1
+            return (entry["Images"], None, entry["Hash"])
+
+        # Read Contents and compute Hash
+        with open(filepath, "rb") as config_file_handle:
+            contents = config_file_handle.read()
+
+        content_hash = hashlib.sha256(contents).hexdigest()
+
+        if entry is not None and entry["Hash"] == content_hash:
+            # File was touched but not modified
+            self.hits += 1
+            entry["MTime"] = stat.st_mtime_ns
+            entry["Size"] = stat.st_size
+            self.dirty = True
+            return (entry["Images"], contents, content_hash)
+
+        # File must be parsed
+        self.misses += 1
+        return (None, contents, content_hash)
+
+    # Store the Images defined in a Configuration File
+    def store(self,
+              filepath: str,
+              content_hash: str,
+              images: list[dict[str, Any]]
+              ) -> None:
+
+        # Get File Information
+        stat = os.stat(filepath)
+
+        self.files[filepath] = dict(MTime=stat.st_mtime_ns,
+                                    Size=stat.st_size,
+                                    Hash=content_hash,
+                                    Images=images
+                                    )
+        self.dirty = True
+
+    # Remove Entries of Files that do not exist anymore
+    def prune(self,
+              filepaths: list[str]
+              ) -> None:
+
+        for filepath in list(self.files.keys()):
+            if filepath not in filepaths:
+                del self.files[filepath]
+                self.dirty = True
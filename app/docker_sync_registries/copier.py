@@ -0,0 +1,361 @@
+# Python Module to perform HTTP Requests
+import requests
+
+# JSON Module
+import json
+
+# Threading Library
+import threading
+
+# Subprocess Python Module (only used to build a compatible Result Object)
+import subprocess
+
+# Typing
+from typing import Any, Callable
+
+# Native Registry Client
+from docker_sync_registries.registry import RegistryClient, parse_reference, format_reference
+
+# Useful Material
+# https://github.com/opencontainers/distribution-spec/blob/main/spec.md#mounting-a-blob-from-another-repository
+
+# Media Types of Manifest Lists / Image Indexes (pointing to one Manifest per Platform)
+INDEX_MEDIA_TYPES = [
+                     "application/vnd.oci.image.index.v1+json",
+                     "application/vnd.docker.distribution.manifest.list.v2+json",
+]
+
+# Size of the Chunks streamed from the Source to the Destination
+BLOB_CHUNK_SIZE = 1024 * 1024
+
+# Maximum Number of Repositories remembered for each Blob (a single one is enough to mount it)
+BLOB_INDEX_MAX_REPOSITORIES = 4
+
+
+class CopyError(Exception):
+    pass
+
+
+class BlobStream:
+    # Class Constructor
+    def __init__(self,
+                 open_function: Callable[[], requests.Response],
+                 size: int
+                 ) -> None:
+
+        # Function returning a streamed Response of the Source Blob
+        self.open_function = open_function
+
+        # Size of the Blob (so that requests sends a Content-Length Header instead of a chunked Upload)
+        self.size = size
+
+    # Get Size
+    def __len__(self) -> int:
+        return self.size
+
+    # Stream the Blob (the Source is opened again if the Upload has to be retried)
+    def __iter__(self):
+        response = self.open_function()
+
+        try:
+            if not response.ok:
+                raise CopyError(f"HTTP {response.status_code} {response.reason} for {response.url}")
+
+            yield from response.iter_content(BLOB_CHUNK_SIZE)
+        finally:
+            response.close()
+
+
+class BlobIndex:
+    # Class Constructor
+    def __init__(self) -> None:
+        # Repositories of the Destination Registry known to contain each Blob (keyed by Digest)
+        self.locations = dict()
+
+        # Whether the Index changed since it was loaded
+        self.dirty = False
+
+        # Lock protecting the Index
+        self.lock = threading.Lock()
+
+        # One Lock per Blob, so that a Blob shared by Images copied at the same Time is uploaded only once
+        self.blob_locks = dict()
+
+    # Load Index
+    def load(self,
+             data: dict[str, list[str]]
+             ) -> None:
+
+        with self.lock:
+            self.locations = {digest: list(repositories) for digest, repositories in data.items()}
+            self.dirty = False
+
+    # Dump Index
+    def dump(self) -> dict[str, list[str]]:
+        with self.lock:
+            return {digest: list(repositories) for digest, repositories in self.locations.items()}
+
+    # Get Repositories known to contain a Blob
+    def get(self,
+            digest: str
+            ) -> list[str]:
+
+        with self.lock:
+            return list(self.locations.get(digest, []))
+
+    # Register a Repository containing a Blob
+    def add(self,
+            digest: str,
+            repository: str
+            ) -> None:
+
+        with self.lock:
+            repositories = self.locations.get(digest, [])
+
+            if len(repositories) > 0 and repositories[0] == repository:
+                return
+
+            # Most recently seen Repository first
+            self.locations[digest] = ([repository] + [item for item in repositories if item != repository])[0:BLOB_INDEX_MAX_REPOSITORIES]
+            self.dirty = True
+
+    # Forget a Repository that does not contain a Blob anymore
+    def remove(self,
+               digest: str,
+               repository: str
+               ) -> None:
+
+        with self.lock:
+            repositories = self.locations.get(digest, [])
+
+            if repository in repositories:
+                repositories.remove(repository)
+                self.dirty = True
+
+            if len(repositories) == 0:
+                self.locations.pop(digest, None)
+
+    # Get the Lock associated with a Blob
+    def get_blob_lock(self,
+                      digest: str
+                      ) -> threading.Lock:
+
+        with self.lock:
+            return self.blob_locks.setdefault(digest, threading.Lock())
+
+
+class ImageCopier:
+    # Class Constructor
+    def __init__(self,
+                 client: RegistryClient,
+                 blob_index: BlobIndex | None = None
+                 ) -> None:
+
+        # Native Registry Client
+        self.client = client
+
+        # Location of the Blobs already stored in the Destination Registry
+        self.blob_index = blob_index if blob_index is not None else BlobIndex()
+
+        # Statistics
+        self.stats = dict(Existing=0, Mounted=0, Uploaded=0, BytesUploaded=0)
+        self.stats_lock = threading.Lock()
+
+    # Update Statistics
+    def count(self,
+              key: str,
+              value: int = 1
+              ) -> None:
+
+        with self.stats_lock:
+            self.stats[key] += value
+
+    # Copy an Image (all Platforms) preserving the Manifest Digests
+    # Returns a Result compatible with the command line Tools
+    def copy_image(self,
+                   source_full_artifact_reference: str,
+                   destination_full_artifact_reference: str
+                   ) -> subprocess.CompletedProcess:
+
+        # Description of the Operation (used as "args" of the Result)
+        args = ["COPY", source_full_artifact_reference, destination_full_artifact_reference]
+
+        # Split References
+        source_registry, source_repository, source_reference = parse_reference(source_full_artifact_reference)
+        destination_registry, destination_repository, destination_reference = parse_reference(destination_full_artifact_reference)
+
+        try:
+            digest = self.copy_manifest(source_registry,
+                                        source_repository,
+                                        source_reference,
+                                        destination_registry,
+                                        destination_repository,
+                                        destination_reference
+                                        )
+
+            result = subprocess.CompletedProcess(args=args,
+                                                 returncode=0,
+                                                 stdout=digest + "\n",
+                                                 stderr=""
+                                                 )
+        except (CopyError, requests.RequestException, ValueError, KeyError) as e:
+            result = subprocess.CompletedProcess(args=args,
+                                                 returncode=1,
+                                                 stdout="",
+                                                 stderr=f"Copy of {source_full_artifact_reference} to {destination_full_artifact_reference} failed: {e}"
+                                                 )
+
+        # Return Result
+        return result
+
+    # Copy a Manifest (and everything it references) and return its Digest
+    def copy_manifest(self,
+                      source_registry: str,
+                      source_repository: str,
+                      source_reference: str,
+                      destination_registry: str,
+                      destination_repository: str,
+                      destination_reference: str
+                      ) -> str:
+
+        # Get Manifest exactly as stored in the Source Registry
+        response = self.client.get_manifest(format_reference(source_registry, source_repository, source_reference))
+
+        if not response.ok:
+            raise CopyError(f"HTTP {response.status_code} {response.reason} for {response.url}")
+
+        body = response.content
+        manifest = json.loads(body)
+        media_type = response.headers.get("Content-Type", "").split(";")[0].strip() or manifest.get("mediaType", "")
+
+        if media_type in INDEX_MEDIA_TYPES:
+            # Copy the Manifest of each Platform first
+            for child in manifest.get("manifests", []):
+                self.copy_manifest(source_registry,
+                                   source_repository,
+                                   child["digest"],
+                                   destination_registry,
+                                   destination_repository,
+                                   child["digest"]
+                                   )
+        else:
+            # Copy Configuration and Layers
+            for blob in [manifest["config"]] + manifest.get("layers", []):
+                # Non-distributable Layers are not stored in the Registry
+                if len(blob.get("urls", [])) > 0:
+                    continue
+
+                self.copy_blob(source_registry,
+                               source_repository,
+                               destination_registry,
+                               destination_repository,
+                               blob
+                               )
+
+        # Upload the same Bytes, so that the Digest is preserved
+        response = self.client.put_manifest(format_reference(destination_registry, destination_repository, destination_reference),
+                                            body=body,
+                                            media_type=media_type
+                                            )
+
+        if not response.ok:
+            raise CopyError(f"HTTP {response.status_code} {response.reason} for {response.url}")
+
+        # Return Digest
+        return response.headers.get("Docker-Content-Digest", "")
+
+    # Copy a Blob, unless the Destination Registry already stores it somewhere
+    def copy_blob(self,
+                  source_registry: str,
+                  source_repository: str,
+                  destination_registry: str,
+                  destination_repository: str,
+                  blob: dict[str, Any]
+                  ) -> None:
+
+        # Get Digest
+        digest = blob["digest"]
+
+        # Scope needed to upload to the Destination Repository
+        push_scope = f"repository:{destination_repository}:pull,push"
+
+        with self.blob_index.get_blob_lock(digest):
+            # Check if the Blob already exists in the Destination Repository
+            response = self.client.request("HEAD",
+                                           destination_registry,
+                                           f"/v2/{destination_repository}/blobs/{digest}",
+                                           scope=f"repository:{destination_repository}:pull"
+                                           )
+
+            if response.ok:
+                self.blob_index.add(digest, destination_repository)
+                self.count("Existing")
+                return
+
+            # Repositories of the Destination Registry that might contain the Blob
+            candidates = [repository for repository in self.blob_index.get(digest) if repository != destination_repository]
+            if source_registry == destination_registry and source_repository != destination_repository and source_repository not in candidates:
+                candidates.append(source_repository)
+
+            # Upload Location (if a Mount was refused, the Registry already opened an Upload Session)
+            location = None
+
+            for repository in candidates:
+                # Try to mount the Blob from the other Repository
+                response = self.client.request("POST",
+                                               destination_registry,
+                                               f"/v2/{destination_repository}/blobs/uploads/",
+                                               params={"mount": digest, "from": repository},
+                                               scope=f"{push_scope} repository:{repository}:pull"
+                                               )
+
+                if response.status_code == 201:
+                    self.blob_index.add(digest, destination_repository)
+                    self.count("Mounted")
+                    return
+
+                if response.status_code == 202:
+                    location = response.headers.get("Location")
+                    break
+
+                # Blob is not available there anymore
+                self.blob_index.remove(digest, repository)
+
+            if location is None:
+                # Start Upload
+                response = self.client.request("POST",
+                                               destination_registry,
+                                               f"/v2/{destination_repository}/blobs/uploads/",
+                                               scope=push_scope
+                                               )
+
+                if response.status_code != 202:
+                    raise CopyError(f"HTTP {response.status_code} {response.reason} for {response.url}")
+
+                location = response.headers.get("Location")
+
+            # Stream the Blob from the Source to the Destination (monolithic Upload)
+            stream = BlobStream(open_function=lambda: self.client.request("GET",
+                                                                          source_registry,
+                                                                          f"/v2/{source_repository}/blobs/{digest}",
+                                                                          scope=f"repository:{source_repository}:pull",
+                                                                          stream=True
+                                                                          ),
+                                size=blob["size"]
+                                )
+
+            response = self.client.request("PUT",
+                                           destination_registry,
+                                           location,
+                                           headers={"Content-Type": "application/octet-stream"},
+                                           scope=push_scope,
+                                           params={"digest": digest},
+                                           data=stream
+                                           )
+
+            if response.status_code != 201:
+                raise CopyError(f"HTTP {response.status_code} {response.reason} for {response.url}")
+
+            self.blob_index.add(digest, destination_repository)
+            self.count("Uploaded")
+            self.count("BytesUploaded", blob["size"])
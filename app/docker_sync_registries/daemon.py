@@ -0,0 +1,313 @@
+# Glob Library
+import glob
+
+# Heap Queue Library
+import heapq
+
+# Itertools Library
+import itertools
+
+# OS Library
+import os
+
+# Signal Library
+import signal
+
+# Threading Library
+import threading
+
+# Time Library
+import time
+
+# Typing
+from typing import Any
+
+# Synchronization Application
+from docker_sync_registries.utils import SyncRegistries
+
+
+class SyncDaemon:
+    # Class Constructor
+    def __init__(self,
+                 app: SyncRegistries
+                 ) -> None:
+
+        # Synchronization Application (keeps Configuration, Database and Indexes in Memory)
+        self.app = app
+
+        # Priority Queue of (Next Check Timestamp, Sequence, Source Reference)
+        self.queue = []
+        self.sequence = itertools.count()
+
+        # Set when the Daemon must stop
+        self.stop_event = threading.Event()
+
+        # Whether a Batch is being processed
+        self.busy = False
+
+        # Signature of the Configuration Files (to detect Changes)
+        self.config_signature = None
+        self.last_config_check = 0
+
+        # Time of the last full Save of the Database
+        self.last_save = time.monotonic()
+
+    # Get Signature of the Configuration Files
+    def get_config_signature(self) -> list[tuple[str, int, int]]:
+        # Declare List
+        signature = []
+
+        for filepath in glob.glob(f"{self.app.CONFIG_PATH}/**/*.yml", recursive=True):
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                continue
+
+            signature.append((filepath, stat.st_mtime_ns, stat.st_size))
+
+        # Return Result
+        return sorted(signature)
+
+    # Read (or re-read) the Configuration Files and rebuild the Queue
+    def load_config(self) -> None:
+        # Reset Images
+        self.app.images = []
+        self.app.images_by_source_reference = dict()
+        self.app.images_by_destination_reference = dict()
+
+        # Read All Configuration
+        self.config_signature = self.get_config_signature()
+        with self.app.phase("read_images_config_all"):
+            self.app.read_images_config_all()
+
+            # Update Images based on Database Information
+            self.app.update_images_info()
+
+        # Rebuild Queue
+        self.queue = []
+        now = int(time.time())
+
+        for image in self.app.images:
+            # Get Next Check
+            next_check = self.app.scheduler.get_next_check(image["SourceFullArtifactReference"], image.get("LastCheck"), self.app.get_check_interval(image["SourceFullArtifactReference"], now))
+
+            # Images that are not synchronized are retried right away (as in every Cron Run)
+            if image.get("Status") not in [None, "OK"]:
+                next_check = min(next_check, now)
+
+            self.push(image["SourceFullArtifactReference"], next_check)
+
+        # Info
+        print(f"[INFO] Daemon: {len(self.queue)} Image(s) scheduled")
+
+    # Re-read the Configuration Files if they changed
+    def reload_config_if_changed(self) -> None:
+        if time.monotonic() - self.last_config_check < self.app.config.get("DAEMON_CONFIG_RELOAD_INTERVAL"):
+            return
+
+        self.last_config_check = time.monotonic()
+
+        if self.get_config_signature() != self.config_signature:
+            # Info
+            print("[INFO] Daemon: Configuration Files changed. Reload Configuration.")
+
+            self.load_config()
+        elif self.app.tag_lists.is_expired(int(time.time())):
+            # Info
+            print("[INFO] Daemon: Tag Lists expired. Expand Tag Selectors again.")
+
+            self.load_config()
+
+    # Add an Image to the Queue
+    def push(self,
+             reference: str,
+             next_check: int
+             ) -> None:
+
+        heapq.heappush(self.queue, (next_check, next(self.sequence), reference))
+
+    # Get the Images that are due
+    def pop_due(self,
+                now: int
+                ) -> list[str]:
+
+        # Declare List
+        references = []
+
+        while len(self.queue) > 0 and self.queue[0][0] <= now and len(references) < self.app.config.get("DAEMON_BATCH_SIZE"):
+            _, _, reference = heapq.heappop(self.queue)
+
+            # Skip Images that have been removed from the Configuration
+            if reference in self.app.images_by_source_reference:
+                references.append(reference)
+
+        # Return Result
+        return references
+
+    # Schedule the next Check of an Image after it has been processed
+    def reschedule(self,
+                   item: dict[str, Any],
+                   now: int
+                   ) -> None:
+
+        # Get Next Check
+        next_check = self.app.scheduler.get_next_check(item["SourceFullArtifactReference"], item.get("LastCheck"), self.app.get_check_interval(item["SourceFullArtifactReference"], now))
+
+        # Retry Images that could not be checked or synchronized
+        if item.get("Status") != "OK":
+            next_check = min(next_check, now + self.app.config.get("DAEMON_RETRY_DELAY"))
+
+        # Never schedule in the Past (e.g. Check deferred because of Rate Limits)
+        if next_check <= now:
+            next_check = now + self.app.config.get("DAEMON_RETRY_DELAY")
+
+        self.push(item["SourceFullArtifactReference"], next_check)
+
+    # Check and synchronize a Batch of due Images
+    def process(self,
+                references: list[str]
+                ) -> None:
+
+        # Info
+        print(f"[INFO] Daemon: Processing {len(references)} due Image(s)")
+
+        self.busy = True
+        try:
+            # Scan the due Images
+            images = [self.app.images_by_source_reference[reference] for reference in references]
+            with self.app.phase("scan"):
+                self.app.current = self.app.scan_images_manifest_digest(images, report_load=False, check_all=True)
+
+            # Count Images per Status before the Synchronization
+            self.app.update_status_metrics("scan_results", self.app.current)
+
+            # Synchronize Images based on Manifest Digest Comparison
+            with self.app.phase("sync"):
+                self.app.sync_images_based_on_manifest_digest()
+
+            # Keep the Results in Memory
+            self.app.merge_results(self.app.current)
+
+            # Save Rate Limit Budget
+            self.app.save_ratelimit()
+        finally:
+            self.busy = False
+
+        # Schedule next Checks
+        now = int(time.time())
+        for item in self.app.current:
+            self.reschedule(item, now)
+
+        # Export Metrics (Status of all configured Images)
+        self.app.update_metrics(self.app.images)
+        self.app.write_metrics()
+
+    # Save the Database
+    def save(self) -> None:
+        with self.app.phase("save_database"):
+            if self.app.config.get("DATABASE_BACKEND") == "sqlite":
+                # Checkpoints already updated every processed Image in Place
+                self.app.save_ratelimit()
+            else:
+                # Rewrite the JSON Database (and drop the Journal)
+                self.app.current = list(self.app.database)
+                self.app.save_database()
+
+        self.last_save = time.monotonic()
+
+    # Get Time to sleep until the next Image is due
+    def get_sleep_time(self) -> float:
+        # Wake up regularly to check the Configuration Files
+        sleep_time = self.app.config.get("DAEMON_CONFIG_RELOAD_INTERVAL")
+
+        if len(self.queue) > 0:
+            # Continue right away if the previous Batch was limited by DAEMON_BATCH_SIZE
+            if self.queue[0][0] <= time.time():
+                return 0
+
+            sleep_time = min(sleep_time, self.queue[0][0] - time.time())
+
+        # Group Images that become due at nearly the same Time into one Batch
+        return max(sleep_time, self.app.config.get("DAEMON_MIN_SLEEP"))
+
+    # Handle SIGTERM
+    def handle_sigterm(self,
+                       signum: int,
+                       frame: Any
+                       ) -> None:
+
+        # Stop the Loop
+        self.stop_event.set()
+
+        if self.busy:
+            # Interrupt the current Batch (completed Images are persisted by the Checkpoints)
+            self.app.handle_sigterm(signum, frame)
+        else:
+            # Echo
+            print("[INFO] Received SIGTERM. Stopping Daemon.")
+
+    # Run Daemon
+    def run(self) -> None:
+        # Only allow run if there is no Lock File set (possibly after waiting for another Run to complete) !
+        if not self.app.wait_for_lock():
+            return
+
+        # Set Lock (held as long as the Daemon is running, so that Cron Runs are skipped)
+        self.app.set_lock()
+
+        # Exit gracefully when the Container is stopped
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.handle_sigterm)
+
+        # Serve Metrics
+        if self.app.config.get("METRICS_PORT") > 0:
+            self.app.metrics.serve(self.app.config.get("METRICS_PORT"))
+
+        # Start cProfile (if configured)
+        self.app.start_profiling()
+
+        try:
+            # Load Database Status
+            with self.app.phase("load_database"):
+                self.app.load_database()
+
+            # Read All Configuration
+            self.load_config()
+            self.last_config_check = time.monotonic()
+
+            while not self.stop_event.is_set():
+                # Pick up Changes to the Configuration Files
+                self.reload_config_if_changed()
+
+                # Process due Images
+                references = self.pop_due(int(time.time()))
+                if len(references) > 0:
+                    self.process(references)
+
+                # Compact the JSON Database from Time to Time (SQLite is updated in Place by the Checkpoints)
+                if self.app.config.get("DATABASE_BACKEND") != "sqlite" and time.monotonic() - self.last_save >= self.app.config.get("DAEMON_SAVE_INTERVAL"):
+                    self.save()
+
+                # Sleep until the next Image is due (or until SIGTERM is received)
+                self.stop_event.wait(self.get_sleep_time())
+        finally:
+            # Persist Checkpoints of completed Images
+            self.app.checkpoint.flush()
+
+            # Keep the Results of an interrupted Batch
+            self.app.merge_results(self.app.current)
+
+            # Save Database Status
+            self.save()
+
+            # Close Connections and Worker Sessions
+            self.app.close()
+
+            # Stop serving Metrics
+            self.app.metrics.close()
+
+            # Write Trace & cProfile Statistics (if configured)
+            self.app.stop_profiling()
+
+            # Clear Lock
+            self.app.clear_lock()
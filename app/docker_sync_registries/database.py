@@ -0,0 +1,316 @@
+# SQLite Library
+import sqlite3
+
+# OS Library
+import os
+
+# Threading Library
+import threading
+
+# JSON Module
+import json
+
+# Typing
+from typing import Any
+
+# Columns stored explicitly in the Images Table (all other Fields are stored as JSON in the "Data" Column)
+IMAGE_COLUMNS = [
+                 "SourceFullArtifactReference",
+                 "DestinationFullArtifactReference",
+                 "SourceShortArtifactReference",
+                 "Status",
+                 "SourceHash",
+                 "DestinationHash",
+                 "LastCheck",
+                 "LastUpdate",
+]
+
+# Database Schema
+SCHEMA = [
+          """CREATE TABLE IF NOT EXISTS images (
+                 SourceFullArtifactReference TEXT PRIMARY KEY,
+                 DestinationFullArtifactReference TEXT,
+                 SourceShortArtifactReference TEXT,
+                 Status TEXT,
+                 SourceHash TEXT,
+                 DestinationHash TEXT,
+                 LastCheck INTEGER,
+                 LastUpdate INTEGER,
+                 Data TEXT
+             )""",
+          "CREATE INDEX IF NOT EXISTS images_by_destination ON images (DestinationFullArtifactReference)",
+          """CREATE TABLE IF NOT EXISTS state (
+                 Key TEXT PRIMARY KEY,
+                 Value TEXT
+             )""",
+]
+
+
+# Replay the Checkpoints of an interrupted Run (one JSON Item per Line) on top of the Items of a Database
+# Items are replaced or appended by Source Reference
+def replay_journal(data: list[dict[str, Any]],
+                   journal_filepath: str
+                   ) -> list[dict[str, Any]]:
+
+    # Index Items by Source Reference
+    positions = {item.get("SourceFullArtifactReference"): position for position, item in enumerate(data)}
+
+    with open(journal_filepath, "r", encoding="UTF-8") as journal_file_handle:
+        for line in journal_file_handle:
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                # Last Line might be incomplete if the Process was killed while writing it
+                continue
+
+            if not isinstance(item, dict) or item.get("SourceFullArtifactReference") is None:
+                continue
+
+            # Replace or Append Item
+            position = positions.get(item["SourceFullArtifactReference"])
+            if position is None:
+                positions[item["SourceFullArtifactReference"]] = len(data)
+                data.append(item)
+            else:
+                data[position] = item
+
+    # Return Result
+    return data
+
+
+class StateStore:
+    # Class Constructor
+    def __init__(self,
+                 filepath: str
+                 ) -> None:
+
+        # Path to the SQLite Database File
+        self.filepath = filepath
+
+        # Connection is shared by all Threads and protected by a Lock
+        self.lock = threading.RLock()
+        self.connection = sqlite3.connect(filepath,
+                                          timeout=30,
+                                          check_same_thread=False,
+                                          isolation_level=None
+                                          )
+        self.connection.row_factory = sqlite3.Row
+
+        with self.lock:
+            # Write-Ahead Log: a Crash can never leave a half-written Database behind
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+
+            # Create Schema
+            for statement in SCHEMA:
+                self.connection.execute(statement)
+
+    # Close Database
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+    # Convert a Database Row into an Image Dictionary
+    def row_to_image(self,
+                     row: sqlite3.Row
+                     ) -> dict[str, Any]:
+
+        # Start with the additional Fields
+        image = json.loads(row["Data"]) if row["Data"] else dict()
+
+        # Add explicit Columns
+        for column in IMAGE_COLUMNS:
+            image[column] = row[column]
+
+        # Return Result
+        return image
+
+    # Convert an Image Dictionary into Database Parameters
+    def image_to_row(self,
+                     image: dict[str, Any]
+                     ) -> tuple:
+
+        # Additional Fields (Index is only meaningful in Memory)
+        data = {key: value for key, value in image.items() if key not in IMAGE_COLUMNS and key != "Index"}
+
+        # Return Result
+        return tuple(image.get(column) for column in IMAGE_COLUMNS) + (json.dumps(data),)
+
+    # Count Images
+    def count(self) -> int:
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM images").fetchone()[0]
+
+    # Load all Images
+    def load_all(self) -> list[dict[str, Any]]:
+        with self.lock:
+            rows = self.connection.execute("SELECT * FROM images ORDER BY rowid").fetchall()
+
+        # Return Result
+        return [self.row_to_image(row) for row in rows]
+
+    # Get Image by Source Reference
+    def get_by_source(self,
+                      source_full_artifact_reference: str
+                      ) -> dict[str, Any] | None:
+
+        with self.lock:
+            row = self.connection.execute("SELECT * FROM images WHERE SourceFullArtifactReference = ?",
+                                          (source_full_artifact_reference,)
+                                          ).fetchone()
+
+        # Return Result
+        return self.row_to_image(row) if row is not None else None
+
+    # Get Image by Destination Reference
+    def get_by_destination(self,
+                           destination_full_artifact_reference: str
+                           ) -> dict[str, Any] | None:
+
+        with self.lock:
+            row = self.connection.execute("SELECT * FROM images WHERE DestinationFullArtifactReference = ?",
+                                          (destination_full_artifact_reference,)
+                                          ).fetchone()
+
+        # Return Result
+        return self.row_to_image(row) if row is not None else None
+
+    # Insert or Update Images (one Transaction)
+    def upsert(self,
+               images: list[dict[str, Any]]
+               ) -> None:
+
+        # Build Statement
+        columns = IMAGE_COLUMNS + ["Data"]
+        statement = (f"INSERT INTO images ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)}) "
+                     f"ON CONFLICT (SourceFullArtifactReference) DO UPDATE SET "
+                     f"{', '.join(f'{column} = excluded.{column}' for column in columns[1:])}")
+
+        # Convert Images
+        rows = [self.image_to_row(image) for image in images]
+
+        with self.lock:
+            self.connection.execute("BEGIN")
+            try:
+                self.connection.executemany(statement, rows)
+                self.connection.execute("COMMIT")
+            except Exception:
+                self.connection.execute("ROLLBACK")
+                raise
+
+    # Delete the Images that are not configured anymore
+    # Returns the Number of deleted Images
+    def prune(self,
+              source_full_artifact_references: set[str]
+              ) -> int:
+
+        with self.lock:
+            rows = self.connection.execute("SELECT SourceFullArtifactReference FROM images").fetchall()
+            removed = [(row["SourceFullArtifactReference"],) for row in rows if row["SourceFullArtifactReference"] not in source_full_artifact_references]
+
+            if len(removed) > 0:
+                self.connection.execute("BEGIN")
+                try:
+                    self.connection.executemany("DELETE FROM images WHERE SourceFullArtifactReference = ?", removed)
+                    self.connection.execute("COMMIT")
+                except Exception:
+                    self.connection.execute("ROLLBACK")
+                    raise
+
+        # Return Result
+        return len(removed)
+
+    # Read a legacy JSON File
+    # A truncated or corrupt File is renamed (so that it is not read again) and None is returned
+    def read_legacy_json(self,
+                         filepath: str
+                         ) -> Any:
+
+        try:
+            with open(filepath, "r", encoding="UTF-8") as file_handle:
+                return json.load(file_handle)
+        except (json.JSONDecodeError, OSError) as e:
+            # Display Warning & Error Message
+            print(f"[WARNING] Loading legacy File {filepath} failed! Keep it as {filepath}.corrupt and continue without it.")
+            print(e)
+
+            try:
+                os.replace(filepath, filepath + ".corrupt")
+            except OSError:
+                pass
+
+            return None
+
+    # Get State Value (JSON)
+    def get_state(self,
+                  key: str,
+                  default_value: Any | None = None
+                  ) -> Any:
+
+        with self.lock:
+            row = self.connection.execute("SELECT Value FROM state WHERE Key = ?", (key,)).fetchone()
+
+        # Return Result
+        return json.loads(row["Value"]) if row is not None else default_value
+
+    # Set State Value (JSON)
+    def set_state(self,
+                  key: str,
+                  value: Any
+                  ) -> None:
+
+        with self.lock:
+            self.connection.execute("INSERT INTO state (Key, Value) VALUES (?, ?) ON CONFLICT (Key) DO UPDATE SET Value = excluded.Value",
+                                    (key, json.dumps(value))
+                                    )
+
+    # One-Time Migration from the legacy JSON Database
+    # Checkpoints of an interrupted Run still pending in the Journal are replayed first
+    # Returns the Number of migrated Images
+    def migrate_from_json(self,
+                          database_filepath: str,
+                          ratelimit_filepath: str | None = None,
+                          journal_filepath: str | None = None
+                          ) -> int:
+
+        # Check if there is anything to migrate
+        has_journal = journal_filepath is not None and os.path.exists(journal_filepath)
+
+        if not (os.path.exists(database_filepath) or has_journal) or self.count() > 0:
+            return 0
+
+        # Read legacy Database (start with an empty Store if it cannot be read)
+        data = self.read_legacy_json(database_filepath) if os.path.exists(database_filepath) else []
+
+        if not isinstance(data, list):
+            data = []
+
+        # Replay Checkpoints
+        if has_journal:
+            try:
+                data = replay_journal([item for item in data if isinstance(item, dict)], journal_filepath)
+            except OSError as e:
+                # Display Warning & Error Message
+                print(f"[WARNING] Loading Checkpoints from {journal_filepath} failed!")
+                print(e)
+
+        # Store Images
+        self.upsert([item for item in data if isinstance(item, dict) and item.get("SourceFullArtifactReference") is not None])
+
+        # Store Rate Limit Budget
+        if ratelimit_filepath is not None and os.path.exists(ratelimit_filepath):
+            ratelimit = self.read_legacy_json(ratelimit_filepath)
+
+            if ratelimit is not None:
+                self.set_state("ratelimit", ratelimit)
+                os.replace(ratelimit_filepath, ratelimit_filepath + ".migrated")
+
+        # Keep legacy Database & Journal as a Backup, but make sure they are not migrated again
+        if os.path.exists(database_filepath):
+            os.replace(database_filepath, database_filepath + ".migrated")
+
+        if has_journal and os.path.exists(journal_filepath):
+            os.replace(journal_filepath, journal_filepath + ".migrated")
+
+        # Return Result
+        return len(data)
@@ -0,0 +1,203 @@
+# Random Number Generator Library
+import random
+
+# Regular Expressions Library
+import re
+
+# Subprocess Python Module (only used for Type Hints)
+import subprocess
+
+# Threading Library
+import threading
+
+# Time Library
+import time
+
+# Typing
+from typing import Any
+
+# Errors reported by the command line Tools that are worth retrying (429, 5xx, Network Errors)
+TRANSIENT_ERROR_PATTERN = re.compile(r"\b(429|5\d\d)\b|toomanyrequests|too many requests|timeout|connection refused|connection reset|dial tcp|temporary failure|unexpected eof", re.IGNORECASE)
+
+# Errors reported when the Image does not exist
+NOT_FOUND_ERROR_PATTERN = re.compile(r"\b404\b|not found|manifest unknown|name unknown", re.IGNORECASE)
+
+
+# Classify the Result of a Manifest Query
+# Returns "ok", "not_found" (the Image does not exist), "transient" (worth retrying) or "error"
+def classify_result(result: subprocess.CompletedProcess) -> str:
+    if result.returncode == 0:
+        return "ok"
+
+    # Native Backend exposes the HTTP Response
+    response = getattr(result, "response", None)
+    if response is not None:
+        if response.status_code == 404:
+            return "not_found"
+
+        if response.status_code == 429 or response.status_code >= 500:
+            return "transient"
+
+        return "error"
+
+    # Command line Tools (and cached Results) only report a Message
+    text = result.stderr or ""
+
+    if NOT_FOUND_ERROR_PATTERN.search(text):
+        return "not_found"
+
+    # Native Backend without Response: Network Error
+    if hasattr(result, "response") or TRANSIENT_ERROR_PATTERN.search(text):
+        return "transient"
+
+    # Return Result
+    return "error"
+
+
+# Get the Delay requested by the Registry (Retry-After Header in Seconds), None if not available
+def get_retry_after(result: subprocess.CompletedProcess) -> float | None:
+    response = getattr(result, "response", None)
+
+    if response is None:
+        return None
+
+    try:
+        return float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+class RegistryHealth:
+    # Class Constructor
+    def __init__(self,
+                 max_retries: int = 2,
+                 backoff_base: float = 1.0,
+                 backoff_max: float = 30.0,
+                 failure_threshold: int = 5,
+                 open_time: int = 3600
+                 ) -> None:
+
+        # Number of Retries of a Request failing with a transient Error
+        self.max_retries = max(0, int(max_retries))
+
+        # Delay before the first Retry, doubled for each further Retry ...
+        self.backoff_base = backoff_base
+
+        # ... up to this many Seconds
+        self.backoff_max = backoff_max
+
+        # The Circuit of a Registry opens after this many consecutive failed Requests (after Retries) ...
+        self.failure_threshold = max(1, int(failure_threshold))
+
+        # ... and stays open for this many Seconds (all Requests to the Registry are skipped)
+        self.open_time = open_time
+
+        # State of each Registry
+        self.stats = dict()
+
+        # Lock protecting the State
+        self.lock = threading.Lock()
+
+    # Get (or create) the State of a Registry (Lock must be held)
+    def get_stats(self,
+                  registry: str
+                  ) -> dict[str, Any]:
+
+        return self.stats.setdefault(registry, dict(Requests=0,
+                                                    Retries=0,
+                                                    Failures=0,
+                                                    Skipped=0,
+                                                    ConsecutiveFailures=0,
+                                                    OpenUntil=0
+                                                    ))
+
+    # Check if Requests to a Registry must be skipped (and count the skipped Request)
+    def is_open(self,
+                registry: str,
+                now: float | None = None
+                ) -> bool:
+
+        if now is None:
+            now = time.time()
+
+        with self.lock:
+            stats = self.get_stats(registry)
+
+            if stats["OpenUntil"] == 0:
+                return False
+
+            if stats["OpenUntil"] <= now:
+                # Let Requests through again (a single Failure opens the Circuit again)
+                stats["OpenUntil"] = 0
+                stats["ConsecutiveFailures"] = self.failure_threshold - 1
+                return False
+
+            stats["Skipped"] += 1
+
+            # Return Value
+            return True
+
+    # Get the Delay before the next Retry
+    def get_backoff(self,
+                    attempt: int,
+                    retry_after: float | None = None
+                    ) -> float:
+
+        # Exponential Backoff with Jitter, so that parallel Workers do not retry at the same Time
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt)) * random.uniform(0.5, 1.0)
+
+        # Honor the Delay requested by the Registry
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.backoff_max))
+
+        # Return Result
+        return delay
+
+    # Check if a Request that failed with a transient Error should be retried
+    def should_retry(self,
+                     attempt: int,
+                     retry_after: float | None = None
+                     ) -> bool:
+
+        # Do not wait longer than backoff_max (e.g. Rate Limit Window of several Hours)
+        if retry_after is not None and retry_after > self.backoff_max:
+            return False
+
+        return attempt < self.max_retries
+
+    # Record a Retry
+    def record_retry(self,
+                     registry: str
+                     ) -> None:
+
+        with self.lock:
+            self.get_stats(registry)["Retries"] += 1
+
+    # Record the final Outcome of a Request (after Retries)
+    def record(self,
+               registry: str,
+               success: bool
+               ) -> None:
+
+        with self.lock:
+            stats = self.get_stats(registry)
+            stats["Requests"] += 1
+
+            if success:
+                stats["ConsecutiveFailures"] = 0
+                return
+
+            stats["Failures"] += 1
+            stats["ConsecutiveFailures"] += 1
+
+            # Open the Circuit
+            if stats["ConsecutiveFailures"] >= self.failure_threshold and stats["OpenUntil"] == 0:
+                stats["OpenUntil"] = time.time() + self.open_time
+
+                # Display Warning
+                print(f"[WARNING] Registry {registry} failed {stats['ConsecutiveFailures']} Requests in a Row. Skip its Images for {self.open_time} Seconds.")
+
+    # Dump Statistics
+    def dump(self) -> dict[str, dict[str, Any]]:
+        with self.lock:
+            return {registry: dict(stats) for registry, stats in self.stats.items()}
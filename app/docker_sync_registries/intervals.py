@@ -0,0 +1,108 @@
+# Regular Expressions Library
+import re
+
+# Typing
+from typing import Any
+
+# Tags that look like they never move (e.g. "v2.10.2", "1.2.3+build.5")
+# "latest", "alpine" or "2.10" are moving Tags, and so are Variants such as "1.25.3-alpine" or "3.12.1-slim" (rebuilt when their Base Image changes)
+IMMUTABLE_TAG_PATTERN = re.compile(r"^v?\d+\.\d+\.\d+(\+[0-9A-Za-z.-]+)?$")
+
+# Tags that are actually Digests (e.g. "sha256-<hex>" as used by Cosign)
+DIGEST_TAG_PATTERN = re.compile(r"^(sha256|sha512)[:-][0-9a-f]{32,}(\.[a-z]+)?$")
+
+# Number of Digest Changes kept per Image
+DIGEST_HISTORY_SIZE = 20
+
+
+# Check if a Tag looks immutable
+def is_immutable_tag(tag: str) -> bool:
+    return bool(IMMUTABLE_TAG_PATTERN.match(tag) or DIGEST_TAG_PATTERN.match(tag))
+
+
+# Record the Source Digest observed by a Check in the History of an Image
+# The History contains the Time of the first Check, the last Digest and the Times at which the Digest changed
+def update_digest_history(history: dict[str, Any] | None,
+                          digest: str | None,
+                          now: int
+                          ) -> dict[str, Any]:
+
+    # Work on a Copy, so that the Database Item is never modified
+    if history:
+        history = dict(history, Changes=list(history.get("Changes", [])))
+    else:
+        history = dict(FirstSeen=now, Digest=None, Changes=[])
+
+    if digest:
+        if history.get("Digest") and history["Digest"] != digest:
+            history["Changes"] = (history["Changes"] + [now])[-DIGEST_HISTORY_SIZE:]
+
+        history["Digest"] = digest
+
+    # Return Result
+    return history
+
+
+class IntervalEstimator:
+    # Class Constructor
+    def __init__(self,
+                 default_interval: int,
+                 min_interval: int,
+                 max_interval: int,
+                 immutable_interval: int,
+                 factor: float,
+                 enabled: bool = True
+                 ) -> None:
+
+        # Interval of Images without History (and of all Images if disabled)
+        self.default_interval = max(1, int(default_interval))
+
+        # Bounds of the Interval of moving Tags
+        self.min_interval = max(1, int(min_interval))
+        self.max_interval = max(self.min_interval, int(max_interval))
+
+        # Interval of Tags that look immutable and never changed
+        self.immutable_interval = max(1, int(immutable_interval))
+
+        # Fraction of the observed Time between two Digest Changes used as Interval
+        self.factor = factor
+
+        # Whether Intervals are adapted
+        self.enabled = enabled
+
+    # Get the Interval between two Checks of an Image
+    def get_interval(self,
+                     tag: str,
+                     history: dict[str, Any] | None,
+                     now: int,
+                     override: int | None = None
+                     ) -> int:
+
+        # Interval configured explicitly in the Configuration File
+        if override:
+            return max(1, int(override))
+
+        if not self.enabled:
+            return self.default_interval
+
+        changes = history.get("Changes", []) if history else []
+
+        # Tags that look immutable keep the long Interval as long as they are never rebuilt
+        if len(changes) == 0 and is_immutable_tag(tag):
+            return self.immutable_interval
+
+        if not history or not history.get("FirstSeen"):
+            return self.default_interval
+
+        if len(changes) == 0:
+            # Never changed: the longer the Image stays stable, the less often it is checked
+            interval = max(self.default_interval, (now - history["FirstSeen"]) * self.factor)
+        elif len(changes) >= DIGEST_HISTORY_SIZE:
+            # Older Changes have been discarded: only use the Period covered by the History
+            interval = (now - changes[0]) / (len(changes) - 1) * self.factor
+        else:
+            # Average Time between two Changes since the first Check
+            interval = (now - history["FirstSeen"]) / len(changes) * self.factor
+
+        # Return Result
+        return int(min(self.max_interval, max(self.min_interval, interval)))
@@ -0,0 +1,137 @@
+# Concurrent Futures Library
+from concurrent.futures import ThreadPoolExecutor
+
+# Collections Library
+from collections import deque
+
+# Typing
+from typing import Callable, Iterable, Iterator
+
+# Native Registry Client
+from docker_sync_registries.registry import RegistryClient
+
+
+class InventoryError(Exception):
+    pass
+
+
+class InventoryWalker:
+    # Class Constructor
+    def __init__(self,
+                 client: RegistryClient,
+                 registry: str,
+                 page_size: int = 1000,
+                 workers: int = 8
+                 ) -> None:
+
+        # Native Registry Client
+        self.client = client
+
+        # Registry to walk
+        self.registry = registry
+
+        # Number of Items requested per Page
+        self.page_size = page_size
+
+        # Maximum Number of Tag Lists fetched at the same Time
+        self.workers = max(1, int(workers))
+
+    # Iterate over all Items of a paginated List (following the "Link" Header)
+    def iter_pages(self,
+                   path: str,
+                   key: str,
+                   scope: str
+                   ) -> Iterator[str]:
+
+        # First Page
+        params = {"n": self.page_size}
+
+        while path is not None:
+            response = self.client.request("GET",
+                                           self.registry,
+                                           path,
+                                           params=params,
+                                           scope=scope
+                                           )
+
+            if response.status_code == 404:
+                # Repository does not exist (anymore)
+                return
+
+            if not response.ok:
+                raise InventoryError(f"HTTP {response.status_code} {response.reason} for {response.url}")
+
+            # Items might be null for empty Repositories
+            yield from (response.json().get(key) or [])
+
+            # Next Page (the Link already contains all Query Parameters)
+            path = response.links.get("next", dict()).get("url")
+            params = None
+
+    # Iterate over all Repositories of the Registry
+    def iter_repositories(self) -> Iterator[str]:
+        return self.iter_pages("/v2/_catalog", "repositories", "registry:catalog:*")
+
+    # Get all Tags of a Repository
+    def get_tags(self,
+                 repository: str
+                 ) -> list[str]:
+
+        return list(self.iter_pages(f"/v2/{repository}/tags/list", "tags", f"repository:{repository}:pull"))
+
+    # Iterate over (Repository, Tags) for all Repositories (or the given ones)
+    # Tag Lists are fetched concurrently, Results are returned in the Order of the Repositories.
+    # Only a bounded Number of Repositories is in Flight, so Memory does not grow with the Size of the Registry.
+    def walk(self,
+             repositories: Iterable[str] | None = None
+             ) -> Iterator[tuple[str, list[str]]]:
+
+        if repositories is None:
+            repositories = self.iter_repositories()
+
+        # Repositories being processed (in Order)
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="inventory") as executor:
+            for repository in repositories:
+                pending.append((repository, executor.submit(self.get_tags, repository)))
+
+                # Keep at most two Tag Lists per Worker in Flight
+                while len(pending) >= 2 * self.workers:
+                    repository, future = pending.popleft()
+                    yield (repository, future.result())
+
+            while len(pending) > 0:
+                repository, future = pending.popleft()
+                yield (repository, future.result())
+
+
+class CommandInventoryWalker(InventoryWalker):
+    # Class Constructor
+    # Repositories & Tags are listed by the given Functions (e.g. using regctl and its Credentials) instead of the native Registry Client
+    def __init__(self,
+                 registry: str,
+                 list_repositories: Callable[[], Iterable[str]],
+                 list_tags: Callable[[str], list[str]],
+                 workers: int = 8
+                 ) -> None:
+
+        super().__init__(client=None,
+                         registry=registry,
+                         workers=workers
+                         )
+
+        # Listing Functions
+        self.list_repositories = list_repositories
+        self.list_tags = list_tags
+
+    # Iterate over all Repositories of the Registry
+    def iter_repositories(self) -> Iterator[str]:
+        return iter(self.list_repositories())
+
+    # Get all Tags of a Repository
+    def get_tags(self,
+                 repository: str
+                 ) -> list[str]:
+
+        return self.list_tags(repository)
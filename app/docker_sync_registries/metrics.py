@@ -0,0 +1,232 @@
+# HTTP Server Library
+import http.server
+
+# OS Library
+import os
+
+# Threading Library
+import threading
+
+# Time Library
+import time
+
+# Context Manager Library
+from contextlib import contextmanager
+
+# Typing
+from typing import Iterator
+
+# Useful Material
+# https://prometheus.io/docs/instrumenting/exposition_formats/
+# https://github.com/prometheus/node_exporter#textfile-collector
+
+# Prefix of all Metric Names
+METRICS_PREFIX = "sync_registries"
+
+# Buckets of Request Latencies (in Seconds)
+LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+# Buckets of Process & Transfer Durations (in Seconds)
+DURATION_BUCKETS = [0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0]
+
+# Metrics exposed by the Application: Name -> (Type, Help, Buckets)
+METRICS = {
+           "phase_duration_seconds": ("gauge", "Duration of the last Execution of each Phase of a Run", None),
+           "last_run_timestamp_seconds": ("gauge", "Time when the last Run completed", None),
+           "lock_wait_seconds": ("gauge", "Time spent waiting for the Lock File before the last Run", None),
+           "manifest_request_duration_seconds": ("histogram", "Duration of Manifest Digest Queries per Registry", LATENCY_BUCKETS),
+           "subprocess_duration_seconds": ("histogram", "Duration of external Tool Processes per Tool", DURATION_BUCKETS),
+           "transfer_duration_seconds": ("histogram", "Duration of Image Transfers per Source Registry", DURATION_BUCKETS),
+           "scan_results": ("gauge", "Number of Images per Status found by the last Scan", None),
+           "images": ("gauge", "Number of Images per Status after the last Run", None),
+           "blobs_total": ("counter", "Number of Blobs handled by the native Copy", None),
+           "registry_requests_total": ("counter", "Number of Manifest Queries retried, failed (after Retries) or skipped per Registry", None),
+           "registry_circuit_open": ("gauge", "Whether the Manifest Queries of each Registry are currently skipped (Circuit Breaker open)", None),
+           "transferred_bytes_total": ("counter", "Number of Bytes uploaded to the Destination Registry by the native Copy", None),
+}
+
+
+# Escape a Label Value
+def escape_label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+# Format a Number
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# Format Labels as {key="value",...}
+def format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if len(labels) == 0:
+        return ""
+
+    return "{" + ",".join(f'{key}="{escape_label_value(value)}"' for key, value in labels) + "}"
+
+
+class Metrics:
+    # Class Constructor
+    def __init__(self) -> None:
+        # Values of each Metric, keyed by Name, then by Labels
+        # Histograms store [Count per Bucket..., Sum, Count]
+        self.values = {name: dict() for name in METRICS}
+
+        # Lock protecting the Values
+        self.lock = threading.Lock()
+
+        # HTTP Server (Daemon Mode)
+        self.server = None
+
+    # Get Key of a Set of Labels
+    def get_key(self,
+                labels: dict[str, str]
+                ) -> tuple[tuple[str, str], ...]:
+
+        return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    # Set the Value of a Gauge (or of a Counter mirroring a Statistic that only grows)
+    def set(self,
+            name: str,
+            value: float,
+            **labels: str
+            ) -> None:
+
+        with self.lock:
+            self.values[name][self.get_key(labels)] = value
+
+    # Increment a Counter
+    def inc(self,
+            name: str,
+            value: float = 1,
+            **labels: str
+            ) -> None:
+
+        key = self.get_key(labels)
+
+        with self.lock:
+            self.values[name][key] = self.values[name].get(key, 0) + value
+
+    # Record an Observation in a Histogram
+    def observe(self,
+                name: str,
+                value: float,
+                **labels: str
+                ) -> None:
+
+        key = self.get_key(labels)
+        buckets = METRICS[name][2]
+
+        with self.lock:
+            counts = self.values[name].setdefault(key, [0] * (len(buckets) + 2))
+
+            # Buckets are cumulative ("le" = less or equal)
+            for index, bound in enumerate(buckets):
+                if value <= bound:
+                    counts[index] += 1
+
+            counts[-2] += value
+            counts[-1] += 1
+
+    # Measure the Duration of a Block of Code
+    # Gauges store the Duration of the last Execution, Histograms record every Execution
+    @contextmanager
+    def timer(self,
+              name: str,
+              **labels: str
+              ) -> Iterator[None]:
+
+        start = time.monotonic()
+
+        try:
+            yield
+        finally:
+            if METRICS[name][0] == "histogram":
+                self.observe(name, time.monotonic() - start, **labels)
+            else:
+                self.set(name, time.monotonic() - start, **labels)
+
+    # Render all Metrics in the Prometheus Text Format
+    def render(self) -> str:
+        # Declare List
+        lines = []
+
+        with self.lock:
+            for name, (metric_type, help_text, buckets) in METRICS.items():
+                full_name = f"{METRICS_PREFIX}_{name}"
+
+                lines.append(f"# HELP {full_name} {help_text}")
+                lines.append(f"# TYPE {full_name} {metric_type}")
+
+                for key, value in sorted(self.values[name].items()):
+                    if metric_type == "histogram":
+                        for bound, count in zip(buckets + [float("inf")], value[0:len(buckets)] + [value[-1]]):
+                            lines.append(f"{full_name}_bucket{format_labels(key + (('le', format_value(float(bound))),))} {count}")
+
+                        lines.append(f"{full_name}_sum{format_labels(key)} {format_value(value[-2])}")
+                        lines.append(f"{full_name}_count{format_labels(key)} {value[-1]}")
+                    else:
+                        lines.append(f"{full_name}{format_labels(key)} {format_value(value)}")
+
+        # Return Result
+        return "\n".join(lines) + "\n"
+
+    # Write all Metrics to a File read by the Textfile Collector of node_exporter (Cron Mode)
+    def write_textfile(self,
+                       filepath: str
+                       ) -> None:
+
+        # Write to a temporary File first, so that the Collector never reads a partial File
+        temporary_filepath = f"{filepath}.{os.getpid()}.tmp"
+
+        try:
+            with open(temporary_filepath, "w") as f:
+                f.write(self.render())
+
+            os.replace(temporary_filepath, filepath)
+        except OSError as e:
+            # Display Warning
+            print(f"[WARNING] Writing Metrics to {filepath} failed")
+            print(e)
+
+    # Serve all Metrics over HTTP (Daemon Mode)
+    def serve(self,
+              port: int,
+              address: str = ""
+              ) -> None:
+
+        # Handler of the Requests
+        metrics = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            # Do not log every Scrape
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] not in ["/metrics", "/"]:
+                    self.send_error(404)
+                    return
+
+                body = metrics.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = http.server.ThreadingHTTPServer((address, port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name="metrics", daemon=True).start()
+
+        # Info
+        print(f"[INFO] Serving Metrics on Port {self.server.server_port}")
+
+    # Stop the HTTP Server
+    def close(self) -> None:
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
@@ -0,0 +1,247 @@
+# Concurrent Futures Library
+from concurrent.futures import ThreadPoolExecutor
+
+# Threading Library
+import threading
+
+# Time Library
+import time
+
+# Typing
+from typing import Any, Callable
+
+# Mirror used for Docker Hub when ENABLE_DOCKER_HUB_MIRROR is set (no Rate Limit there)
+DOCKER_HUB_DEFAULT_MIRROR = "mirror.gcr.io"
+
+# Weight of the last Probe in the (exponentially weighted) average Latency
+LATENCY_SMOOTHING = 0.3
+
+
+# Parse Mirrors in the Form "docker.io=mirror.gcr.io,docker.io=cache.example.com/dockerhub,ghcr.io=cache.example.com/ghcr"
+# A Mirror might contain a Path Prefix (e.g. Project of a Pull-Through Cache)
+def parse_mirrors(text: str | None) -> dict[str, list[str]]:
+    # Declare Dictionary
+    mirrors = dict()
+
+    if text is None:
+        return mirrors
+
+    for item in str(text).split(","):
+        # Skip empty Items
+        if item.strip() == "":
+            continue
+
+        # Separate Upstream Registry from Mirror
+        registry, separator, mirror = item.partition("=")
+
+        if separator == "" or mirror.strip() == "":
+            # Display Warning
+            print(f"[WARNING] Invalid Mirror {item.strip()}. Ignoring Entry.")
+            continue
+
+        # Store in Dictionary (keeping the configured Order)
+        mirrors.setdefault(registry.strip(), [])
+        if mirror.strip().rstrip("/") not in mirrors[registry.strip()]:
+            mirrors[registry.strip()].append(mirror.strip().rstrip("/"))
+
+    # Return Result
+    return mirrors
+
+
+class MirrorSelector:
+    # Class Constructor
+    def __init__(self,
+                 mirrors: dict[str, list[str]],
+                 failure_threshold: int = 3,
+                 demotion_time: int = 86400
+                 ) -> None:
+
+        # Mirrors configured for each Upstream Registry
+        self.mirrors = mirrors
+
+        # A Mirror is demoted after this many consecutive failed Transfers ...
+        self.failure_threshold = max(1, int(failure_threshold))
+
+        # ... for this many Seconds
+        self.demotion_time = demotion_time
+
+        # Statistics of each Mirror
+        self.stats = dict()
+
+        # Lock protecting the Statistics
+        self.lock = threading.Lock()
+
+    # Load Statistics of previous Runs
+    def load(self,
+             data: dict[str, dict[str, Any]]
+             ) -> None:
+
+        with self.lock:
+            self.stats = {mirror: dict(stats) for mirror, stats in data.items()}
+
+    # Dump Statistics
+    def dump(self) -> dict[str, dict[str, Any]]:
+        with self.lock:
+            return {mirror: dict(stats) for mirror, stats in self.stats.items()}
+
+    # Get (or create) the Statistics of a Mirror (Lock must be held)
+    def get_stats(self,
+                  mirror: str
+                  ) -> dict[str, Any]:
+
+        return self.stats.setdefault(mirror, dict(Probes=0,
+                                                  Matches=0,
+                                                  Errors=0,
+                                                  Latency=None,
+                                                  Transfers=0,
+                                                  TransferFailures=0,
+                                                  ConsecutiveFailures=0,
+                                                  DemotedUntil=0
+                                                  ))
+
+    # Get the Mirrors of the Registry of a Reference
+    def get_mirrors(self,
+                    full_artifact_reference: str
+                    ) -> list[str]:
+
+        return self.mirrors.get(full_artifact_reference.split("/", 1)[0], [])
+
+    # Get the Reference of an Image on a Mirror
+    def get_mirror_reference(self,
+                             full_artifact_reference: str,
+                             mirror: str
+                             ) -> str:
+
+        return mirror + "/" + full_artifact_reference.split("/", 1)[1]
+
+    # Check if a Mirror is currently demoted
+    def is_demoted(self,
+                   mirror: str,
+                   now: float | None = None
+                   ) -> bool:
+
+        if now is None:
+            now = time.time()
+
+        with self.lock:
+            stats = self.get_stats(mirror)
+
+            if stats["DemotedUntil"] == 0:
+                return False
+
+            if stats["DemotedUntil"] <= now:
+                # Give the Mirror another Chance (a single Failure demotes it again)
+                stats["DemotedUntil"] = 0
+                stats["ConsecutiveFailures"] = self.failure_threshold - 1
+                return False
+
+            # Return Value
+            return True
+
+    # Get the Mirrors that should be probed for an Image
+    def get_candidates(self,
+                       full_artifact_reference: str
+                       ) -> list[str]:
+
+        return [mirror for mirror in self.get_mirrors(full_artifact_reference) if not self.is_demoted(mirror)]
+
+    # Probe a Mirror and record the Result
+    # Returns (Hash, Return Code, Latency)
+    def probe(self,
+              full_artifact_reference: str,
+              mirror: str,
+              probe_function: Callable[..., tuple[str, Any, int]]
+              ) -> tuple[str, int, float]:
+
+        # Query the Mirror
+        start = time.monotonic()
+        mirror_hash, _, mirror_retcode = probe_function(full_artifact_reference=self.get_mirror_reference(full_artifact_reference, mirror))
+        latency = time.monotonic() - start
+
+        with self.lock:
+            stats = self.get_stats(mirror)
+            stats["Probes"] += 1
+
+            if mirror_retcode == 0:
+                # Update average Latency
+                if stats["Latency"] is None:
+                    stats["Latency"] = latency
+                else:
+                    stats["Latency"] = (1 - LATENCY_SMOOTHING) * stats["Latency"] + LATENCY_SMOOTHING * latency
+            else:
+                stats["Errors"] += 1
+
+        # Return Result
+        return (mirror_hash, mirror_retcode, latency)
+
+    # Probe all Mirrors of an Image in parallel
+    # Returns a Dictionary of Mirror -> (Hash, Return Code, Latency)
+    def probe_all(self,
+                  full_artifact_reference: str,
+                  probe_function: Callable[..., tuple[str, Any, int]]
+                  ) -> dict[str, tuple[str, int, float]]:
+
+        # Get Mirrors
+        candidates = self.get_candidates(full_artifact_reference)
+
+        if len(candidates) == 0:
+            return dict()
+
+        with ThreadPoolExecutor(max_workers=len(candidates), thread_name_prefix="mirror") as executor:
+            futures = {mirror: executor.submit(self.probe, full_artifact_reference, mirror, probe_function) for mirror in candidates}
+
+        # Return Result
+        return {mirror: future.result() for mirror, future in futures.items()}
+
+    # Choose the best Mirror serving the same Manifest Digest as the Source
+    # Returns None if no Mirror can be used
+    def choose(self,
+               source_hash: str,
+               results: dict[str, tuple[str, int, float]]
+               ) -> str | None:
+
+        # Declare List
+        matching = []
+
+        with self.lock:
+            for mirror, (mirror_hash, mirror_retcode, latency) in results.items():
+                if mirror_retcode != 0:
+                    continue
+
+                stats = self.get_stats(mirror)
+
+                if mirror_hash == source_hash:
+                    stats["Matches"] += 1
+
+                    # Prefer Mirrors whose Transfers succeed, then the fastest one
+                    success_rate = (stats["Transfers"] - stats["TransferFailures"] + 1) / (stats["Transfers"] + 2)
+                    matching.append((-success_rate, latency, mirror))
+
+        if len(matching) == 0:
+            return None
+
+        # Return Result
+        return sorted(matching)[0][2]
+
+    # Record the Result of a Transfer from a Mirror
+    def record_transfer(self,
+                        mirror: str,
+                        success: bool
+                        ) -> None:
+
+        with self.lock:
+            stats = self.get_stats(mirror)
+            stats["Transfers"] += 1
+
+            if success:
+                stats["ConsecutiveFailures"] = 0
+            else:
+                stats["TransferFailures"] += 1
+                stats["ConsecutiveFailures"] += 1
+
+                # Demote Mirrors that keep failing (e.g. --preserve-digests not supported)
+                if stats["ConsecutiveFailures"] >= self.failure_threshold:
+                    stats["DemotedUntil"] = int(time.time()) + self.demotion_time
+
+                    # Display Warning
+                    print(f"[WARNING] Mirror {mirror} failed {stats['ConsecutiveFailures']} Transfers in a Row. Do not use it for {self.demotion_time} Seconds.")
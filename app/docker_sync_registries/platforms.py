@@ -0,0 +1,115 @@
+# Regular Expressions Library
+import re
+
+# Typing
+from typing import Any
+
+# Platforms as written in the Configuration, e.g. "linux/amd64", "linux/arm/v7" or "windows/amd64:10.0.17763.5458"
+PLATFORM_PATTERN = re.compile(r"^[a-z0-9_.-]+/[a-z0-9_.-]+(/[a-z0-9_.-]+)?(:[0-9A-Za-z_.-]+)?$")
+
+# Keyword selecting all Platforms (e.g. to override SYNC_PLATFORMS for a single Image)
+ALL_PLATFORMS = "all"
+
+# Annotation of the Attestations (SBOM, Provenance) that BuildKit adds to Image Indexes (Digest of the described Manifest)
+ATTESTATION_DIGEST_ANNOTATION = "vnd.docker.reference.digest"
+
+
+# Parse a List of Platforms (Comma-Separated String or List)
+# Returns None if no Platform is given (inherit the Default) and [] for "all" (no Filter)
+def parse_platforms(value: str | list[str] | None) -> list[str] | None:
+    if value is None:
+        return None
+
+    # Declare List
+    platforms = []
+
+    for item in (value if isinstance(value, list) else str(value).split(",")):
+        platform = str(item).strip().lower()
+
+        if platform == "":
+            continue
+
+        if platform == ALL_PLATFORMS:
+            return []
+
+        if PLATFORM_PATTERN.match(platform) is None:
+            raise ValueError(f"Invalid Platform {item} (expected <os>/<architecture>[/<variant>], e.g. linux/amd64)")
+
+        if platform not in platforms:
+            platforms.append(platform)
+
+    # Return Result
+    return platforms if len(platforms) > 0 else None
+
+
+# Format the Platform of an Index Entry, e.g. {"os": "linux", "architecture": "arm64", "variant": "v8"} -> "linux/arm64/v8"
+def format_platform(platform: dict[str, Any]) -> str:
+    text = "/".join(str(part) for part in [platform.get("os"), platform.get("architecture"), platform.get("variant")] if part)
+
+    # Several Windows Images may only differ by their OS Version
+    if platform.get("os.version"):
+        text += ":" + str(platform["os.version"])
+
+    # Return Result
+    return text.lower()
+
+
+# Check if a Platform is allowed
+# "linux/arm64" matches all Variants of linux/arm64, "linux/arm/v7" only this Variant (same for the OS Version)
+def match_platform(platform: str,
+                   allowed: list[str]
+                   ) -> bool:
+
+    platform_name, _, os_version = platform.partition(":")
+
+    for item in allowed:
+        item_name, _, item_os_version = item.partition(":")
+
+        if item_os_version and item_os_version != os_version:
+            continue
+
+        if platform_name == item_name or platform_name.startswith(item_name + "/"):
+            return True
+
+    # Return Value
+    return False
+
+
+# Check if an Index Entry is an Attestation of another Entry
+def is_attestation(descriptor: dict[str, Any]) -> bool:
+    return ATTESTATION_DIGEST_ANNOTATION in (descriptor.get("annotations") or dict())
+
+
+# Get the Digest of the Manifest of each Platform of an Image Index (Attestations are ignored)
+# Returns None if the Manifest is not an Index (single Platform Image)
+def get_platform_digests(manifest: dict[str, Any]) -> dict[str, str] | None:
+    if "manifests" not in manifest:
+        return None
+
+    # Return Result
+    return {format_platform(descriptor.get("platform") or dict()): descriptor["digest"] for descriptor in manifest["manifests"] if not is_attestation(descriptor)}
+
+
+# Only keep the Platform Digests of the allowed Platforms
+def select_platform_digests(digests: dict[str, str],
+                            allowed: list[str]
+                            ) -> dict[str, str]:
+
+    return {platform: digest for platform, digest in digests.items() if match_platform(platform, allowed)}
+
+
+# Remove the Entries of the Platforms that are not allowed from an Image Index
+# Attestations are kept together with the Image they describe
+def filter_index(manifest: dict[str, Any],
+                 allowed: list[str]
+                 ) -> dict[str, Any]:
+
+    # Manifests of the allowed Platforms
+    kept = [descriptor for descriptor in manifest.get("manifests", []) if not is_attestation(descriptor) and match_platform(format_platform(descriptor.get("platform") or dict()), allowed)]
+    digests = set(descriptor["digest"] for descriptor in kept)
+
+    # Attestations of these Manifests
+    attestations = [descriptor for descriptor in manifest.get("manifests", []) if is_attestation(descriptor) and descriptor["annotations"][ATTESTATION_DIGEST_ANNOTATION] in digests]
+
+    # Return Result (in the original Order)
+    return dict(manifest, manifests=[descriptor for descriptor in manifest.get("manifests", []) if descriptor in kept or descriptor in attestations])
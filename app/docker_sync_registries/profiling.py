@@ -0,0 +1,205 @@
+# Profiler Library
+import cProfile
+
+# Statistics of the Profiler
+import pstats
+
+# JSON Module
+import json
+
+# OS Library
+import os
+
+# sys Library
+import sys
+
+# Threading Library
+import threading
+
+# Time Library
+import time
+
+# Context Manager Library
+from contextlib import contextmanager
+
+# Typing
+from typing import Any, Iterator
+
+# Useful Material
+# https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU (Trace Event Format)
+# Traces can be opened with chrome://tracing or https://ui.perfetto.dev
+
+# From Python 3.12, cProfile uses sys.monitoring, which records all Threads of the Interpreter (and only allows one active Profiler)
+CPROFILE_ALL_THREADS = sys.version_info >= (3, 12)
+
+# Maximum Number of Spans kept in Memory (the Daemon might run for a long Time)
+TRACE_MAX_EVENTS = 1000000
+
+
+class Tracer:
+    # Class Constructor
+    def __init__(self,
+                 enabled: bool = False
+                 ) -> None:
+
+        # Whether Spans are recorded
+        self.enabled = enabled
+
+        # Recorded Spans ("Complete" Events)
+        self.events = []
+
+        # Number of Spans that were dropped because TRACE_MAX_EVENTS was reached
+        self.dropped = 0
+
+        # Name of each Thread that recorded a Span, keyed by Thread ID
+        self.threads = dict()
+
+        # Lock protecting the Events
+        self.lock = threading.Lock()
+
+        # Reference Time of the Trace
+        self.origin = time.perf_counter()
+
+    # Record a Span around a Block of Code
+    @contextmanager
+    def span(self,
+             name: str,
+             category: str = "app",
+             **args: Any
+             ) -> Iterator[None]:
+
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            thread = threading.current_thread()
+
+            # Timestamps are in Microseconds
+            event = dict(name=name,
+                         cat=category,
+                         ph="X",
+                         ts=round((start - self.origin) * 1000000, 1),
+                         dur=round((end - start) * 1000000, 1),
+                         pid=os.getpid(),
+                         tid=thread.ident,
+                         args=args
+                         )
+
+            with self.lock:
+                if len(self.events) < TRACE_MAX_EVENTS:
+                    self.events.append(event)
+                    self.threads[thread.ident] = thread.name
+                else:
+                    self.dropped += 1
+
+    # Write all Spans to a File (Chrome Trace Event Format)
+    def dump(self,
+             filepath: str
+             ) -> None:
+
+        with self.lock:
+            # Name the Threads (e.g. "scan_0", "sync_1") in the Viewer
+            metadata = [dict(name="thread_name", ph="M", pid=os.getpid(), tid=tid, args=dict(name=name)) for tid, name in self.threads.items()]
+            trace = dict(traceEvents=metadata + self.events,
+                         displayTimeUnit="ms",
+                         otherData=dict(DroppedEvents=self.dropped)
+                         )
+
+        try:
+            with open(filepath, "w") as f:
+                json.dump(trace, f)
+
+            # Info
+            print(f"[INFO] Trace with {len(trace['traceEvents']) - len(metadata)} Span(s) written to {filepath}")
+        except OSError as e:
+            # Display Warning
+            print(f"[WARNING] Writing Trace to {filepath} failed")
+            print(e)
+
+
+class ThreadProfiler:
+    # Class Constructor
+    def __init__(self) -> None:
+        # One Profiler per Thread before Python 3.12 (cProfile only records the Thread it was enabled in), a single Profiler otherwise
+        self.profilers = []
+
+        # Lock protecting the Profilers
+        self.lock = threading.Lock()
+
+    # Start profiling the current Thread and all Threads started from now on
+    def start(self) -> None:
+        # Threads started later (e.g. Workers of the Scan & Sync) enable their own Profiler on their first Function Call
+        if not CPROFILE_ALL_THREADS:
+            threading.setprofile(self.enable_thread)
+
+        profiler = cProfile.Profile()
+        self.profilers.append(profiler)
+        profiler.enable()
+
+    # Enable a Profiler in a new Thread (installed using threading.setprofile)
+    # Called once per Thread, right before Thread.run() starts executing the Target of the Thread
+    def enable_thread(self,
+                      frame: Any,
+                      event: str,
+                      arg: Any
+                      ) -> None:
+
+        profiler = cProfile.Profile()
+
+        with self.lock:
+            self.profilers.append(profiler)
+
+        # A Profiler can only be disabled from its own Thread: disable it as soon as the Target of the Thread (e.g. a Worker of a ThreadPoolExecutor) returns
+        # Threads overriding run() are profiled until they exit
+        thread = threading.current_thread()
+        target = getattr(thread, "_target", None)
+
+        if target is not None:
+            def run_target(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return target(*args, **kwargs)
+                finally:
+                    profiler.disable()
+
+            thread._target = run_target
+
+        # Replaces this Function as Profile Function of the Thread
+        profiler.enable()
+
+    # Stop profiling and write the merged Statistics of all Threads (open with "python -m pstats <File>" or snakeviz)
+    def dump(self,
+             filepath: str
+             ) -> None:
+
+        # Stop profiling the current Thread (all Threads from Python 3.12)
+        self.profilers[0].disable()
+
+        if not CPROFILE_ALL_THREADS:
+            # Do not profile Threads started from now on
+            threading.setprofile(None)
+            sys.setprofile(None)
+
+        with self.lock:
+            # Merge Statistics of all Threads
+            stats = pstats.Stats(self.profilers[0])
+            for profiler in self.profilers[1:]:
+                stats.add(profiler)
+
+        try:
+            stats.dump_stats(filepath)
+
+            # Info
+            if CPROFILE_ALL_THREADS:
+                print(f"[INFO] cProfile Statistics of all Threads written to {filepath}")
+            else:
+                print(f"[INFO] cProfile Statistics of {len(self.profilers)} Thread(s) written to {filepath}")
+        except OSError as e:
+            # Display Warning
+            print(f"[WARNING] Writing cProfile Statistics to {filepath} failed")
+            print(e)
@@ -0,0 +1,202 @@
+# Regular Expressions Library
+import re
+
+# Threading Library
+import threading
+
+# Datetime Module
+from datetime import datetime
+
+# Typing
+from typing import Any
+
+# Useful Material
+# https://docs.docker.com/docker-hub/usage/pulls/
+# https://about.gitlab.com/blog/2020/11/18/docker-hub-rate-limit-monitoring/
+
+# Headers returned by Docker Hub on Manifest Requests, e.g. "ratelimit-remaining: 76;w=21600"
+RATELIMIT_LIMIT_HEADER = "ratelimit-limit"
+RATELIMIT_REMAINING_HEADER = "ratelimit-remaining"
+
+# Regular Expression to parse the Rate Limit Headers
+RATELIMIT_HEADER_REGEX = re.compile(r"^\s*(\d+)(?:\s*;\s*w=(\d+))?")
+
+# Window to assume if the Registry does not return it (Docker Hub uses 6 Hours)
+RATELIMIT_DEFAULT_WINDOW = 21600
+
+
+# Parse a Rate Limit Header into (Count, Window)
+def parse_ratelimit_header(value: str | None) -> tuple[int, int] | None:
+    if value is None:
+        return None
+
+    match = RATELIMIT_HEADER_REGEX.match(value)
+
+    if match is None:
+        return None
+
+    # Return Result
+    return (int(match.group(1)), int(match.group(2) or RATELIMIT_DEFAULT_WINDOW))
+
+
+class RateLimitTracker:
+    # Class Constructor
+    def __init__(self,
+                 reserve: int = 0,
+                 pull_cost: int = 1
+                 ) -> None:
+
+        # Number of Pulls to always keep available (e.g. for manual Pulls)
+        self.reserve = reserve
+
+        # Number of Pulls accounted for each Image Transfer
+        self.pull_cost = pull_cost
+
+        # Budget for each Registry
+        # Limit, Remaining and Window are the last Values reported by the Registry at ObservedAt
+        # Consumed counts the Pulls reserved since then
+        self.budgets = dict()
+
+        # Lock protecting the Budgets
+        self.lock = threading.Lock()
+
+    # Load Budgets (e.g. from the Database of the previous Run)
+    def load(self,
+             data: dict[str, dict[str, Any]]
+             ) -> None:
+
+        with self.lock:
+            for registry, budget in data.items():
+                self.budgets[registry] = dict(Limit=budget.get("Limit"),
+                                              Remaining=budget.get("Remaining"),
+                                              Window=budget.get("Window", RATELIMIT_DEFAULT_WINDOW),
+                                              ObservedAt=budget.get("ObservedAt", 0),
+                                              Consumed=budget.get("Consumed", 0),
+                                              InFlight=0
+                                              )
+
+    # Dump Budgets (e.g. to the Database)
+    def dump(self) -> dict[str, dict[str, Any]]:
+        with self.lock:
+            return {registry: dict(Limit=budget["Limit"],
+                                   Remaining=budget["Remaining"],
+                                   Window=budget["Window"],
+                                   ObservedAt=budget["ObservedAt"],
+                                   Consumed=budget["Consumed"],
+                                   ResetAt=budget["ObservedAt"] + budget["Window"]
+                                   )
+                    for registry, budget in self.budgets.items()}
+
+    # Update Budget based on the Headers of a Response
+    # Returns True if the Response contained Rate Limit Information
+    def update_from_headers(self,
+                            registry: str,
+                            headers: dict[str, str]
+                            ) -> bool:
+
+        # Parse Headers
+        limit = parse_ratelimit_header(headers.get(RATELIMIT_LIMIT_HEADER))
+        remaining = parse_ratelimit_header(headers.get(RATELIMIT_REMAINING_HEADER))
+
+        if remaining is None:
+            return False
+
+        with self.lock:
+            budget = self.budgets.setdefault(registry, dict(InFlight=0))
+
+            # The Registry already accounts for all completed Pulls: only Transfers in Progress are still pending
+            budget["Limit"] = limit[0] if limit is not None else remaining[0]
+            budget["Remaining"] = remaining[0]
+            budget["Window"] = remaining[1]
+            budget["ObservedAt"] = int(datetime.now().timestamp())
+            budget["Consumed"] = budget.get("InFlight", 0)
+
+        # Return Value
+        return True
+
+    # Mark the Budget of a Registry as exhausted (e.g. after receiving HTTP 429)
+    def exhaust(self,
+                registry: str,
+                headers: dict[str, str] | None = None
+                ) -> None:
+
+        if headers is not None and self.update_from_headers(registry, headers):
+            return
+
+        with self.lock:
+            budget = self.budgets.setdefault(registry, dict(InFlight=0, Limit=None))
+            budget["Remaining"] = 0
+            budget["Window"] = budget.get("Window", RATELIMIT_DEFAULT_WINDOW)
+            budget["ObservedAt"] = int(datetime.now().timestamp())
+            budget["Consumed"] = 0
+
+    # Get Number of Pulls still available for a Registry (None if unknown / unlimited)
+    def available(self,
+                  registry: str
+                  ) -> int | None:
+
+        with self.lock:
+            return self._available(registry)
+
+    # Get Number of Pulls still available (Lock must be held)
+    def _available(self,
+                   registry: str
+                   ) -> int | None:
+
+        budget = self.budgets.get(registry)
+
+        if budget is None or budget.get("Remaining") is None:
+            return None
+
+        # Get Current Timestamp
+        now = int(datetime.now().timestamp())
+
+        if now >= budget["ObservedAt"] + budget["Window"]:
+            # Window has elapsed since the last Observation: the whole Limit is available again
+            if budget.get("Limit") is None:
+                return None
+
+            # Start a new Window
+            budget["Remaining"] = budget["Limit"]
+            budget["ObservedAt"] = now
+            budget["Consumed"] = budget.get("InFlight", 0)
+
+        # Return Value
+        return budget["Remaining"] - budget["Consumed"] - self.reserve
+
+    # Reserve Pulls for an Image Transfer (count Images, e.g. one per copied Platform)
+    # Returns False if the Transfer would exceed the Budget and must be deferred to a later Run
+    def try_acquire(self,
+                    registry: str,
+                    count: int = 1
+                    ) -> bool:
+
+        # Number of Pulls to reserve
+        cost = self.pull_cost * count
+
+        with self.lock:
+            available = self._available(registry)
+
+            if available is not None and available < cost:
+                return False
+
+            budget = self.budgets.get(registry)
+
+            if budget is not None:
+                budget["Consumed"] = budget.get("Consumed", 0) + cost
+                budget["InFlight"] = budget.get("InFlight", 0) + cost
+
+        # Return Value
+        return True
+
+    # Release the Reservation of a completed Transfer
+    def release(self,
+                registry: str,
+                count: int = 1
+                ) -> None:
+
+        with self.lock:
+            budget = self.budgets.get(registry)
+
+            if budget is not None:
+                budget["InFlight"] = max(0, budget.get("InFlight", 0) - self.pull_cost * count)
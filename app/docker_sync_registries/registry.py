@@ -0,0 +1,648 @@
+# Python Module to perform HTTP Requests
+import requests
+
+# Requests HTTP Adapter (Connection Pool Settings)
+from requests.adapters import HTTPAdapter
+
+# OS Library
+import os
+
+# Regular Expressions Library
+import re
+
+# Base64 Library (decode Credentials stored in the AUTH File)
+import base64
+
+# Hash Library (compute Manifest Digest if the Registry does not return it)
+import hashlib
+
+# Threading Library
+import threading
+
+# Subprocess Python Module (only used to build a compatible Result Object)
+import subprocess
+
+# JSON Module
+import json
+
+# Time Library
+import time
+
+# Typing
+from typing import Any, Callable
+
+# Useful Material
+# https://distribution.github.io/distribution/spec/api/
+# https://github.com/opencontainers/distribution-spec/blob/main/spec.md
+
+# Hostname to use when the Registry is "docker.io"
+DOCKER_HUB_REGISTRY = "docker.io"
+DOCKER_HUB_API_HOSTNAME = "registry-1.docker.io"
+
+# Keys that might be used for Docker Hub inside the AUTH File
+DOCKER_HUB_AUTH_KEYS = ["docker.io", "registry-1.docker.io", "index.docker.io", "https://index.docker.io/v1/"]
+
+# Media Types accepted when querying a Manifest
+MANIFEST_MEDIA_TYPES = [
+                        "application/vnd.oci.image.index.v1+json",
+                        "application/vnd.oci.image.manifest.v1+json",
+                        "application/vnd.docker.distribution.manifest.list.v2+json",
+                        "application/vnd.docker.distribution.manifest.v2+json",
+]
+
+# Regular Expression to parse the WWW-Authenticate Header Parameters
+WWW_AUTHENTICATE_PARAMS_REGEX = re.compile(r'(\w+)="([^"]*)"')
+
+
+# Split a Fully Qualified Artifact Reference into Registry, Repository and Tag (or Digest)
+def parse_reference(full_artifact_reference: str) -> tuple[str, str, str]:
+    # Separate Registry from the Rest of the Reference
+    registry, remainder = full_artifact_reference.split("/", 1)
+
+    if "@" in remainder:
+        # Reference by Digest
+        repository, tag = remainder.split("@", 1)
+    else:
+        # Reference by Tag
+        # The Tag Separator is the last ":" after the last "/"
+        repository, separator, tag = remainder.rpartition(":")
+
+        if separator == "" or "/" in tag:
+            # No Tag specified, default to "latest"
+            repository = remainder
+            tag = "latest"
+
+    # Return Result
+    return (registry, repository, tag)
+
+
+# Build a Fully Qualified Artifact Reference from Registry, Repository and Tag (or Digest)
+def format_reference(registry: str,
+                     repository: str,
+                     reference: str
+                     ) -> str:
+
+    # Digests are separated by "@", Tags by ":"
+    separator = "@" if reference.startswith("sha256:") else ":"
+
+    # Return Result
+    return f"{registry}/{repository}{separator}{reference}"
+
+
+# Parse a Comma-Separated List (as used in Environment Variables)
+def parse_list(text: str | None) -> list[str]:
+    if text is None:
+        return []
+
+    return [item.strip() for item in str(text).split(",") if item.strip() != ""]
+
+
+# Parse the WWW-Authenticate Header into Scheme and Parameters
+def parse_www_authenticate(header: str) -> tuple[str, dict[str, str]]:
+    # Separate Scheme from Parameters
+    scheme, _, params = header.partition(" ")
+
+    # Return Result
+    return (scheme.strip().lower(), dict(WWW_AUTHENTICATE_PARAMS_REGEX.findall(params)))
+
+
+# Build a Result compatible with subprocess.run() from an HTTP Response
+def completed_process_from_response(args: list[str],
+                                    response: requests.Response
+                                    ) -> subprocess.CompletedProcess:
+
+    if response.ok:
+        result = subprocess.CompletedProcess(args=args,
+                                             returncode=0,
+                                             stdout=response.text,
+                                             stderr=""
+                                             )
+    else:
+        result = subprocess.CompletedProcess(args=args,
+                                             returncode=1,
+                                             stdout="",
+                                             stderr=f"HTTP {response.status_code} {response.reason} for {response.url}"
+                                             )
+
+    # Expose Response to the Caller for further Inspection (Headers, Status Code)
+    result.response = response
+
+    # Return Result
+    return result
+
+
+class TokenCache:
+    # Class Constructor
+    def __init__(self,
+                 refresh_margin: float = 30,
+                 default_expires_in: float = 60
+                 ) -> None:
+
+        # Refresh Tokens this many Seconds before they expire
+        self.refresh_margin = refresh_margin
+
+        # Lifetime to assume if the Token Server does not return "expires_in" (as per Distribution Specification)
+        self.default_expires_in = default_expires_in
+
+        # Cached Tokens keyed by (realm, service, scope)
+        self.tokens = dict()
+
+        # One Lock per Key, so that concurrent Requests for the same Scope only fetch one Token
+        self.locks = dict()
+        self.locks_lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    # Get Lock associated with a Key
+    def get_lock(self,
+                 key: tuple[str, str | None, str | None]
+                 ) -> threading.Lock:
+
+        with self.locks_lock:
+            return self.locks.setdefault(key, threading.Lock())
+
+    # Get a cached Token if it is still valid (and not about to expire)
+    def lookup(self,
+               realm: str,
+               service: str | None,
+               scope: str | None
+               ) -> str | None:
+
+        # Get Entry
+        entry = self.tokens.get((realm, service, scope))
+
+        if entry is not None and time.monotonic() < entry["RefreshAt"]:
+            return entry["Token"]
+
+        # Return Value
+        return None
+
+    # Get a Token from the Cache, fetching a new one if needed
+    def get(self,
+            realm: str,
+            service: str | None,
+            scope: str | None,
+            fetch: Callable[[], dict[str, Any]]
+            ) -> str:
+
+        # Build Key
+        key = (realm, service, scope)
+
+        with self.get_lock(key):
+            # Another Thread might have fetched the Token in the meantime
+            token = self.lookup(realm, service, scope)
+
+            if token is not None:
+                self.hits += 1
+                return token
+
+            self.misses += 1
+
+            # Request new Token
+            requested_at = time.monotonic()
+            token_data = fetch()
+
+            # Some Token Servers use "access_token" instead of "token"
+            token = token_data.get("token", token_data.get("access_token"))
+
+            # Honour the Lifetime returned by the Token Server
+            expires_in = float(token_data.get("expires_in") or self.default_expires_in)
+
+            # Refresh before Expiry (never wait more than half of the Lifetime)
+            refresh_at = requested_at + expires_in - min(self.refresh_margin, expires_in / 2)
+
+            # Store in Cache
+            self.tokens[key] = dict(Token=token, RefreshAt=refresh_at)
+
+        # Return Value
+        return token
+
+    # Remove a Token from the Cache (e.g. if the Registry rejected it)
+    def invalidate(self,
+                   realm: str,
+                   service: str | None,
+                   scope: str | None
+                   ) -> None:
+
+        self.tokens.pop((realm, service, scope), None)
+
+
+class RegistryClient:
+    # Class Constructor
+    def __init__(self,
+                 auth_file: str | None = None,
+                 insecure_registries: list[str] | None = None,
+                 timeout: float = 30,
+                 pool_size: int = 16,
+                 token_cache: TokenCache | None = None
+                 ) -> None:
+
+        # Path to the AUTH File (same Format as used by Skopeo/Podman/Docker)
+        self.auth_file = auth_file
+
+        # Registries that must be contacted using plain HTTP
+        self.insecure_registries = insecure_registries if insecure_registries is not None else []
+
+        # Timeout for each Request (Seconds)
+        self.timeout = timeout
+
+        # Maximum Number of Keep-Alive Connections per Registry
+        self.pool_size = pool_size
+
+        # Credentials loaded from the AUTH File (lazily initialized)
+        self.credentials = None
+
+        # One Session (Connection Pool) per Registry
+        self.sessions = dict()
+
+        # Lock protecting the Sessions Dictionary
+        self.sessions_lock = threading.Lock()
+
+        # Bearer Tokens shared by all Requests performed with this Client
+        self.token_cache = token_cache if token_cache is not None else TokenCache()
+
+        # Last Authentication Challenge received from each Registry (Scheme, Parameters)
+        # Used to authenticate Requests upfront instead of waiting for a 401 Response every Time
+        self.challenges = dict()
+
+    # Get API Hostname for a given Registry
+    def get_api_hostname(self,
+                         registry: str
+                         ) -> str:
+
+        if registry == DOCKER_HUB_REGISTRY:
+            return DOCKER_HUB_API_HOSTNAME
+
+        return registry
+
+    # Get Base URL for a given Registry
+    def get_base_url(self,
+                     registry: str
+                     ) -> str:
+
+        # Use plain HTTP for Registries marked as insecure
+        scheme = "http" if registry in self.insecure_registries else "https"
+
+        # Return Value
+        return f"{scheme}://{self.get_api_hostname(registry)}"
+
+    # Get (or create) the Session associated with a Registry
+    def get_session(self,
+                    registry: str
+                    ) -> requests.Session:
+
+        with self.sessions_lock:
+            session = self.sessions.get(registry)
+
+            if session is None:
+                # Create a new Session with a Keep-Alive Connection Pool
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+
+                # Store in Dictionary
+                self.sessions[registry] = session
+
+        # Return Value
+        return session
+
+    # Close all Sessions
+    def close(self) -> None:
+        with self.sessions_lock:
+            for session in self.sessions.values():
+                session.close()
+
+            self.sessions = dict()
+
+    # Load Credentials from the AUTH File
+    def load_credentials(self) -> dict[str, tuple[str, str]]:
+        # Declare Dictionary
+        credentials = dict()
+
+        if self.auth_file is not None and os.path.exists(self.auth_file):
+            try:
+                with open(self.auth_file, "r", encoding="UTF-8") as auth_file_handle:
+                    data = json.load(auth_file_handle)
+
+                for key, value in data.get("auths", dict()).items():
+                    # Registry Key might be stored as an URL
+                    registry = key.removeprefix("https://").removeprefix("http://").rstrip("/")
+
+                    if "auth" in value:
+                        # Decode "username:password"
+                        username, _, password = base64.b64decode(value["auth"]).decode("UTF-8").partition(":")
+                    else:
+                        username = value.get("username", "")
+                        password = value.get("password", "")
+
+                    # Store in Dictionary
+                    credentials[registry] = (username, password)
+            except Exception as e:
+                # Display Warning & Error Message
+                print(f"[WARNING] Loading AUTH File {self.auth_file} failed!")
+                print(e)
+
+        # Return Result
+        return credentials
+
+    # Get Credentials for a given Registry
+    def get_credentials(self,
+                        registry: str
+                        ) -> tuple[str, str] | None:
+
+        # Load Credentials if not done yet
+        if self.credentials is None:
+            self.credentials = self.load_credentials()
+
+        if registry == DOCKER_HUB_REGISTRY:
+            # Docker Hub might be stored under several Keys
+            for key in DOCKER_HUB_AUTH_KEYS:
+                key = key.removeprefix("https://").rstrip("/")
+                if key in self.credentials:
+                    return self.credentials[key]
+
+        # Return Value
+        return self.credentials.get(registry)
+
+    # Request a Bearer Token from the Token Server
+    def fetch_token(self,
+                    registry: str,
+                    realm: str,
+                    service: str | None,
+                    scope: str | None
+                    ) -> dict[str, Any]:
+
+        # Build Query Parameters
+        params = dict()
+        if service is not None:
+            params["service"] = service
+        if scope is not None:
+            # Several Scopes (separated by Spaces) are sent as repeated Parameters
+            params["scope"] = scope.split(" ")
+
+        # Use Credentials if available, otherwise request an anonymous Token
+        credentials = self.get_credentials(registry)
+
+        response = self.get_session(registry).get(realm,
+                                                  params=params,
+                                                  auth=credentials,
+                                                  timeout=self.timeout
+                                                  )
+        response.raise_for_status()
+
+        # Return Result
+        return response.json()
+
+    # Get Authorization Header for a given Scope
+    # Returns None if no Authentication is known to be required (yet) for the Registry
+    def authorize(self,
+                  registry: str,
+                  scope: str | None,
+                  cached_only: bool = False
+                  ) -> str | None:
+
+        # Get last Challenge received from the Registry
+        challenge = self.challenges.get(registry)
+
+        if challenge is None:
+            return None
+
+        scheme, params = challenge
+
+        if scheme == "bearer":
+            realm = params.get("realm")
+            service = params.get("service")
+
+            if cached_only:
+                # Only use a Token that is already available
+                token = self.token_cache.lookup(realm, service, scope)
+                if token is None:
+                    return None
+            else:
+                # Get Token from Cache or request a new one
+                token = self.token_cache.get(realm,
+                                             service,
+                                             scope,
+                                             fetch=lambda: self.fetch_token(registry=registry,
+                                                                            realm=realm,
+                                                                            service=service,
+                                                                            scope=scope
+                                                                            )
+                                             )
+
+            return f"Bearer {token}"
+
+        if scheme == "basic":
+            credentials = self.get_credentials(registry)
+
+            if credentials is not None:
+                encoded = base64.b64encode(":".join(credentials).encode("UTF-8")).decode("UTF-8")
+                return f"Basic {encoded}"
+
+        # Return Value
+        return None
+
+    # Perform a Request against the Registry API, answering Authentication Challenges if needed
+    def request(self,
+                method: str,
+                registry: str,
+                path: str,
+                headers: dict[str, str] | None = None,
+                scope: str | None = None,
+                **kwargs
+                ) -> requests.Response:
+
+        # Build URL
+        url = path if path.startswith("http") else self.get_base_url(registry) + path
+
+        # Copy Headers
+        headers = dict(headers) if headers is not None else dict()
+
+        # Get Session
+        session = self.get_session(registry)
+
+        # Authenticate upfront if a valid Token is already cached for this Scope
+        authorization = self.authorize(registry=registry, scope=scope, cached_only=True)
+        if authorization is not None:
+            headers["Authorization"] = authorization
+
+        # Perform Request
+        response = session.request(method, url, headers=headers, timeout=self.timeout, **kwargs)
+
+        if response.status_code == 401 and "WWW-Authenticate" in response.headers:
+            # Remember Challenge for the next Requests
+            scheme, params = parse_www_authenticate(response.headers["WWW-Authenticate"])
+            self.challenges[registry] = (scheme, params)
+
+            # Prefer the Scope requested by the Registry
+            scope = params.get("scope", scope)
+
+            if scheme == "bearer" and authorization is not None:
+                # The cached Token was rejected
+                self.token_cache.invalidate(params.get("realm"), params.get("service"), scope)
+
+            # Answer Authentication Challenge
+            authorization = self.authorize(registry=registry, scope=scope)
+
+            if authorization is not None:
+                # Retry Request with Authorization Header
+                headers["Authorization"] = authorization
+                response = session.request(method, url, headers=headers, timeout=self.timeout, **kwargs)
+
+        # Return Result
+        return response
+
+    # Perform HEAD Request on a Manifest
+    def head_manifest(self,
+                      full_artifact_reference: str
+                      ) -> requests.Response:
+
+        # Split Reference
+        registry, repository, tag = parse_reference(full_artifact_reference)
+
+        # Perform Request
+        return self.request("HEAD",
+                            registry,
+                            f"/v2/{repository}/manifests/{tag}",
+                            headers={"Accept": ", ".join(MANIFEST_MEDIA_TYPES)},
+                            scope=f"repository:{repository}:pull"
+                            )
+
+    # Perform GET Request on a Manifest
+    def get_manifest(self,
+                     full_artifact_reference: str
+                     ) -> requests.Response:
+
+        # Split Reference
+        registry, repository, tag = parse_reference(full_artifact_reference)
+
+        # Perform Request
+        return self.request("GET",
+                            registry,
+                            f"/v2/{repository}/manifests/{tag}",
+                            headers={"Accept": ", ".join(MANIFEST_MEDIA_TYPES)},
+                            scope=f"repository:{repository}:pull"
+                            )
+
+    # Perform PUT Request on a Manifest
+    def put_manifest(self,
+                     full_artifact_reference: str,
+                     body: bytes,
+                     media_type: str
+                     ) -> requests.Response:
+
+        # Split Reference
+        registry, repository, tag = parse_reference(full_artifact_reference)
+
+        # Perform Request
+        return self.request("PUT",
+                            registry,
+                            f"/v2/{repository}/manifests/{tag}",
+                            headers={"Content-Type": media_type},
+                            scope=f"repository:{repository}:pull,push",
+                            data=body
+                            )
+
+    # Tag a Manifest already present in a Repository with another Tag of the same Repository
+    # Only the Manifest is uploaded again (unchanged, so the Digest is preserved), no Blob is transferred
+    # Returns a Result compatible with the command line Tools
+    def tag_manifest(self,
+                     source_full_artifact_reference: str,
+                     destination_full_artifact_reference: str
+                     ) -> subprocess.CompletedProcess:
+
+        # Description of the Request (used as "args" of the Result)
+        args = ["PUT", source_full_artifact_reference, destination_full_artifact_reference]
+
+        try:
+            # Get Manifest exactly as stored in the Registry
+            response = self.get_manifest(source_full_artifact_reference)
+
+            if response.ok:
+                # Upload the same Bytes under the new Tag
+                response = self.put_manifest(destination_full_artifact_reference,
+                                             body=response.content,
+                                             media_type=response.headers.get("Content-Type", MANIFEST_MEDIA_TYPES[0])
+                                             )
+
+            if response.ok:
+                result = subprocess.CompletedProcess(args=args,
+                                                     returncode=0,
+                                                     stdout=response.headers.get("Docker-Content-Digest", "") + "\n",
+                                                     stderr=""
+                                                     )
+            else:
+                result = subprocess.CompletedProcess(args=args,
+                                                     returncode=1,
+                                                     stdout="",
+                                                     stderr=f"HTTP {response.status_code} {response.reason} for {response.request.method} {response.url}"
+                                                     )
+
+            # Expose Response to the Caller for further Inspection (Headers, Status Code)
+            result.response = response
+        except requests.RequestException as e:
+            # Network Error
+            result = subprocess.CompletedProcess(args=args,
+                                                 returncode=1,
+                                                 stdout="",
+                                                 stderr=str(e)
+                                                 )
+            result.response = None
+
+        # Return Result
+        return result
+
+    # Get Manifest Hash
+    # Returns the same Tuple as SyncRegistries.get_manifest_hash() so that it can be used as a drop-in Backend
+    def get_manifest_hash(self,
+                          full_artifact_reference: str
+                          ) -> (str, subprocess.CompletedProcess, int):
+
+        # Description of the Request (used as "args" of the Result)
+        args = ["HEAD", full_artifact_reference]
+
+        try:
+            # Query Manifest
+            response = self.head_manifest(full_artifact_reference)
+
+            # Get Digest from Header
+            hash_value = response.headers.get("Docker-Content-Digest", "")
+
+            if response.ok and hash_value == "":
+                # Registry did not return the Digest: retrieve the Manifest and compute it
+                response = self.get_manifest(full_artifact_reference)
+                if response.ok:
+                    hash_value = "sha256:" + hashlib.sha256(response.content).hexdigest()
+
+            if response.ok:
+                result = subprocess.CompletedProcess(args=args,
+                                                     returncode=0,
+                                                     stdout=hash_value + "\n",
+                                                     stderr=""
+                                                     )
+            else:
+                result = subprocess.CompletedProcess(args=args,
+                                                     returncode=1,
+                                                     stdout="",
+                                                     stderr=f"HTTP {response.status_code} {response.reason} for {full_artifact_reference}"
+                                                     )
+
+                hash_value = ""
+
+            # Expose Response to the Caller for further Inspection (Headers, Status Code)
+            result.response = response
+        except requests.RequestException as e:
+            # Network Error
+            result = subprocess.CompletedProcess(args=args,
+                                                 returncode=1,
+                                                 stdout="",
+                                                 stderr=str(e)
+                                                 )
+            result.response = None
+            hash_value = ""
+
+        # Return Result
+        return (hash_value, result, result.returncode)
@@ -0,0 +1,131 @@
+# Hash Library
+import hashlib
+
+# Random Library
+import random
+
+
+class SlotScheduler:
+    # Class Constructor
+    def __init__(self,
+                 interval: int,
+                 run_period: int
+                 ) -> None:
+
+        # Every Image is checked once per Interval
+        self.interval = max(1, int(interval))
+
+        # Expected Time between two Runs (e.g. the Cron Period)
+        self.run_period = max(1, int(run_period))
+
+    # Get the stable Phase of an Image within the Interval
+    # The Phase only depends on the Reference, so the Check Times of all Images are evenly spread and do not change between Runs
+    def get_phase(self,
+                  reference: str,
+                  interval: int | None = None
+                  ) -> int:
+
+        digest = hashlib.sha256(reference.encode("UTF-8")).digest()
+
+        # Return Value
+        return int.from_bytes(digest[0:8], "big") % (interval or self.interval)
+
+    # Get the Slot (Number of the Interval) a Timestamp belongs to for a given Image
+    def get_slot(self,
+                 reference: str,
+                 timestamp: int,
+                 interval: int | None = None
+                 ) -> int:
+
+        return (int(timestamp) - self.get_phase(reference, interval)) // (interval or self.interval)
+
+    # Check if an Image is due
+    # An Image is due once a Slot Boundary has been crossed since its last Check.
+    # Late or deferred Checks do not shift the Boundaries, so the Schedule never drifts.
+    # The Interval of each Image defaults to the global Interval
+    def is_due(self,
+               reference: str,
+               last_check: int | None,
+               now: int,
+               interval: int | None = None
+               ) -> bool:
+
+        if not last_check:
+            # Never checked before
+            return True
+
+        # Return Value
+        return self.get_slot(reference, now, interval) > self.get_slot(reference, last_check, interval)
+
+    # Get the Time at which an Image will be due next
+    def get_next_check(self,
+                       reference: str,
+                       last_check: int | None,
+                       interval: int | None = None
+                       ) -> int:
+
+        if not last_check:
+            # Never checked before
+            return 0
+
+        # Return Value
+        return (self.get_slot(reference, last_check, interval) + 1) * (interval or self.interval) + self.get_phase(reference, interval)
+
+    # Get the expected Number of due Images for a Run
+    def get_planned_load(self,
+                         count: int,
+                         elapsed: int | None = None,
+                         intervals: list[int] | None = None
+                         ) -> float:
+
+        if elapsed is None:
+            elapsed = self.run_period
+
+        # Each Image is due with a Probability depending on its own Interval
+        if intervals is not None:
+            return sum(min(1.0, max(0, elapsed) / interval) for interval in intervals)
+
+        # Return Value
+        return count * min(1.0, max(0, elapsed) / self.interval)
+
+
+class RandomScheduler(SlotScheduler):
+    # Class Constructor
+    def __init__(self,
+                 interval: int,
+                 run_period: int,
+                 random_offset_max: int
+                 ) -> None:
+
+        # Initialize Parent
+        super().__init__(interval=interval, run_period=run_period)
+
+        # Maximum random Offset added to the Time since the last Check
+        self.random_offset_max = max(0, int(random_offset_max))
+
+    # Check if an Image is due (legacy Behaviour: random Offset added to the Time since the last Check)
+    def is_due(self,
+               reference: str,
+               last_check: int | None,
+               now: int,
+               interval: int | None = None
+               ) -> bool:
+
+        # Compute delta Time since last Check
+        delta_time_last_check = int(now) - int(last_check or 0)
+
+        # Add some Randomization in order to avoid to Synchronize the entire Block at once
+        random_offset = random.randint(0, self.random_offset_max)
+
+        # Return Value
+        return delta_time_last_check + random.randint(0, random_offset) > (interval or self.interval)
+
+    # Get the Time at which an Image will be due next (same Distribution as is_due())
+    def get_next_check(self,
+                       reference: str,
+                       last_check: int | None,
+                       interval: int | None = None
+                       ) -> int:
+
+        # Return Value
+        return int(last_check or 0) + (interval or self.interval) - random.randint(0, random.randint(0, self.random_offset_max))
@@ -0,0 +1,274 @@
+# Subprocess Python Module
+import subprocess
+
+# Base64 Library (encode Commands sent to the Worker)
+import base64
+
+# Shell Quoting Library
+import shlex
+
+# Threading Library
+import threading
+
+# Queue Library (Pool of idle Sessions)
+import queue
+
+# OS Library
+import os
+
+# Useful Material
+# Each Command is sent to the Worker as one Line containing the base64-encoded Shell Command.
+# The Worker answers with a Header Line "__RESULT__ <returncode> <stdout bytes> <stderr bytes>"
+# followed by the raw Standard Output and Standard Error of the Command.
+
+# Marker of the Header Line returned by the Worker
+RESULT_MARKER = b"__RESULT__"
+
+# Shell Script executed inside the Tools Container
+# Only relies on POSIX sh, mktemp, base64, wc and cat (available in both the Debian and Alpine Images)
+WORKER_SCRIPT = r'''
+while IFS= read -r line; do
+    out=$(mktemp)
+    err=$(mktemp)
+    eval "$(printf '%s' "$line" | base64 -d)" </dev/null >"$out" 2>"$err"
+    rc=$?
+    printf '__RESULT__ %d %d %d\n' "$rc" "$(($(wc -c <"$out")))" "$(($(wc -c <"$err")))"
+    cat "$out" "$err"
+    rm -f "$out" "$err"
+done
+'''
+
+# Commands that only read from the Registries and can safely be sent again if the Worker died while running them
+# (Tool, Subcommand, ...) without Options
+IDEMPOTENT_COMMANDS = [("regctl", "manifest", "head"),
+                       ("regctl", "manifest", "get"),
+                       ("regctl", "repo", "ls"),
+                       ("regctl", "tag", "ls"),
+                       ("regctl", "version"),
+                       ("skopeo", "inspect"),
+                       ("skopeo", "list-tags"),
+                       ("skopeo", "--version"),
+                       ("crane", "digest"),
+                       ("crane", "manifest"),
+                       ("crane", "ls"),
+                       ("crane", "version"),
+                       ]
+
+
+# Check if a Command only reads from the Registries (e.g. "regctl manifest head") and may be run again
+def is_idempotent(args: list[str]) -> bool:
+    if len(args) == 0:
+        return False
+
+    # Name of the Tool followed by the Subcommands (Options are ignored, except for "--version")
+    words = tuple([os.path.basename(args[0])] + [arg for arg in args[1:] if not arg.startswith("-") or arg == "--version"])
+
+    # Return Result
+    return any(words[0:len(command)] == command for command in IDEMPOTENT_COMMANDS)
+
+
+class ToolSession:
+    # Class Constructor
+    def __init__(self,
+                 exec_prefix: list[str],
+                 timeout: float | None = None
+                 ) -> None:
+
+        # Command used to enter the Container, e.g. ["podman", "exec", "-i", "container-registry-tools"]
+        self.exec_prefix = exec_prefix
+
+        # Maximum Number of Seconds to wait for the Result of a Command (None waits forever)
+        # A Worker that does not answer in Time is killed and replaced by a new one
+        self.timeout = timeout if timeout else None
+
+        # Worker Process (lazily started)
+        self.process = None
+
+        # Lock to make sure that only one Command is in Flight for this Session
+        self.lock = threading.Lock()
+
+    # Start the Worker Process
+    def start(self) -> None:
+        command = self.exec_prefix.copy()
+        command.extend(["sh", "-c", WORKER_SCRIPT])
+
+        self.process = subprocess.Popen(command,
+                                        stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE,
+                                        stderr=subprocess.DEVNULL
+                                        )
+
+    # Stop the Worker Process
+    def close(self) -> None:
+        if self.process is not None:
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=5)
+            except Exception:
+                self.process.kill()
+
+            self.process = None
+
+    # Check if the Worker Process is running
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    # Read exactly the requested Number of Bytes from the Worker
+    def read_exactly(self,
+                     size: int
+                     ) -> bytes:
+
+        # Declare Buffer
+        data = b""
+
+        while len(data) < size:
+            chunk = self.process.stdout.read(size - len(data))
+
+            if chunk == b"":
+                raise EOFError("Tool Session terminated unexpectedly")
+
+            data += chunk
+
+        # Return Result
+        return data
+
+    # Send one Command and wait for its Result
+    # Raises BrokenPipeError if the Command could not be sent (the Worker did not run it) and EOFError / TimeoutError if no Result was received
+    def execute(self,
+                args: list[str]
+                ) -> subprocess.CompletedProcess:
+
+        # Start Worker if needed
+        if not self.is_alive():
+            self.start()
+
+        # Encode Command
+        line = base64.b64encode(shlex.join(args).encode("UTF-8")) + b"\n"
+
+        # Send Command
+        self.process.stdin.write(line)
+        self.process.stdin.flush()
+
+        # Kill the Worker if the Result does not arrive in Time (the blocking Reads below then return EOF)
+        watchdog = None
+        expired = threading.Event()
+
+        if self.timeout is not None:
+            process = self.process
+
+            def expire() -> None:
+                expired.set()
+                process.kill()
+
+            watchdog = threading.Timer(self.timeout, expire)
+            watchdog.daemon = True
+            watchdog.start()
+
+        try:
+            return self.read_result(args)
+        except EOFError:
+            if expired.is_set():
+                raise TimeoutError(f"Tool Session did not answer within {self.timeout} Seconds")
+
+            raise
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+
+    # Read the Result of a Command from the Worker
+    def read_result(self,
+                    args: list[str]
+                    ) -> subprocess.CompletedProcess:
+
+        # Read Header
+        header = self.process.stdout.readline()
+
+        if not header.startswith(RESULT_MARKER):
+            raise EOFError(f"Tool Session returned an invalid Header: {header!r}")
+
+        _, returncode, stdout_size, stderr_size = header.split()
+
+        # Read Output
+        stdout = self.read_exactly(int(stdout_size))
+        stderr = self.read_exactly(int(stderr_size))
+
+        # Return Result
+        return subprocess.CompletedProcess(args=args,
+                                           returncode=int(returncode),
+                                           stdout=stdout.decode("UTF-8", errors="replace"),
+                                           stderr=stderr.decode("UTF-8", errors="replace")
+                                           )
+
+    # Run a Command
+    # If the Worker died, it is restarted and the Command is sent again only if the Worker did not receive it or if the Command is idempotent
+    # Otherwise the Error is returned as a failed Result (the Command might have been partially executed)
+    def run(self,
+            args: list[str]
+            ) -> subprocess.CompletedProcess:
+
+        with self.lock:
+            try:
+                return self.execute(args)
+            except (EOFError, TimeoutError, OSError) as e:
+                # Replace the Worker
+                self.close()
+
+                # BrokenPipeError: the Worker was already gone when the Command was sent
+                if not (isinstance(e, BrokenPipeError) or is_idempotent(args)):
+                    return subprocess.CompletedProcess(args=args,
+                                                       returncode=1,
+                                                       stdout="",
+                                                       stderr=f"Tool Session failed while running {shlex.join(args)}: {e}"
+                                                       )
+
+            try:
+                return self.execute(args)
+            except (EOFError, TimeoutError, OSError) as e:
+                # Do not keep a broken Worker
+                self.close()
+
+                return subprocess.CompletedProcess(args=args,
+                                                   returncode=1,
+                                                   stdout="",
+                                                   stderr=f"Tool Session failed while running {shlex.join(args)}: {e}"
+                                                   )
+
+
+class ToolSessionPool:
+    # Class Constructor
+    def __init__(self,
+                 exec_prefix: list[str],
+                 size: int = 4,
+                 timeout: float | None = None
+                 ) -> None:
+
+        # Idle Sessions
+        # Most recently used Session first, so that Workers are only started when Commands actually run concurrently
+        self.sessions = queue.LifoQueue()
+
+        # All Sessions (used to close them)
+        self.all_sessions = []
+
+        for _ in range(max(1, size)):
+            session = ToolSession(exec_prefix=exec_prefix, timeout=timeout)
+            self.sessions.put(session)
+            self.all_sessions.append(session)
+
+    # Run a Command on the next idle Session
+    def run(self,
+            args: list[str]
+            ) -> subprocess.CompletedProcess:
+
+        # Wait for an idle Session
+        session = self.sessions.get()
+
+        try:
+            return session.run(args)
+        finally:
+            # Give Session back to the Pool
+            self.sessions.put(session)
+
+    # Close all Sessions
+    def close(self) -> None:
+        for session in self.all_sessions:
+            session.close()
@@ -0,0 +1,110 @@
+# Threading Library
+import threading
+
+# Typing
+from typing import Any, Iterable
+
+# Native Registry Client
+from docker_sync_registries.registry import parse_reference
+
+# Destination Inventory
+from docker_sync_registries.inventory import InventoryWalker
+
+
+class DestinationSnapshot:
+    # Class Constructor
+    def __init__(self,
+                 ttl: int = 86400
+                 ) -> None:
+
+        # Cached Digests are trusted for this many Seconds
+        self.ttl = ttl
+
+        # Cached Digests keyed by Repository, then by Tag: [Digest, Timestamp of the Check]
+        self.digests = dict()
+
+        # Tags listed in this Run, keyed by Repository
+        self.tags = dict()
+
+        # Lock protecting the Snapshot
+        self.lock = threading.Lock()
+
+        # Statistics
+        self.stats = dict(Lists=0, Cached=0, Missing=0, Unknown=0)
+
+    # Load cached Digests of previous Runs
+    def load(self,
+             data: dict[str, dict[str, list[Any]]]
+             ) -> None:
+
+        with self.lock:
+            self.digests = {repository: dict(tags) for repository, tags in data.items()}
+
+    # Dump cached Digests
+    def dump(self) -> dict[str, dict[str, list[Any]]]:
+        with self.lock:
+            return {repository: dict(tags) for repository, tags in self.digests.items()}
+
+    # List the Tags of the given Repositories (one tags/list Request per Repository)
+    def refresh(self,
+                walker: InventoryWalker,
+                repositories: Iterable[str]
+                ) -> None:
+
+        for repository, tags in walker.walk(sorted(set(repositories))):
+            with self.lock:
+                self.stats["Lists"] += 1
+                self.tags[repository] = set(tags)
+
+                # Forget Digests of Tags that do not exist anymore
+                cached = self.digests.get(repository, dict())
+                for tag in [tag for tag in cached if tag not in self.tags[repository]]:
+                    del cached[tag]
+
+    # Lookup the Digest of a Destination Image
+    # Returns ("missing", None) if the Tag does not exist, ("cached", Digest) if a fresh Digest is known, ("unknown", None) otherwise
+    def lookup(self,
+               full_artifact_reference: str,
+               now: int
+               ) -> tuple[str, str | None]:
+
+        # Split Reference
+        _, repository, tag = parse_reference(full_artifact_reference)
+
+        with self.lock:
+            tags = self.tags.get(repository)
+
+            if tags is None:
+                # Repository was not listed
+                self.stats["Unknown"] += 1
+                return ("unknown", None)
+
+            if tag not in tags:
+                self.stats["Missing"] += 1
+                return ("missing", None)
+
+            digest, checked_at = self.digests.get(repository, dict()).get(tag, [None, 0])
+
+            if digest is not None and now - checked_at <= self.ttl:
+                self.stats["Cached"] += 1
+                return ("cached", digest)
+
+            # Digest unknown or stale
+            self.stats["Unknown"] += 1
+            return ("unknown", None)
+
+    # Store the Digest of a Destination Image (after a HEAD Request or a Transfer)
+    def update(self,
+               full_artifact_reference: str,
+               digest: str,
+               now: int
+               ) -> None:
+
+        # Split Reference
+        _, repository, tag = parse_reference(full_artifact_reference)
+
+        with self.lock:
+            self.digests.setdefault(repository, dict())[tag] = [digest, now]
+
+            if repository in self.tags:
+                self.tags[repository].add(tag)
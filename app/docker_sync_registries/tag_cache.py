@@ -0,0 +1,171 @@
+# Threading Library
+import threading
+
+# Typing
+from typing import Any
+
+# Native Registry Client
+from docker_sync_registries.registry import RegistryClient
+
+# Destination Inventory (Errors)
+from docker_sync_registries.inventory import InventoryError
+
+
+class TagListCache:
+    # Class Constructor
+    def __init__(self,
+                 client: RegistryClient,
+                 ttl: int = 21600,
+                 page_size: int = 1000
+                 ) -> None:
+
+        # Native Registry Client
+        self.client = client
+
+        # Tag Lists are trusted for this many Seconds, then revalidated
+        self.ttl = ttl
+
+        # Number of Tags requested per Page
+        self.page_size = page_size
+
+        # Cached Tag Lists keyed by "Registry/Repository": Tags, ETag and Time of the last Validation
+        self.entries = dict()
+
+        # Whether the Cache must be written back
+        self.dirty = False
+
+        # Lock protecting the Cache
+        self.lock = threading.Lock()
+
+        # Statistics
+        self.stats = dict(Cached=0, Revalidated=0, Fetched=0, Failed=0)
+
+    # Load cached Tag Lists of previous Runs
+    def load(self,
+             data: dict[str, dict[str, Any]]
+             ) -> None:
+
+        with self.lock:
+            self.entries = dict(data)
+
+    # Dump cached Tag Lists
+    def dump(self) -> dict[str, dict[str, Any]]:
+        with self.lock:
+            return dict(self.entries)
+
+    # Check if any cached Tag List must be revalidated
+    def is_expired(self,
+                   now: int
+                   ) -> bool:
+
+        with self.lock:
+            return any(now - entry["CheckedAt"] >= self.ttl for entry in self.entries.values())
+
+    # Forget the Tag Lists of Repositories that are not used anymore
+    def prune(self,
+              keys: set[str]
+              ) -> None:
+
+        with self.lock:
+            for key in [key for key in self.entries if key not in keys]:
+                del self.entries[key]
+                self.dirty = True
+
+    # Get the Tags of a Repository (cached)
+    def get_tags(self,
+                 registry: str,
+                 repository: str,
+                 now: int
+                 ) -> list[str]:
+
+        key = f"{registry}/{repository}"
+
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is not None and now - entry["CheckedAt"] < self.ttl:
+                self.stats["Cached"] += 1
+                return entry["Tags"]
+
+        try:
+            tags, etag = self.fetch(registry, repository, entry.get("ETag") if entry is not None else None)
+        except Exception as e:
+            with self.lock:
+                self.stats["Failed"] += 1
+
+            if entry is None:
+                raise
+
+            # Keep using the previous Tag List until the Registry is available again
+            print(f"[WARNING] Listing Tags of {key} failed. Use the Tag List validated {now - entry['CheckedAt']} Seconds ago.")
+            print(e)
+
+            return entry["Tags"]
+
+        with self.lock:
+            if tags is None:
+                # Not modified since the previous Listing
+                self.stats["Revalidated"] += 1
+                tags = entry["Tags"]
+            else:
+                self.stats["Fetched"] += 1
+
+            self.entries[key] = dict(Tags=tags, ETag=etag, CheckedAt=now)
+            self.dirty = True
+
+        # Return Result
+        return tags
+
+    # List all Tags of a Repository (following the "Link" Header)
+    # Returns (None, ETag) if the Tag List did not change since the given ETag
+    def fetch(self,
+              registry: str,
+              repository: str,
+              etag: str | None = None
+              ) -> tuple[list[str] | None, str | None]:
+
+        # Declare List
+        tags = []
+
+        # First Page
+        path = f"/v2/{repository}/tags/list"
+        params = {"n": self.page_size}
+        headers = {"If-None-Match": etag} if etag is not None else None
+
+        # ETag of the Tag List (only meaningful if it fits in a single Page)
+        new_etag = None
+
+        while path is not None:
+            response = self.client.request("GET",
+                                           registry,
+                                           path,
+                                           headers=headers,
+                                           params=params,
+                                           scope=f"repository:{repository}:pull"
+                                           )
+
+            if response.status_code == 304:
+                return (None, etag)
+
+            if response.status_code == 404:
+                # Repository does not exist
+                return ([], None)
+
+            if not response.ok:
+                raise InventoryError(f"HTTP {response.status_code} {response.reason} for {response.url}")
+
+            # Tags might be null for empty Repositories
+            tags.extend(response.json().get("tags") or [])
+
+            # Next Page (the Link already contains all Query Parameters)
+            next_path = response.links.get("next", dict()).get("url")
+
+            if next_path is None and path == f"/v2/{repository}/tags/list":
+                new_etag = response.headers.get("ETag")
+
+            path = next_path
+            params = None
+            headers = None
+
+        # Return Result
+        return (tags, new_etag)
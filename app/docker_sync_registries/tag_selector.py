@@ -0,0 +1,160 @@
+# Regular Expressions Library
+import re
+
+# Typing
+from typing import Any, Callable
+
+# Settings of a Tag Selector in the Configuration Files
+TAG_SELECTOR_KEYS = ["regex", "semver", "newest"]
+
+# Tags following Semantic Versioning (e.g. "1.25.3", "v2.10.2", "1.25.3-alpine")
+VERSION_PATTERN = re.compile(r"^v?(\d+)\.(\d+)\.(\d+)([-+].+)?$")
+
+# Comparator of a Semantic Versioning Range (e.g. ">=1.24", "<2", "^1.2.3", "~1.25", "1.25.x")
+COMPARATOR_PATTERN = re.compile(r"^(>=|<=|>|<|==|=|!=|\^|~)?v?(\d+)(?:\.(\d+|x|\*))?(?:\.(\d+|x|\*))?$")
+
+
+# Parse the Version of a Tag
+# Returns ((Major, Minor, Patch), Suffix) or None if the Tag does not follow Semantic Versioning
+def parse_version(tag: str) -> tuple[tuple[int, int, int], str | None] | None:
+    match = VERSION_PATTERN.match(tag)
+
+    if match is None:
+        return None
+
+    # Return Result
+    return ((int(match.group(1)), int(match.group(2)), int(match.group(3))), match.group(4))
+
+
+# Sort Key ordering Tags by Version first, then naturally (e.g. "1.9.0" < "v1.10.0")
+# Pre-Releases and Variants (e.g. "1.10.0-rc1") come before the Release of the same Version, Build Metadata ("+build.5") after it
+def version_key(tag: str) -> tuple[tuple[int, int, int], int, tuple[tuple[int, int, str], ...]]:
+    version = parse_version(tag)
+
+    return (version[0] if version is not None else (-1, -1, -1),
+            0 if version is not None and version[1] is not None and version[1].startswith("-") else 1,
+            tuple((0, int(part), "") if part.isdigit() else (1, 0, part) for part in re.findall(r"\d+|\D+", tag)))
+
+
+# Parse a Semantic Versioning Range into a List of Predicates (all of them must match)
+# Comparators are separated by Commas or Spaces, e.g. ">=1.24, <2"
+def parse_semver_range(text: str) -> list[Callable[[tuple[int, int, int]], bool]]:
+    # Declare List
+    predicates = []
+
+    for comparator in re.split(r"[,\s]+", str(text).strip()):
+        if comparator in ["", "*", "x"]:
+            continue
+
+        match = COMPARATOR_PATTERN.match(comparator)
+        if match is None:
+            raise ValueError(f"Invalid Semantic Versioning Comparator {comparator}")
+
+        operator = match.group(1) or ""
+
+        # Number of Parts given explicitly (Wildcards and missing Parts match anything)
+        parts = [part for part in match.group(2, 3, 4) if part is not None and part not in ["x", "*"]]
+        version = tuple(int(part) for part in parts) + (0,) * (3 - len(parts))
+
+        if operator in ["", "=", "=="]:
+            # Prefix Match, e.g. "1.25" or "1.25.x" matches all 1.25.* Versions
+            predicates.append(lambda v, prefix=version[0:len(parts)]: v[0:len(prefix)] == prefix)
+        elif operator == "!=":
+            predicates.append(lambda v, prefix=version[0:len(parts)]: v[0:len(prefix)] != prefix)
+        elif operator == ">=":
+            predicates.append(lambda v, version=version: v >= version)
+        elif operator == ">":
+            predicates.append(lambda v, version=version: v > version)
+        elif operator == "<=":
+            predicates.append(lambda v, version=version: v <= version)
+        elif operator == "<":
+            predicates.append(lambda v, version=version: v < version)
+        else:
+            # "^": same left-most non-zero Part, "~": same Minor Version (or Major if only the Major Version is given)
+            if operator == "^":
+                index = next((index for index, part in enumerate(version[0:max(1, len(parts))]) if part != 0), max(0, len(parts) - 1))
+            else:
+                index = 0 if len(parts) == 1 else 1
+
+            upper = version[0:index] + (version[index] + 1,) + (0,) * (2 - index)
+            predicates.append(lambda v, lower=version, upper=upper: lower <= v < upper)
+
+    # Return Result
+    return predicates
+
+
+class TagSelector:
+    # Class Constructor
+    def __init__(self,
+                 regex: str | None = None,
+                 semver: str | None = None,
+                 newest: int | None = None
+                 ) -> None:
+
+        # Tags must match this Regular Expression entirely
+        try:
+            self.regex = re.compile(str(regex)) if regex is not None else None
+        except re.error as e:
+            raise ValueError(f"Invalid Regular Expression {regex}: {e}")
+
+        # Tags must follow Semantic Versioning and be within this Range
+        self.semver = parse_semver_range(semver) if semver is not None else None
+
+        # Only keep the newest N matching Tags
+        self.newest = int(newest) if newest is not None else None
+
+        if self.newest is not None and self.newest < 1:
+            raise ValueError(f"Invalid Number of newest Tags {newest}")
+
+    # Create a Tag Selector from its Definition in the Configuration Files, e.g. {"semver": ">=1.24", "newest": 3}
+    @classmethod
+    def from_config(cls,
+                    definition: dict[str, Any]
+                    ) -> "TagSelector":
+
+        unknown = [key for key in definition if key not in TAG_SELECTOR_KEYS]
+        if len(unknown) > 0:
+            raise ValueError(f"Unknown Setting(s) {', '.join(map(str, unknown))} (supported: {', '.join(TAG_SELECTOR_KEYS)})")
+
+        if len(definition) == 0:
+            raise ValueError("Empty Tag Selector")
+
+        # Return Result
+        return cls(**definition)
+
+    # Check if a Tag matches
+    def matches(self,
+                tag: str
+                ) -> bool:
+
+        if self.regex is not None and self.regex.fullmatch(tag) is None:
+            return False
+
+        if self.semver is not None or self.regex is None:
+            version = parse_version(tag)
+
+            if version is None:
+                return False
+
+            # Variants (e.g. "1.25.3-alpine") must be selected explicitly using a Regular Expression
+            if version[1] is not None and self.regex is None:
+                return False
+
+            if self.semver is not None and not all(predicate(version[0]) for predicate in self.semver):
+                return False
+
+        # Return Value
+        return True
+
+    # Select the matching Tags (oldest Version first)
+    def select(self,
+               tags: list[str]
+               ) -> list[str]:
+
+        selected = sorted((tag for tag in set(tags) if self.matches(tag)), key=version_key)
+
+        if self.newest is not None:
+            selected = selected[-self.newest:]
+
+        # Return Result
+        return selected
@@ -2,12 +2,12 @@
 import yaml
 from yaml.loader import SafeLoader
 
+# Use the (much faster) C Loader of PyYAML if available
+YAML_LOADER = getattr(yaml, "CSafeLoader", SafeLoader)
+
 # Python Module to Load .env Files and set Environment Parameters
 from dotenv import dotenv_values
 
-# Pandas
-import pandas as pd
-
 # OS Library
 import os
 
@@ -21,13 +21,10 @@ import sys
 import glob
 
 # Typing
-from typing import Any
+from typing import Any, Callable, Iterator
 
-# Random Number Generator Library
-import random
-
-# Import IPython to Display
-from IPython.display import display
+# Context Manager Library
+from contextlib import contextmanager
 
 # Subprocess Python Module
 # from subprocess import Popen, PIPE, run
@@ -40,6 +37,79 @@ from datetime import datetime
 # JSON Module
 import json
 
+# Hash Library (compute the Digest of filtered Indexes if the Registry does not return it)
+import hashlib
+
+# Signal Handling Library
+import signal
+
+# Threading Library
+import threading
+
+# Concurrent Futures Library
+from concurrent.futures import Future
+
+# Time Library
+import time
+
+# Python Module to perform HTTP Requests
+import requests
+
+# Native Registry Client
+from docker_sync_registries.registry import RegistryClient, parse_list, parse_reference, completed_process_from_response
+
+# Concurrency Helpers
+from docker_sync_registries.concurrency import RegistryExecutor, parse_limits, get_registry
+
+# Rate Limit Budget Tracker
+from docker_sync_registries.ratelimit import RateLimitTracker
+
+# Persistent Sessions inside the Tools Container
+from docker_sync_registries.session import ToolSessionPool
+
+# SQLite State Store
+from docker_sync_registries.database import StateStore, replay_journal
+
+# Incremental Checkpoints
+from docker_sync_registries.checkpoint import CheckpointWriter
+
+# Cache of parsed Configuration Files
+from docker_sync_registries.config_cache import ConfigCache
+
+# Check Scheduler
+from docker_sync_registries.scheduler import SlotScheduler, RandomScheduler
+
+# Adaptive Interval of each Image
+from docker_sync_registries.intervals import IntervalEstimator, update_digest_history
+
+# Native Image Copy
+from docker_sync_registries.copier import ImageCopier
+
+# Tag Selectors & cached Tag Lists
+from docker_sync_registries.tag_selector import TagSelector
+from docker_sync_registries.tag_cache import TagListCache
+
+# Platform Filtering
+from docker_sync_registries.platforms import parse_platforms, get_platform_digests, select_platform_digests, filter_index
+
+# Destination Inventory
+from docker_sync_registries.inventory import InventoryWalker, CommandInventoryWalker, InventoryError
+
+# Destination Snapshot
+from docker_sync_registries.snapshot import DestinationSnapshot
+
+# Prometheus Metrics
+from docker_sync_registries.metrics import Metrics
+
+# Trace & Profiling
+from docker_sync_registries.profiling import Tracer, ThreadProfiler
+
+# Retries & Circuit Breaker of each Registry
+from docker_sync_registries.health import RegistryHealth, classify_result, get_retry_after
+
+# Mirror Selection
+from docker_sync_registries.mirrors import MirrorSelector, parse_mirrors, DOCKER_HUB_DEFAULT_MIRROR
+
 # Useful Material
 # https://about.gitlab.com/blog/2020/11/18/docker-hub-rate-limit-monitoring/
 # https://gitlab.com/gitlab-da/unmaintained/check-docker-hub-limit/-/blob/main/check_docker_hub_limit.py?ref_type=heads
@@ -47,6 +117,9 @@ import json
 # Lock File
 LOCK_FILE = "/var/run/sync-registries.lock"
 
+# Interval in Seconds between two Checks of the Lock File while waiting for another Run
+LOCK_POLL_INTERVAL = 10
+
 # Applications Commands
 # Default System Paths
 COMMAND_PODMAN = ["podman"]
@@ -75,6 +148,15 @@ CONFIG_KEYS = [
                "LOCAL_APPS_CONTAINER_NAME",
                "LOCAL_APPS_CONTAINER_ENGINE",
 
+               # Keep long-lived Worker Sessions inside the Container instead of running one "exec" per Command
+               "LOCAL_APPS_PERSISTENT_SESSION",
+
+               # Number of long-lived Worker Sessions (maximum Number of Commands running at the same Time inside the Container)
+               "LOCAL_APPS_SESSION_POOL_SIZE",
+
+               # Kill and replace a Worker Session that does not return the Result of a Command within this many Seconds (0 = wait forever)
+               "LOCAL_APPS_SESSION_TIMEOUT",
+
                # Settings for when running APPs Locally
                "LOCAL_APPS_REGCTL_PATH",
                "LOCAL_APPS_REGSYNC_PATH",
@@ -96,27 +178,204 @@ CONFIG_KEYS = [
                # - "skopeo" (default)
                # - "regctl"
                # - "crane"
+               # - "native": built-in Copy mounting Blobs already stored in another Repository of the Destination Registry
                "SYNC_TOOL",
 
+               # Only synchronize these Platforms of multi-platform Images (Comma-Separated List, e.g. "linux/amd64,linux/arm64")
+               # Empty (default) synchronizes all Platforms. Can be overridden for each Registry / Image using "platforms" in the Configuration Files
+               "SYNC_PLATFORMS",
+
                # SYNC INTERVAL
                "SYNC_INTERVAL",
 
                # SYNC_RANDOM_OFFSET_MAX
                "SYNC_RANDOM_OFFSET_MAX",
 
+               # Scheduler deciding which Images are checked in a Run
+               # Options are:
+               # - "slot" (default): each Image gets a stable Slot within SYNC_INTERVAL (evenly spread Load)
+               # - "random": legacy random Offset (SYNC_RANDOM_OFFSET_MAX)
+               "SYNC_SCHEDULER",
+
+               # Expected Time between two Runs in Seconds (e.g. the Cron Period)
+               "SYNC_RUN_PERIOD",
+
+               # Adapt the Interval of each Image to the observed Frequency of its Digest Changes (overridden by "interval" in the Configuration Files)
+               "SYNC_INTERVAL_ADAPTIVE",
+
+               # Bounds of the adaptive Interval of moving Tags (e.g. "latest") in Seconds
+               "SYNC_INTERVAL_MIN",
+               "SYNC_INTERVAL_MAX",
+
+               # Interval in Seconds of Tags that look immutable (e.g. "v2.10.2" or Digests) as long as their Digest never changed
+               "SYNC_INTERVAL_IMMUTABLE",
+
+               # Fraction of the observed Time between two Digest Changes used as Interval
+               "SYNC_INTERVAL_ADAPTIVE_FACTOR",
+
                # ENABLE_DOCKER_HUB_MIRROR
                "ENABLE_DOCKER_HUB_MIRROR",
+
+               # Mirrors of the Upstream Registries in the Form "docker.io=mirror.gcr.io,docker.io=cache.example.com/dockerhub,ghcr.io=..."
+               # The best Mirror serving the same Manifest Digest is used instead of the Upstream Registry
+               "REGISTRY_MIRRORS",
+
+               # Demote a Mirror after this many consecutive failed Transfers ...
+               "MIRROR_FAILURE_THRESHOLD",
+
+               # ... for this many Seconds
+               "MIRROR_DEMOTION_TIME",
+
+               # Define which Backend to use to retrieve Manifest Digests
+               # Options are:
+               # - "native" (default): in-process HTTP Client with Keep-Alive Connections
+               # - "regctl": one "regctl manifest head" Process per Reference
+               "MANIFEST_BACKEND",
+
+               # Comma-Separated List of Registries that must be contacted using plain HTTP (native Backend)
+               "INSECURE_REGISTRIES",
+
+               # Timeout in Seconds for each Request performed by the native Backend
+               "REGISTRY_REQUEST_TIMEOUT",
+
+               # Number of Retries of a Manifest Query failing with a transient Error (429, 5xx, Network Error)
+               "REGISTRY_MAX_RETRIES",
+
+               # Delay in Seconds before the first Retry (doubled for each further Retry) ...
+               "REGISTRY_BACKOFF_BASE",
+
+               # ... up to this many Seconds
+               "REGISTRY_BACKOFF_MAX",
+
+               # Skip all remaining Images of a Registry after this many consecutive failed Manifest Queries ...
+               "CIRCUIT_BREAKER_THRESHOLD",
+
+               # ... for this many Seconds
+               "CIRCUIT_BREAKER_OPEN_TIME",
+
+               # Maximum Number of concurrent Manifest Queries during the Scan (all Registries)
+               "SCAN_WORKERS",
+
+               # Maximum Number of concurrent Manifest Queries for each Registry during the Scan
+               # Format: "docker.io=4,ghcr.io=16,docker.MYDOMAIN.TLD=32"
+               "SCAN_REGISTRY_LIMITS",
+
+               # Maximum Number of concurrent Manifest Queries for Registries not listed in SCAN_REGISTRY_LIMITS
+               "SCAN_REGISTRY_LIMIT_DEFAULT",
+
+               # Maximum Number of concurrent Image Transfers (all Registries)
+               "SYNC_WORKERS",
+
+               # Optional Maximum Number of concurrent Image Transfers for each Source Registry
+               # Format: "docker.io=2,ghcr.io=4"
+               "SYNC_REGISTRY_LIMITS",
+
+               # Number of Docker Hub Pulls to always keep available (e.g. for manual Pulls)
+               "RATELIMIT_RESERVE",
+
+               # Number of Pulls accounted for each Image Transfer
+               "RATELIMIT_PULL_COST",
+
+               # Define which Backend to use to store the Database of previous Runs
+               # Options are:
+               # - "sqlite" (default): db.sqlite with per-Image Updates (an existing db.json is migrated automatically)
+               # - "json": db.json rewritten entirely at the End of each Run
+               "DATABASE_BACKEND",
+
+               # Persist Results after this many scanned / synchronized Images ...
+               "CHECKPOINT_BATCH_SIZE",
+
+               # ... or after this many Seconds, whatever comes first
+               "CHECKPOINT_INTERVAL",
+
+               # Cache the parsed Configuration Files and only parse them again when they change
+               "CONFIG_CACHE",
+
+               # Transfer each Source Manifest Digest only once and tag the other Images sharing it at the Destination
+               "SYNC_DEDUPLICATE",
+
+               # List the Tags of each Destination Repository once per Run and cache the Digests of the Destination Images
+               "DESTINATION_SNAPSHOT",
+
+               # Cached Digests of the Destination Images are trusted for this many Seconds
+               "DESTINATION_SNAPSHOT_TTL",
+
+               # Number of Items requested per Page when listing Repositories & Tags
+               "INVENTORY_PAGE_SIZE",
+
+               # Maximum Number of Tag Lists fetched at the same Time when listing Repositories & Tags
+               "INVENTORY_WORKERS",
+
+               # Tag Lists used to expand Tag Selectors (e.g. {"semver": ">=1.24", "newest": 3}) are cached for this many Seconds, then revalidated
+               "TAG_LIST_CACHE_TTL",
+
+               # Daemon Mode (sync_daemon.py): maximum Number of Images checked in one Batch
+               "DAEMON_BATCH_SIZE",
+
+               # Daemon Mode: minimum Sleep between two Batches in Seconds (Images due in the meantime are grouped)
+               "DAEMON_MIN_SLEEP",
+
+               # Daemon Mode: Delay in Seconds before retrying an Image that could not be checked or synchronized
+               "DAEMON_RETRY_DELAY",
+
+               # Daemon Mode: Interval in Seconds between two Checks for modified Configuration Files
+               "DAEMON_CONFIG_RELOAD_INTERVAL",
+
+               # Daemon Mode: Interval in Seconds between two full Saves of the JSON Database
+               "DAEMON_SAVE_INTERVAL",
+
+               # Daemon Mode: serve Prometheus Metrics on this Port (0 = disabled)
+               "METRICS_PORT",
+
+               # Write Prometheus Metrics to this File after each Run, for the Textfile Collector of node_exporter (empty = disabled)
+               "METRICS_TEXTFILE",
+
+               # Seconds to wait for the Lock File of another Run to be cleared before giving up (0 = do not wait)
+               "LOCK_WAIT_TIMEOUT",
+
+               # Write a Trace of each Phase and external Call to this File (Chrome Trace Event Format, empty = disabled)
+               "PROFILE_OUTPUT",
+
+               # Write cProfile Statistics of all Threads to this File (empty = disabled)
+               "PROFILE_CPROFILE_OUTPUT",
 ]
 
 
-# Auxiliary Function to drop Column from Dataframe if it exists
-def pandas_drop_column_from_dataframe(df: pd.DataFrame,
-                                      column_name: str,
-                                      axis: int = 1,
-                                      inplace: bool = True
-                                      ) -> None:
-    if column_name in df.columns:
-        df.drop(column_name, axis=axis, inplace=inplace)
+# Format a List of Dictionaries as a Text Table (only used for Debug Output)
+def format_table(records: list[dict[str, Any]],
+                 hide_columns: list[str] | None = None,
+                 timestamp_columns: list[str] | None = None
+                 ) -> str:
+
+    # Default Values
+    hide_columns = hide_columns if hide_columns is not None else []
+    timestamp_columns = timestamp_columns if timestamp_columns is not None else []
+
+    # Collect Columns in Order of Appearance
+    columns = []
+    for record in records:
+        for key in record:
+            if key not in columns and key not in hide_columns:
+                columns.append(key)
+
+    # Convert all Values to String
+    rows = []
+    for index, record in enumerate(records):
+        row = [str(index)]
+        for column in columns:
+            value = record.get(column)
+            row.append(unixtimestamp_to_str(value) if column in timestamp_columns else str(value))
+        rows.append(row)
+
+    # Compute Column Widths
+    header = [""] + columns
+    widths = [max(len(line[position]) for line in [header] + rows) for position in range(len(header))]
+
+    # Build Lines
+    lines = ["  ".join(value.ljust(widths[position]) for position, value in enumerate(line)).rstrip() for line in [header] + rows]
+
+    # Return Result
+    return "\n".join(lines)
 
 
 # Remove Quotes
@@ -251,6 +510,24 @@ class SyncRegistries:
         self.database_by_source_reference = dict()
         # self.database_by_destination_reference = dict()
 
+        # Command Prefix used to run APPs inside Container (None if APPs run Locally)
+        self.container_exec_prefix = None
+
+        # Long-lived Worker Sessions inside the Container (None if disabled)
+        self.tool_sessions = None
+
+        # SQLite State Store (lazily opened)
+        self.state_store = None
+
+        # Lock protecting the State File of the JSON Backend
+        self.state_lock = threading.Lock()
+
+        # Prometheus Metrics
+        self.metrics = Metrics()
+
+        # cProfile of all Threads (None if disabled)
+        self.profiler = None
+
         # Set Default Configuration
         self.set_default_config()
 
@@ -260,6 +537,91 @@ class SyncRegistries:
         # Setup External Application Commands if required
         self.setup_external_apps_commands()
 
+        # Trace of each Phase and external Call
+        self.tracer = Tracer(enabled=strip_quotes(str(self.config.get("PROFILE_OUTPUT"))) != "")
+
+        # Setup native Registry Client
+        self.registry_client = RegistryClient(auth_file=self.config.get("REGISTRY_AUTH_FILE"),
+                                              insecure_registries=parse_list(self.config.get("INSECURE_REGISTRIES")),
+                                              timeout=self.config.get("REGISTRY_REQUEST_TIMEOUT"),
+                                              pool_size=self.config.get("SCAN_WORKERS")
+                                              )
+
+        # Setup Cache of the Tag Lists used by Tag Selectors (loaded on first Use)
+        self.tag_lists = TagListCache(client=self.registry_client,
+                                      ttl=self.config.get("TAG_LIST_CACHE_TTL"),
+                                      page_size=self.config.get("INVENTORY_PAGE_SIZE")
+                                      )
+        self.tag_lists_loaded = False
+
+        # Repositories used by Tag Selectors in the current Configuration
+        self.tag_list_keys = set()
+
+        # Platforms synchronized by Default (None synchronizes all Platforms)
+        try:
+            self.platforms = parse_platforms(strip_quotes(str(self.config.get("SYNC_PLATFORMS")))) or None
+        except ValueError as e:
+            # Print Error
+            print(f"[ERROR] Invalid Setting for SYNC_PLATFORMS: {e}")
+            sys.exit(1)
+
+        # Setup Mirrors of the Upstream Registries
+        mirrors = parse_mirrors(self.config.get("REGISTRY_MIRRORS"))
+        if str(self.config.get("ENABLE_DOCKER_HUB_MIRROR")).lower() == "true" and DOCKER_HUB_DEFAULT_MIRROR not in mirrors.get("docker.io", []):
+            mirrors.setdefault("docker.io", []).append(DOCKER_HUB_DEFAULT_MIRROR)
+
+        self.mirrors = MirrorSelector(mirrors=mirrors,
+                                      failure_threshold=self.config.get("MIRROR_FAILURE_THRESHOLD"),
+                                      demotion_time=self.config.get("MIRROR_DEMOTION_TIME")
+                                      )
+
+        # Setup Retries & Circuit Breaker of each Registry
+        self.health = RegistryHealth(max_retries=self.config.get("REGISTRY_MAX_RETRIES"),
+                                     backoff_base=self.config.get("REGISTRY_BACKOFF_BASE"),
+                                     backoff_max=self.config.get("REGISTRY_BACKOFF_MAX"),
+                                     failure_threshold=self.config.get("CIRCUIT_BREAKER_THRESHOLD"),
+                                     open_time=self.config.get("CIRCUIT_BREAKER_OPEN_TIME")
+                                     )
+
+        # Setup Destination Snapshot (one tags/list Request per Destination Repository instead of one HEAD Request per Image)
+        self.destination_snapshot = None
+        if self.config.get("DESTINATION_SNAPSHOT") == "true":
+            self.destination_snapshot = DestinationSnapshot(ttl=self.config.get("DESTINATION_SNAPSHOT_TTL"))
+
+        # Setup native Image Copy (SYNC_TOOL=native)
+        self.copier = ImageCopier(client=self.registry_client)
+
+        # Setup Incremental Checkpoints
+        self.checkpoint = CheckpointWriter(flush_function=self.write_checkpoint,
+                                           batch_size=self.config.get("CHECKPOINT_BATCH_SIZE"),
+                                           interval=self.config.get("CHECKPOINT_INTERVAL")
+                                           )
+
+        # Setup Rate Limit Budget Tracker
+        self.ratelimit = RateLimitTracker(reserve=self.config.get("RATELIMIT_RESERVE"),
+                                          pull_cost=self.config.get("RATELIMIT_PULL_COST")
+                                          )
+
+        # Setup adaptive Interval of each Image
+        self.intervals = IntervalEstimator(default_interval=self.config.get("SYNC_INTERVAL"),
+                                           min_interval=self.config.get("SYNC_INTERVAL_MIN"),
+                                           max_interval=self.config.get("SYNC_INTERVAL_MAX"),
+                                           immutable_interval=self.config.get("SYNC_INTERVAL_IMMUTABLE"),
+                                           factor=self.config.get("SYNC_INTERVAL_ADAPTIVE_FACTOR"),
+                                           enabled=self.config.get("SYNC_INTERVAL_ADAPTIVE") == "true"
+                                           )
+
+        # Setup Check Scheduler
+        if self.config.get("SYNC_SCHEDULER") == "random":
+            self.scheduler = RandomScheduler(interval=self.config.get("SYNC_INTERVAL"),
+                                             run_period=self.config.get("SYNC_RUN_PERIOD"),
+                                             random_offset_max=self.config.get("SYNC_RANDOM_OFFSET_MAX")
+                                             )
+        else:
+            self.scheduler = SlotScheduler(interval=self.config.get("SYNC_INTERVAL"),
+                                           run_period=self.config.get("SYNC_RUN_PERIOD")
+                                           )
+
     # Set Default Configuration
     def set_default_config(self):
         # Set Default DEBUG_LEVEL
@@ -271,16 +633,112 @@ class SyncRegistries:
         # Set Default SYNC_RANDOM_OFFSET_MAX
         self.config.set_if_not_set(key="SYNC_RANDOM_OFFSET_MAX", default_value=int(self.config.get("SYNC_INTERVAL")/1))
 
+        # By Default spread the Checks evenly over SYNC_INTERVAL, assuming hourly Runs
+        self.config.set_if_not_set(key="SYNC_SCHEDULER", default_value="slot")
+        self.config.set_if_not_set(key="SYNC_RUN_PERIOD", default_value=3600)
+
+        # By Default check every Image every SYNC_INTERVAL
+        # If enabled, check moving Tags between every SYNC_INTERVAL and once a Day, and immutable Tags once a Week
+        self.config.set_if_not_set(key="SYNC_INTERVAL_ADAPTIVE", default_value="false")
+        self.config.set_if_not_set(key="SYNC_INTERVAL_MIN", default_value=self.config.get("SYNC_INTERVAL"))
+        self.config.set_if_not_set(key="SYNC_INTERVAL_MAX", default_value=86400)
+        self.config.set_if_not_set(key="SYNC_INTERVAL_IMMUTABLE", default_value=604800)
+        self.config.set_if_not_set(key="SYNC_INTERVAL_ADAPTIVE_FACTOR", default_value=0.05)
+
         # By Default enable Docker Hub Mirror
-        self.config.set_if_not_set(key="ENABLE_DOCKER_HUB_MIRROR", default_value=True)
+        self.config.set_if_not_set(key="ENABLE_DOCKER_HUB_MIRROR", default_value="true")
+
+        # By Default demote a Mirror for one Day after 3 consecutive failed Transfers
+        self.config.set_if_not_set(key="MIRROR_FAILURE_THRESHOLD", default_value=3)
+        self.config.set_if_not_set(key="MIRROR_DEMOTION_TIME", default_value=86400)
 
         # By Default use Skopeo to synchronize Images
         self.config.set_if_not_set(key="SYNC_TOOL", default_value="skopeo")
 
-        # Set Pandas DataFrame Display Properties
-        pd.options.display.max_columns = 99999
-        pd.options.display.max_rows = 99999
-        pd.options.display.width = 4000
+        # By Default synchronize all Platforms
+        self.config.set_if_not_set(key="SYNC_PLATFORMS", default_value="")
+
+        # By Default use the native Registry Client to retrieve Manifest Digests
+        self.config.set_if_not_set(key="MANIFEST_BACKEND", default_value="native")
+
+        # By Default allow each Request of the native Backend to take up to 30 Seconds
+        self.config.set_if_not_set(key="REGISTRY_REQUEST_TIMEOUT", default_value=30)
+
+        # By Default retry transient Errors twice and skip a Registry for one Hour after 5 consecutive Failures
+        self.config.set_if_not_set(key="REGISTRY_MAX_RETRIES", default_value=2)
+        self.config.set_if_not_set(key="REGISTRY_BACKOFF_BASE", default_value=1.0)
+        self.config.set_if_not_set(key="REGISTRY_BACKOFF_MAX", default_value=30.0)
+        self.config.set_if_not_set(key="CIRCUIT_BREAKER_THRESHOLD", default_value=5)
+        self.config.set_if_not_set(key="CIRCUIT_BREAKER_OPEN_TIME", default_value=3600)
+
+        # By Default run up to 32 Manifest Queries at the same Time during the Scan
+        self.config.set_if_not_set(key="SCAN_WORKERS", default_value=32)
+
+        # By Default be gentle with Docker Hub
+        self.config.set_if_not_set(key="SCAN_REGISTRY_LIMITS", default_value="docker.io=4")
+
+        # By Default run up to 8 Manifest Queries at the same Time for any other Registry
+        self.config.set_if_not_set(key="SCAN_REGISTRY_LIMIT_DEFAULT", default_value=8)
+
+        # By Default run up to 4 Image Transfers at the same Time
+        self.config.set_if_not_set(key="SYNC_WORKERS", default_value=4)
+
+        # By Default keep 10 Pulls available for manual Operations
+        self.config.set_if_not_set(key="RATELIMIT_RESERVE", default_value=10)
+
+        # By Default account one Pull per Image Transfer
+        self.config.set_if_not_set(key="RATELIMIT_PULL_COST", default_value=1)
+
+        # By Default store the Database in SQLite
+        self.config.set_if_not_set(key="DATABASE_BACKEND", default_value="sqlite")
+
+        # By Default persist Results every 50 Images or every 10 Seconds
+        self.config.set_if_not_set(key="CHECKPOINT_BATCH_SIZE", default_value=50)
+        self.config.set_if_not_set(key="CHECKPOINT_INTERVAL", default_value=10)
+
+        # By Default cache the parsed Configuration Files
+        self.config.set_if_not_set(key="CONFIG_CACHE", default_value="true")
+
+        # By Default transfer each Source Manifest Digest only once
+        self.config.set_if_not_set(key="SYNC_DEDUPLICATE", default_value="true")
+
+        # By Default query each Destination Image
+        self.config.set_if_not_set(key="DESTINATION_SNAPSHOT", default_value="false")
+        self.config.set_if_not_set(key="DESTINATION_SNAPSHOT_TTL", default_value=86400)
+
+        # Inventory Defaults
+        self.config.set_if_not_set(key="INVENTORY_PAGE_SIZE", default_value=1000)
+        self.config.set_if_not_set(key="INVENTORY_WORKERS", default_value=8)
+
+        # By Default list the Tags used by Tag Selectors again after 6 Hours
+        self.config.set_if_not_set(key="TAG_LIST_CACHE_TTL", default_value=21600)
+
+        # Daemon Mode Defaults
+        self.config.set_if_not_set(key="DAEMON_BATCH_SIZE", default_value=500)
+        self.config.set_if_not_set(key="DAEMON_MIN_SLEEP", default_value=30)
+        self.config.set_if_not_set(key="DAEMON_RETRY_DELAY", default_value=900)
+        self.config.set_if_not_set(key="DAEMON_CONFIG_RELOAD_INTERVAL", default_value=300)
+        self.config.set_if_not_set(key="DAEMON_SAVE_INTERVAL", default_value=3600)
+
+        # By Default do not expose Metrics
+        self.config.set_if_not_set(key="METRICS_PORT", default_value=0)
+        self.config.set_if_not_set(key="METRICS_TEXTFILE", default_value="")
+
+        # By Default skip the Run if another one is in Progress
+        self.config.set_if_not_set(key="LOCK_WAIT_TIMEOUT", default_value=0)
+
+        # By Default do not profile
+        self.config.set_if_not_set(key="PROFILE_OUTPUT", default_value="")
+        self.config.set_if_not_set(key="PROFILE_CPROFILE_OUTPUT", default_value="")
+
+        # By Default use long-lived Worker Sessions when running APPs inside Container
+        self.config.set_if_not_set(key="LOCAL_APPS_PERSISTENT_SESSION", default_value="true")
+
+        # By Default keep as many Worker Sessions as Image Transfers can run at the same Time
+        self.config.set_if_not_set(key="LOCAL_APPS_SESSION_POOL_SIZE", default_value=self.config.get("SYNC_WORKERS"))
+
+        # By Default replace a Worker Session if a Command takes more than one Hour
+        self.config.set_if_not_set(key="LOCAL_APPS_SESSION_TIMEOUT", default_value=3600)
 
     # Configure App
     def configure(self):
@@ -315,6 +773,261 @@ class SyncRegistries:
         # print("Final Application Configuration")
         # pprint.pprint(CONFIG)
 
+    # Parse the Images defined in a Config File
+    # Returns the normalised Images (without registering them in the Object)
+    def parse_images_config(self,
+                            contents: str | bytes,
+                            filepath: str = 'sync.d/main.yml'
+                            ) -> list[dict[str, Any]]:
+
+        # Declare List
+        images = []
+
+        # Open YAML File in Safe Mode
+        # data = yaml.safe_load(f)
+        data = list(yaml.load_all(contents, Loader=YAML_LOADER))
+
+        # Length of list
+        length = len(data)
+
+        # Declare Dictionary for each Image as a Template
+        imageTemplate = dict(Registry="",
+                             Namespace="",
+                             Repository="",
+                             ImageName="",
+                             Tag="",
+                             SourceShortArtifactReference="",
+                             SourceFullArtifactReference="",
+                             TagSelector=None,
+                             Interval=None,
+                             Platforms=None,
+                             LastCheck=0,
+                             LastUpdate=0
+                             )
+
+        # Iterate over list
+        for list_index in range(length):
+            # Get Data of the current Iteration
+            currentdata = data[list_index]
+
+            # Skip empty Documents
+            if currentdata is None:
+                continue
+
+            # Iterate over currentdata
+            for registry_key in currentdata:
+                currentimages = currentdata[registry_key]["images"]
+
+                # Interval between two Checks of all Images of the Registry (optional, Seconds)
+                registry_interval = currentdata[registry_key].get("interval")
+
+                # Platforms of all Images of the Registry (optional, overrides SYNC_PLATFORMS)
+                registry_platforms = currentdata[registry_key].get("platforms")
+
+                # If there are any Images defined
+                if currentimages is not None:
+                    for index_image, im in enumerate(currentimages):
+                        # Debug
+                        if self.config.get("DEBUG_LEVEL") > 3:
+                            print(f"[DEBUG]     [{index_image+1} / {len(currentimages)}] Load Specification for Image {im} under Registry {registry_key}")
+
+                        # Get Tags associated with the current Image
+                        tags = currentimages[im]
+
+                        # Images can also be defined as a Dictionary with the Tags and Settings of the Image, e.g. {"tags": ["latest"], "interval": 600, "platforms": ["linux/amd64"]}
+                        image_interval = registry_interval
+                        image_platforms = registry_platforms
+                        if isinstance(tags, dict):
+                            image_interval = tags.get("interval", registry_interval)
+                            image_platforms = tags.get("platforms", registry_platforms)
+                            tags = tags.get("tags") or []
+
+                        try:
+                            image_platforms = parse_platforms(image_platforms)
+                        except ValueError as e:
+                            # Display Error Message
+                            print(f"[ERROR] Invalid Platforms for Image {im} in {filepath}: {e}. Ignoring Entry.")
+                            continue
+
+                        for index_tag, tag in enumerate(tags):
+                            # Start with the Template Dictionary
+                            # Must use .copy() otherwise all images will point to the LAST image that has been processed !
+                            image = imageTemplate.copy()
+
+                            # Try to exact namespace from registry
+                            registry_parts = registry_key.split("/")
+                            if len(registry_parts) > 1:
+                                # Registry was actually in the form example.com/namespace
+                                # Separate these two
+                                if len(registry_parts) > 2:
+                                    registry = registry_parts[0]
+                                    namespace = "/".join(registry_parts[1:None])
+                                    imname = im
+                                else:
+                                    registry = registry_parts[0]
+                                    namespace = registry_parts[1]
+                                    imname = im
+                            else:
+                                registry = registry_key
+
+                                # Try to determine namespace and image name alternatively
+                                image_parts = im.split("/")
+                                if len(image_parts) > 1:
+                                    if len(image_parts) > 2:
+                                        namespace = "/".join(image_parts[0:-1])
+                                        imname = image_parts[-1]
+                                    else:
+                                        namespace = image_parts[0]
+                                        imname = image_parts[1]
+                                else:
+                                    # Couldn't find Namespace
+                                    # Assume it was "library" (as in Docker Hub)
+                                    namespace = "library"
+                                    imname = im
+
+                            # Tag Selectors (e.g. {"semver": ">=1.24", "newest": 3}) are expanded into Tags each Time the Configuration is loaded
+                            if isinstance(tag, dict):
+                                try:
+                                    TagSelector.from_config(tag)
+                                except (ValueError, TypeError) as e:
+                                    # Display Error Message
+                                    print(f"[ERROR] Invalid Tag Selector {tag} for Image {im} in {filepath}: {e}. Ignoring Entry.")
+                                    continue
+
+                                image["TagSelector"] = tag
+                                tag = ""
+
+                            # Get Full Qualified Artifact Reference (without Tag for Tag Selectors)
+                            fullArtifactReference = registry + "/" + namespace + "/" + imname + (":" + tag if tag != "" else "")
+
+                            # Debug
+                            if self.config.get("DEBUG_LEVEL") > 3:
+                                print(f"[DEBUG]         [{index_tag+1} / {len(tags)}] Load Full Artifact Reference {fullArtifactReference}: Image {imname} with Tag {tag} from Registry {registry} with Namespace {namespace}")
+
+                            # Affect Properties
+                            image["Registry"] = registry
+                            image["Namespace"] = namespace
+                            image["Repository"] = "/".join([namespace, imname])
+                            image["ImageName"] = imname
+                            image["Tag"] = tag
+                            image["SourceShortArtifactReference"] = im + (":" + tag if tag != "" else "")
+                            image["SourceFullArtifactReference"] = fullArtifactReference
+                            image["Interval"] = image_interval
+                            image["Platforms"] = image_platforms
+
+                            # Append to the list
+                            images.append(image)
+
+        # Return Result
+        return images
+
+    # Expand Tag Selectors into one Image per matching Tag of the Source Repository
+    # Images with a literal Tag are returned unchanged
+    def expand_tag_selectors(self,
+                             images: list[dict[str, Any]]
+                             ) -> list[dict[str, Any]]:
+
+        # Repositories used by Tag Selectors
+        repositories = sorted(set((image["Registry"], image["Repository"]) for image in images if image.get("TagSelector") is not None))
+
+        if len(repositories) == 0:
+            return images
+
+        # Load cached Tag Lists of previous Runs
+        if not self.tag_lists_loaded:
+            self.tag_lists.load(self.get_state("tag_lists", dict()))
+            self.tag_lists_loaded = True
+
+        # List the Tags of all Repositories concurrently (globally and for each Registry)
+        executor = RegistryExecutor(global_limit=self.config.get("INVENTORY_WORKERS"),
+                                    registry_limits=parse_limits(self.config.get("SCAN_REGISTRY_LIMITS")),
+                                    default_limit=self.config.get("INVENTORY_WORKERS"),
+                                    name="tags"
+                                    )
+
+        now = int(time.time())
+
+        with executor:
+            futures = {(registry, repository): executor.submit(registry, self.tag_lists.get_tags, registry, repository, now) for registry, repository in repositories}
+
+        # Declare List
+        expanded = []
+
+        for image in images:
+            if image.get("TagSelector") is None:
+                expanded.append(image)
+                continue
+
+            # Get Tags of the Source Repository
+            key = (image["Registry"], image["Repository"])
+            self.tag_list_keys.add("/".join(key))
+
+            try:
+                tags = futures[key].result()
+            except Exception as e:
+                # Display Error Message
+                print(f"[ERROR] Listing Tags of {image['SourceFullArtifactReference']} failed. Ignoring Tag Selector {image['TagSelector']}.")
+                print(e)
+                continue
+
+            # Select Tags
+            selected = TagSelector.from_config(image["TagSelector"]).select(tags)
+
+            if len(selected) == 0:
+                # Display Warning
+                print(f"[WARNING] Tag Selector {image['TagSelector']} does not match any of the {len(tags)} Tag(s) of {image['SourceFullArtifactReference']}")
+
+            # Debug
+            if self.config.get("DEBUG_LEVEL") > 3:
+                print(f"[DEBUG] Tag Selector {image['TagSelector']} of {image['SourceFullArtifactReference']} selected {len(selected)} / {len(tags)} Tag(s): {', '.join(selected)}")
+
+            for tag in selected:
+                # One Image per Tag (the Tag Selector is kept to document where the Image comes from)
+                expanded_image = image.copy()
+                expanded_image["Tag"] = tag
+                expanded_image["SourceShortArtifactReference"] = image["SourceShortArtifactReference"] + ":" + tag
+                expanded_image["SourceFullArtifactReference"] = image["SourceFullArtifactReference"] + ":" + tag
+
+                # Append to List
+                expanded.append(expanded_image)
+
+        # Return Result
+        return expanded
+
+    # Register an Image in the Object and its Indexes
+    # Returns the registered Image, or None if it is a duplicated Entry
+    def register_image(self,
+                       image: dict[str, Any]
+                       ) -> dict[str, Any] | None:
+
+        # Get Full Qualified Artifact Reference
+        fullArtifactReference = image["SourceFullArtifactReference"]
+
+        if fullArtifactReference in self.images_by_source_reference.keys():
+            # Display Warning (Tag Selectors may overlap with other Entries)
+            if image.get("TagSelector") is None:
+                print(f"[WARNING] Image {fullArtifactReference} has already been processed. Ignoring duplicated Entry.")
+
+            # Return Value
+            return None
+
+        # Work on a Copy, so that the parsed (and possibly cached) Image is never modified
+        image = image.copy()
+
+        # Also store in the Object
+        self.images.append(image)
+
+        # Store in Source Dictionary
+        self.images_by_source_reference[fullArtifactReference] = image
+        self.images_by_source_reference[fullArtifactReference]["Index"] = len(self.images) - 1
+
+        # Store in Destination Dictionary
+        destinationFullArtifactReference = self.config.get("DESTINATION_REGISTRY_HOSTNAME") + "/" + fullArtifactReference
+        self.images_by_destination_reference[destinationFullArtifactReference] = image
+
+        # Return Value
+        return image
+
     # Read Single Config File
     def read_images_config_single(self,
                                   filepath='sync.d/main.yml'
@@ -325,112 +1038,14 @@ class SyncRegistries:
 
         if os.path.exists(filepath):
             with open(filepath, "r", encoding="UTF-8") as f:
-                # Open YAML File in Safe Mode
-                # data = yaml.safe_load(f)
-                data = list(yaml.load_all(f, Loader=SafeLoader))
-
-                # Length of list
-                length = len(data)
-
-                # Declare Dictionary for each Image as a Template
-                imageTemplate = dict(Registry="",
-                                     Namespace="",
-                                     Repository="",
-                                     ImageName="",
-                                     Tag="",
-                                     SourceShortArtifactReference="",
-                                     SourceFullArtifactReference="",
-                                     LastCheck=0,
-                                     LastUpdate=0
-                                     )
+                contents = f.read()
 
-                # Iterate over list
-                for list_index in range(length):
-                    # Get Data of the current Iteration
-                    currentdata = data[list_index]
-
-                    # Iterate over currentdata
-                    for registry in currentdata:
-                        currentimages = currentdata[registry]["images"]
-
-                        # If there are any Images defined
-                        if currentimages is not None:
-                            for index_image, im in enumerate(currentimages):
-                                # Debug
-                                if self.config.get("DEBUG_LEVEL") > 3:
-                                    print(f"[DEBUG]     [{index_image+1} / {len(currentimages)}] Load Specification for Image {im} under Registry {registry}")
-
-                                # Get Tags associated with the current Image
-                                tags = currentimages[im]
-
-                                for index_tag, tag in enumerate(tags):
-                                    # Start with the Template Dictionary
-                                    # Must use .copy() otherwise all images will point to the LAST image that has been processed !
-                                    image = imageTemplate.copy()
-
-                                    # Try to exact namespace from registry
-                                    contents = registry.split("/")
-                                    if len(contents) > 1:
-                                        # Registry was actually in the form example.com/namespace
-                                        # Separate these two
-                                        if len(contents) > 2:
-                                            registry = contents[0]
-                                            namespace = "/".join(contents[1:None])
-                                            imname = im
-                                        else:
-                                            registry = contents[0]
-                                            namespace = contents[1]
-                                            imname = im
-                                    else:
-                                        # Try to determine namespace and image name alternatively
-                                        contents = im.split("/")
-                                        if len(contents) > 1:
-                                            if len(contents) > 2:
-                                                namespace = "/".join(contents[0:-1])
-                                                imname = contents[-1]
-                                            else:
-                                                namespace = contents[0]
-                                                imname = contents[1]
-                                        else:
-                                            # Couldn't find Namespace
-                                            # Assume it was "library" (as in Docker Hub)
-                                            namespace = "library"
-                                            imname = im
-
-                                    # Get Full Qualified Artifact Reference
-                                    fullArtifactReference = registry + "/" + namespace + "/" + imname + ":" + tag
-
-                                    # Debug
-                                    if self.config.get("DEBUG_LEVEL") > 3:
-                                        print(f"[DEBUG]         [{index_tag+1} / {len(tags)}] Load Full Artifact Reference {fullArtifactReference}: Image {imname} with Tag {tag} from Registry {registry} with Namespace {namespace}")
-
-                                    if fullArtifactReference not in self.images_by_source_reference.keys():
-                                        # Affect Properties
-                                        image["Registry"] = registry
-                                        image["Namespace"] = namespace
-                                        image["Repository"] = "/".join([namespace, imname])
-                                        image["ImageName"] = imname
-                                        image["Tag"] = tag
-                                        image["SourceShortArtifactReference"] = im + ":" + tag
-                                        image["SourceFullArtifactReference"] = fullArtifactReference
-
-                                        # Append to the list
-                                        images.append(image)
-
-                                        # Store in Source Dictionary
-                                        self.images_by_source_reference[fullArtifactReference] = image
-                                        self.images_by_source_reference[fullArtifactReference]["Index"] = len(images) - 1
-
-                                        # Store in Destination Dictionary
-                                        destinationFullArtifactReference = self.config.get("DESTINATION_REGISTRY_HOSTNAME") + "/" + fullArtifactReference
-                                        self.images_by_destination_reference[destinationFullArtifactReference] = image
-                                        self.images_by_destination_reference[destinationFullArtifactReference]["Index"] = len(images) - 1
-
-                                        # Also store in the Object
-                                        self.images.append(image)
-                                    else:
-                                        # Display Warning
-                                        print(f"[WARNING] Image {fullArtifactReference} has already been processed. Ignoring duplicated Entry.")
+            # Parse and register Images
+            for image in self.expand_tag_selectors(self.parse_images_config(contents, filepath)):
+                registered_image = self.register_image(image)
+
+                if registered_image is not None:
+                    images.append(registered_image)
         else:
             print(f"ERROR: File {filepath} does NOT exist !")
 
@@ -440,6 +1055,17 @@ class SyncRegistries:
     # Check Lock File
     def is_lock_set(self) -> bool:
         if os.path.exists(LOCK_FILE):
+            # Remove the Lock if the Process that set it is not running anymore
+            if self.is_lock_stale():
+                # Display Warning
+                print(f"[WARNING] LOCK File {LOCK_FILE} was left behind by a Process that is not running anymore. Removing it and resuming from the last Checkpoint.")
+
+                # Clear Lock
+                self.clear_lock()
+
+                # Return Value
+                return False
+
             # Display Warning
             print(f"WARNING: LOCK File {LOCK_FILE} is set. Is another instance running ? Did the previous Run fail in a non-graceful Way ?")
 
@@ -449,6 +1075,61 @@ class SyncRegistries:
             # Return
             return False
 
+    # Wait (at most LOCK_WAIT_TIMEOUT Seconds) for the Lock File of another Run to be cleared
+    # Returns True if the Lock File is not set anymore
+    def wait_for_lock(self) -> bool:
+        # Get Start Time
+        start = time.monotonic()
+
+        while self.is_lock_set():
+            # Get Time left
+            remaining = self.config.get("LOCK_WAIT_TIMEOUT") - (time.monotonic() - start)
+
+            # Give up
+            if remaining <= 0:
+                self.metrics.set("lock_wait_seconds", time.monotonic() - start)
+                return False
+
+            time.sleep(min(LOCK_POLL_INTERVAL, remaining))
+
+        # Keep Track of the Time spent waiting
+        self.metrics.set("lock_wait_seconds", time.monotonic() - start)
+
+        # Return Value
+        return True
+
+    # Check if the Lock File was left behind by a Process that is not running anymore
+    def is_lock_stale(self) -> bool:
+        try:
+            with open(LOCK_FILE, "r") as lock_handle:
+                contents = lock_handle.read().split()
+        except OSError:
+            return False
+
+        # Legacy Lock Files only contain the Timestamp
+        if len(contents) < 2:
+            return False
+
+        # Get Process ID (truncated or edited Lock Files are handled like legacy Lock Files)
+        try:
+            pid = int(contents[1])
+        except ValueError:
+            return False
+
+        if pid <= 0 or pid == os.getpid():
+            return False
+
+        try:
+            # Signal 0 only checks if the Process exists
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            return False
+
+        # Return Value
+        return False
+
     # Set Lock File
     def set_lock(self) -> None:
         with open(LOCK_FILE, "w") as lock_handle:
@@ -456,6 +1137,9 @@ class SyncRegistries:
             timestamp = str(int(datetime.now().timestamp()))
             lock_handle.write(timestamp)
 
+            # Store Process ID, so that a Lock left behind by a killed Process can be detected
+            lock_handle.write(f"\n{os.getpid()}\n")
+
     # Clear Lock File
     def clear_lock(self) -> None:
         if os.path.exists(LOCK_FILE):
@@ -473,8 +1157,20 @@ class SyncRegistries:
         # Info
         print(f"[INFO] Load Configuration Files from {self.CONFIG_PATH}")
 
+        # Repositories used by Tag Selectors
+        self.tag_list_keys = set()
+
+        # Get the Cache of already parsed Configuration Files
+        config_cache = None
+        if self.config.get("CONFIG_CACHE") == "true":
+            config_cache = ConfigCache(filepath=self.get_config_cache_filepath())
+            config_cache.load()
+
+        # Get Configuration Files
+        filepaths = glob.glob(f"{self.CONFIG_PATH}/**/*.yml", recursive=True)
+
         # Load Synchronization Configuration
-        for filepath in glob.glob(f"{self.CONFIG_PATH}/**/*.yml", recursive=True):
+        for filepath in filepaths:
             # Debug
             if self.config.get("DEBUG_LEVEL") > 3:
                 print(f"[DEBUG] Read Configuration File {filepath}")
@@ -482,15 +1178,54 @@ class SyncRegistries:
             # Get File Name from File Path
             # filename = os.path.basename(filepath)
 
-            # Get Images defined in the Current File
-            current_images = self.read_images_config_single(filepath)
+            if config_cache is None:
+                # Get Images defined in the Current File
+                current_images = self.read_images_config_single(filepath)
+            else:
+                # Only parse the File if it changed since the previous Run
+                parsed_images, contents, content_hash = config_cache.lookup(filepath)
+
+                if parsed_images is None:
+                    parsed_images = self.parse_images_config(contents, filepath)
+                    config_cache.store(filepath, content_hash, parsed_images)
+
+                # Register Images defined in the Current File
+                current_images = [image for image in map(self.register_image, self.expand_tag_selectors(parsed_images)) if image is not None]
 
             # Read File
             images.extend(current_images)
 
+        # Save the Tag Lists used by Tag Selectors
+        if self.tag_lists_loaded:
+            self.tag_lists.prune(self.tag_list_keys)
+
+            if self.tag_lists.dirty:
+                self.set_state("tag_lists", self.tag_lists.dump())
+                self.tag_lists.dirty = False
+
+            # Info
+            stats = self.tag_lists.stats
+            print(f"[INFO] Tag Selectors: {len(self.tag_list_keys)} Repository(ies), {stats['Cached']} Tag List(s) from Cache, {stats['Revalidated']} revalidated, {stats['Fetched']} listed, {stats['Failed']} failed")
+
+        if config_cache is not None:
+            # Forget Files that have been removed
+            config_cache.prune(filepaths)
+            config_cache.save()
+
+            # Info
+            print(f"[INFO] Configuration Cache: {config_cache.hits} File(s) unchanged, {config_cache.misses} File(s) parsed")
+
         # Return Result
         return images
 
+    # Get Configuration Cache Filepath
+    def get_config_cache_filepath(self) -> str:
+        # Build Configuration Cache Filepath
+        config_cache_filepath = os.path.join(self.DATABASE_PATH, "config-cache.json")
+
+        # Return Value
+        return config_cache_filepath
+
     # Get Database Filepath
     def get_database_filepath(self) -> str:
         # Build Database Filepath
@@ -499,8 +1234,164 @@ class SyncRegistries:
         # Return Value
         return database_filepath
 
-    # Load Database of Previous Runs
-    def load_database(self) -> list[dict[str, Any]]:
+    # Get Rate Limit Budget Filepath
+    def get_ratelimit_filepath(self) -> str:
+        # Build Rate Limit Budget Filepath
+        ratelimit_filepath = os.path.join(self.DATABASE_PATH, "ratelimit.json")
+
+        # Return Value
+        return ratelimit_filepath
+
+    # Get Journal Filepath (Checkpoints of the JSON Backend)
+    def get_journal_filepath(self) -> str:
+        # Build Journal Filepath
+        journal_filepath = os.path.join(self.DATABASE_PATH, "db.journal")
+
+        # Return Value
+        return journal_filepath
+
+    # Persist a Batch of Items that have been scanned or synchronized
+    def write_checkpoint(self,
+                         items: list[dict[str, Any]]
+                         ) -> None:
+
+        if self.config.get("DATABASE_BACKEND") == "sqlite":
+            # Insert or Update each Item
+            self.get_state_store().upsert(items)
+        else:
+            # Append to the Journal (one JSON Object per Line)
+            with open(self.get_journal_filepath(), "a", encoding="UTF-8") as journal_file_handle:
+                journal_file_handle.write("".join(json.dumps(item) + "\n" for item in items))
+                journal_file_handle.flush()
+                os.fsync(journal_file_handle.fileno())
+
+    # Get State Store Filepath
+    def get_state_store_filepath(self) -> str:
+        # Build State Store Filepath
+        state_store_filepath = os.path.join(self.DATABASE_PATH, "db.sqlite")
+
+        # Return Value
+        return state_store_filepath
+
+    # Get State Store (open it and migrate the legacy JSON Database on first Use)
+    def get_state_store(self) -> StateStore:
+        if self.state_store is None:
+            # Get State Store Filepath
+            state_store_filepath = self.get_state_store_filepath()
+
+            # Open Database
+            self.state_store = StateStore(filepath=state_store_filepath)
+
+            # One-Time Migration from db.json
+            migrated = self.state_store.migrate_from_json(database_filepath=self.get_database_filepath(),
+                                                          ratelimit_filepath=self.get_ratelimit_filepath(),
+                                                          journal_filepath=self.get_journal_filepath()
+                                                          )
+
+            if migrated > 0:
+                print(f"[INFO] Migrated {migrated} Items from {self.get_database_filepath()} to {state_store_filepath}")
+
+        # Return Value
+        return self.state_store
+
+    # Load Rate Limit Budget of Previous Runs
+    def load_ratelimit(self) -> None:
+        if self.config.get("DATABASE_BACKEND") == "sqlite":
+            self.ratelimit.load(self.get_state_store().get_state("ratelimit", dict()))
+            return
+
+        # Get Rate Limit Budget Filepath
+        ratelimit_filepath = self.get_ratelimit_filepath()
+
+        if os.path.exists(ratelimit_filepath):
+            try:
+                with open(ratelimit_filepath, "r", encoding="UTF-8") as ratelimit_file_handle:
+                    self.ratelimit.load(json.load(ratelimit_file_handle))
+            except Exception as e:
+                # Display Warning & Error Message
+                print(f"[WARNING] Loading Rate Limit Budget File {ratelimit_filepath} failed!")
+                print(e)
+
+    # Save Rate Limit Budget
+    def save_ratelimit(self) -> None:
+        if self.config.get("DATABASE_BACKEND") == "sqlite":
+            self.get_state_store().set_state("ratelimit", self.ratelimit.dump())
+            return
+
+        # Get Rate Limit Budget Filepath
+        ratelimit_filepath = self.get_ratelimit_filepath()
+
+        # Save to File
+        with open(ratelimit_filepath, "w", encoding="UTF-8") as ratelimit_file_handle:
+            ratelimit_file_handle.write(json.dumps(self.ratelimit.dump()))
+
+    # Get State Filepath (State of the JSON Backend)
+    def get_state_filepath(self) -> str:
+        # Build State Filepath
+        state_filepath = os.path.join(self.DATABASE_PATH, "state.json")
+
+        # Return Value
+        return state_filepath
+
+    # Get a persistent State Value (e.g. Scheduler Statistics)
+    def get_state(self,
+                  key: str,
+                  default_value: Any | None = None
+                  ) -> Any:
+
+        if self.config.get("DATABASE_BACKEND") == "sqlite":
+            return self.get_state_store().get_state(key, default_value)
+
+        # Get State Filepath
+        state_filepath = self.get_state_filepath()
+
+        if os.path.exists(state_filepath):
+            try:
+                with open(state_filepath, "r", encoding="UTF-8") as state_file_handle:
+                    return json.load(state_file_handle).get(key, default_value)
+            except Exception as e:
+                # Display Warning & Error Message
+                print(f"[WARNING] Loading State File {state_filepath} failed!")
+                print(e)
+
+        # Return Default Value
+        return default_value
+
+    # Set a persistent State Value
+    def set_state(self,
+                  key: str,
+                  value: Any
+                  ) -> None:
+
+        if self.config.get("DATABASE_BACKEND") == "sqlite":
+            self.get_state_store().set_state(key, value)
+            return
+
+        # Get State Filepath
+        state_filepath = self.get_state_filepath()
+
+        with self.state_lock:
+            # Read current State
+            state = dict()
+            if os.path.exists(state_filepath):
+                try:
+                    with open(state_filepath, "r", encoding="UTF-8") as state_file_handle:
+                        state = json.load(state_file_handle)
+                except Exception as e:
+                    # Display Warning & Error Message
+                    print(f"[WARNING] Loading State File {state_filepath} failed! State will be reset.")
+                    print(e)
+
+            state[key] = value
+
+            # Save to a temporary File and replace the State atomically
+            with open(state_filepath + ".tmp", "w", encoding="UTF-8") as state_file_handle:
+                json.dump(state, state_file_handle)
+
+            os.replace(state_filepath + ".tmp", state_filepath)
+
+    # Read legacy JSON Database
+    def read_database_json(self) -> list[dict[str, Any]]:
         # Get Database Filepath
         database_filepath = self.get_database_filepath()
 
@@ -524,16 +1415,54 @@ class SyncRegistries:
             print(f"[WARNING] Loading Database File {database_filepath} failed!")
             print(e)
 
-        # Save Database into Object
-        self.database = data
+        # Replay Checkpoints of an interrupted Run
+        journal_filepath = self.get_journal_filepath()
 
-        # Initialize Fully Qualified References Dictionary
-        database_fullartifactreferences = dict()
+        if os.path.exists(journal_filepath):
+            # Info
+            print(f"[INFO] Resume from Checkpoints stored in {journal_filepath}")
 
-        # Build a faster way to find Items in Database
-        for index, item in enumerate(self.database):
-            if self.config.get("DEBUG_LEVEL") > 3:
-                # Debug
+            data = replay_journal(data, journal_filepath)
+
+        # Return Result
+        return data
+
+    # Load Database of Previous Runs
+    def load_database(self) -> list[dict[str, Any]]:
+        if self.config.get("DATABASE_BACKEND") == "sqlite":
+            # Info
+            print(f"[INFO] Load Database from {self.get_state_store_filepath()}")
+
+            # Read all Items
+            data = self.get_state_store().load_all()
+        else:
+            # Read legacy JSON Database
+            data = self.read_database_json()
+
+        # Save Database into Object
+        self.database = data
+
+        # Load Rate Limit Budget
+        self.load_ratelimit()
+
+        # Load Statistics of the Mirrors
+        self.mirrors.load(self.get_state("mirrors", dict()))
+
+        # Load cached Digests of the Destination Images
+        if self.destination_snapshot is not None:
+            self.destination_snapshot.load(self.get_state("destination_snapshot", dict()))
+
+        # Load Location of the Blobs stored in the Destination Registry
+        if self.config.get("SYNC_TOOL") == "native":
+            self.copier.blob_index.load(self.get_state("blobs", dict()))
+
+        # Initialize Fully Qualified References Dictionary
+        database_fullartifactreferences = dict()
+
+        # Build a faster way to find Items in Database
+        for index, item in enumerate(self.database):
+            if self.config.get("DEBUG_LEVEL") > 3:
+                # Debug
                 print(f"[DEBUG] [{index+1} / {len(self.database)}] Loading Database Item {item['SourceFullArtifactReference']}")
 
             # Get Fully Qualified Artifact Reference
@@ -600,54 +1529,141 @@ class SyncRegistries:
                 self.images[index]["DestinationHash"] = database_values_to_use.get("DestinationHash")
                 self.images[index]["DestinationFullArtifactReference"] = database_values_to_use.get("DestinationFullArtifactReference")
 
+    # Merge the Results of a partial Run into the in-Memory Database and Images
+    def merge_results(self,
+                      items: list[dict[str, Any]]
+                      ) -> None:
+
+        for item in items:
+            # Get Fully Qualified Artifact Reference
+            fullArtifactReference = item["SourceFullArtifactReference"]
+
+            # Store a Copy, so that later Changes to the Item do not affect the Database
+            item = item.copy()
+
+            # Replace or Append Database Item
+            database_item = self.database_by_source_reference.get(fullArtifactReference)
+
+            if database_item is not None:
+                item["Index"] = database_item["Index"]
+                self.database[item["Index"]] = item
+            else:
+                item["Index"] = len(self.database)
+                self.database.append(item)
+
+            self.database_by_source_reference[fullArtifactReference] = item
+
+            # Update Images Information
+            image = self.images_by_source_reference.get(fullArtifactReference)
+
+            if image is not None:
+                image["Status"] = item.get("Status")
+                image["LastCheck"] = item.get("LastCheck")
+                image["LastUpdate"] = item.get("LastUpdate")
+                image["SourceHash"] = item.get("SourceHash")
+                image["DestinationHash"] = item.get("DestinationHash")
+                image["DestinationFullArtifactReference"] = item.get("DestinationFullArtifactReference")
+
     # Save Database
     def save_database(self) -> None:
+        # Persist pending Checkpoints first
+        self.checkpoint.flush()
+
+        if self.config.get("DATABASE_BACKEND") == "sqlite":
+            # Insert or Update each Item
+            self.get_state_store().upsert(self.current)
+
+            # Drop Images that have been removed from the Configuration Files (as the JSON Database does when it is rewritten)
+            removed = self.get_state_store().prune(set(item["SourceFullArtifactReference"] for item in self.current))
+            if removed > 0:
+                print(f"[INFO] Removed {removed} Image(s) that are not configured anymore from the Database")
+
+            # Save Rate Limit Budget
+            self.save_ratelimit()
+
+            return
+
         # Get Database Filepath
         database_filepath = self.get_database_filepath()
 
         # Get Data as String
         database_file_contents = json.dumps(self.current)
 
-        # Save to File
-        with open(database_filepath, "w", encoding="UTF-8") as database_file_handle:
+        # Save to a temporary File and replace the Database atomically, so that a Crash never leaves a truncated File behind
+        with open(database_filepath + ".tmp", "w", encoding="UTF-8") as database_file_handle:
             database_file_handle.write(database_file_contents)
 
+        os.replace(database_filepath + ".tmp", database_filepath)
+
+        # Checkpoints are now included in the Database
+        if os.path.exists(self.get_journal_filepath()):
+            os.unlink(self.get_journal_filepath())
+
+        # Save Rate Limit Budget
+        self.save_ratelimit()
+
     # Run Synchronization
     def run_synchronization(self) -> None:
         # Check Lock File
-        # Only allow run if there is no Lock File set !
-        if self.is_lock_set() is False:
+        # Only allow run if there is no Lock File set (possibly after waiting for another Run to complete) !
+        if self.wait_for_lock() is True:
             # Set Lock
             self.set_lock()
 
-            # Read All Configuration
-            self.read_images_config_all()
+            # Exit gracefully (persisting Checkpoints and clearing the Lock) when the Container is stopped
+            if threading.current_thread() is threading.main_thread():
+                signal.signal(signal.SIGTERM, self.handle_sigterm)
 
-            # Load Database Status
-            self.load_database()
+            # Start cProfile (if configured)
+            self.start_profiling()
 
-            # Update Images based on Database Information
-            self.update_images_info()
+            try:
+                # Read All Configuration
+                with self.phase("read_images_config_all"):
+                    self.read_images_config_all()
 
-            # Scan Configuration Files
-            self.current = self.scan_images_manifest_digest(self.images)
+                # Load Database Status
+                with self.phase("load_database"):
+                    self.load_database()
 
-            # Debug
-            # if self.config.get("DEBUG_LEVEL") > 3:
-            # Convert to Pandas DataFrame (only used for display Purposes)
-            #     df_manifest_digest_comparison = pd.DataFrame.from_records(self.current)
-            #
-            #     # Print Dataframe
-            #     display(df_manifest_digest_comparison)
+                    # Update Images based on Database Information
+                    self.update_images_info()
 
-            # Synchronize Images based on Manifest Digest Comparison
-            self.sync_images_based_on_manifest_digest()
+                # Scan Configuration Files
+                with self.phase("scan"):
+                    self.current = self.scan_images_manifest_digest(self.images)
 
-            # Save Database Status
-            self.save_database()
+                # Count Images per Status before the Synchronization
+                self.update_status_metrics("scan_results", self.current)
 
-            # Clear Lock
-            self.clear_lock()
+                # Debug
+                # if self.config.get("DEBUG_LEVEL") > 3:
+                #     # Print Table
+                #     print(format_table(self.current))
+
+                # Synchronize Images based on Manifest Digest Comparison
+                with self.phase("sync"):
+                    self.sync_images_based_on_manifest_digest()
+
+                # Save Database Status
+                with self.phase("save_database"):
+                    self.save_database()
+            finally:
+                # Persist Checkpoints of completed Images (in case the Run was interrupted)
+                self.checkpoint.flush()
+
+                # Close Connections and Worker Sessions
+                self.close()
+
+                # Clear Lock
+                self.clear_lock()
+
+                # Export Metrics of this Run
+                self.update_metrics(self.current)
+                self.write_metrics()
+
+                # Write Trace & cProfile Statistics (if configured)
+                self.stop_profiling()
 
             # Notes
             # List all Repositories
@@ -677,6 +1693,92 @@ class SyncRegistries:
             # digest = dxf.get_digest(alias = 'nginx:latest' , platform = 'linux/amd64')
             # print(digest)
 
+    # Measure a Phase of a Run (Metrics & Trace)
+    @contextmanager
+    def phase(self,
+              name: str
+              ) -> Iterator[None]:
+
+        with self.metrics.timer("phase_duration_seconds", phase=name), self.tracer.span(name, category="phase"):
+            yield
+
+    # Start cProfile of all Threads (if configured)
+    def start_profiling(self) -> None:
+        if strip_quotes(str(self.config.get("PROFILE_CPROFILE_OUTPUT"))) != "":
+            self.profiler = ThreadProfiler()
+            self.profiler.start()
+
+    # Write Trace & cProfile Statistics (if configured)
+    def stop_profiling(self) -> None:
+        if self.profiler is not None:
+            self.profiler.dump(self.config.get("PROFILE_CPROFILE_OUTPUT"))
+            self.profiler = None
+
+        if self.tracer.enabled:
+            self.tracer.dump(self.config.get("PROFILE_OUTPUT"))
+
+    # Update the Metrics describing the Result of a Run (or of a Batch in Daemon Mode)
+    def update_metrics(self,
+                       items: list[dict[str, Any]]
+                       ) -> None:
+
+        # Count Images per Status
+        self.update_status_metrics("images", items)
+
+        # Blobs & Bytes handled by the native Copy (Statistics only grow)
+        if self.config.get("SYNC_TOOL") == "native":
+            stats = self.copier.stats
+            for action in ["Existing", "Mounted", "Uploaded"]:
+                self.metrics.set("blobs_total", stats[action], action=action.lower())
+
+            self.metrics.set("transferred_bytes_total", stats["BytesUploaded"])
+
+        # Retries & Circuit Breaker of each Registry (Statistics only grow)
+        now = time.time()
+        for registry, stats in self.health.dump().items():
+            for action in ["Retries", "Failures", "Skipped"]:
+                self.metrics.set("registry_requests_total", stats[action], registry=registry, action=action.lower())
+
+            self.metrics.set("registry_circuit_open", 1 if stats["OpenUntil"] > now else 0, registry=registry)
+
+        # Time of the Run
+        self.metrics.set("last_run_timestamp_seconds", int(datetime.now().timestamp()))
+
+    # Count Images per Status
+    def update_status_metrics(self,
+                              name: str,
+                              items: list[dict[str, Any]]
+                              ) -> None:
+
+        # Declare Dictionary
+        statuses = dict()
+        for item in items:
+            statuses[item.get("Status")] = statuses.get(item.get("Status"), 0) + 1
+
+        # Statuses that disappeared since the previous Run are reset to 0
+        for key in list(self.metrics.values[name].keys()):
+            self.metrics.set(name, 0, **dict(key))
+
+        for status, count in statuses.items():
+            self.metrics.set(name, count, status=status)
+
+    # Write Metrics for the Textfile Collector (if configured)
+    def write_metrics(self) -> None:
+        if strip_quotes(str(self.config.get("METRICS_TEXTFILE"))) != "":
+            self.metrics.write_textfile(self.config.get("METRICS_TEXTFILE"))
+
+    # Handle SIGTERM by exiting through the normal Cleanup Path
+    def handle_sigterm(self,
+                       signum: int,
+                       frame: Any
+                       ) -> None:
+
+        # Echo
+        print("[INFO] Received SIGTERM. Stopping after persisting completed Images.")
+
+        # Raise SystemExit in the Main Thread
+        sys.exit(128 + signum)
+
     # Setup External APPs Commands
     def setup_external_apps_commands(self):
         # Need to be able to modify global COMMAND_XXX Variables
@@ -690,6 +1792,16 @@ class SyncRegistries:
             # Get Container Engine in case of running APPs within a Container
             containerEngine = self.config.get("LOCAL_APPS_CONTAINER_ENGINE")
 
+            # Store Command Prefix
+            self.container_exec_prefix = [containerEngine, "exec", containerName]
+
+            # Route Commands through long-lived Worker Sessions
+            if self.config.get("LOCAL_APPS_PERSISTENT_SESSION") == "true":
+                self.tool_sessions = ToolSessionPool(exec_prefix=[containerEngine, "exec", "-i", containerName],
+                                                     size=self.config.get("LOCAL_APPS_SESSION_POOL_SIZE"),
+                                                     timeout=self.config.get("LOCAL_APPS_SESSION_TIMEOUT")
+                                                     )
+
             # Run APPs from inside container
             COMMAND_PODMAN = [containerEngine, "exec", containerName, "podman"]
             COMMAND_SKOPEO = [containerEngine, "exec", containerName, "skopeo"]
@@ -723,20 +1835,146 @@ class SyncRegistries:
                 if strip_quotes(self.config.get("LOCAL_APPS_CRANE_PATH")) != "":
                     COMMAND_CRANE = [self.config.get("LOCAL_APPS_CRANE_PATH")]
 
-    # Get Manifest Hash
+    # Run External Command
+    # Commands targeting the Tools Container are routed through the long-lived Worker Sessions if enabled
+    # Text passed as input is written to the standard Input of the Command
+    def run_command(self,
+                    command: list[str],
+                    input: str | None = None
+                    ) -> subprocess.CompletedProcess:
+
+        # Get Start Time
+        start = time.monotonic()
+
+        # Name of the Tool (without the Container Prefix if the Tool runs inside the Container)
+        if self.container_exec_prefix is not None and command[0:len(self.container_exec_prefix)] == self.container_exec_prefix:
+            tool = os.path.basename(command[len(self.container_exec_prefix)])
+        else:
+            tool = os.path.basename(command[0])
+
+        with self.tracer.span(tool, category="subprocess", command=" ".join(command)):
+            if self.tool_sessions is not None and input is None and command[0:len(self.container_exec_prefix)] == self.container_exec_prefix:
+                result = self.tool_sessions.run(command[len(self.container_exec_prefix):])
+            else:
+                # The standard Input must be forwarded into the Container
+                if input is not None and self.container_exec_prefix is not None and command[0:len(self.container_exec_prefix)] == self.container_exec_prefix:
+                    command = self.container_exec_prefix[0:2] + ["-i"] + self.container_exec_prefix[2:] + command[len(self.container_exec_prefix):]
+
+                result = subprocess.run(command,
+                                        input=input,
+                                        stdout=subprocess.PIPE,
+                                        stderr=subprocess.PIPE,
+                                        universal_newlines=True,
+                                        text=True
+                                        )
+
+        # Keep Track of the Duration of each Tool
+        self.metrics.observe("subprocess_duration_seconds",
+                             time.monotonic() - start,
+                             tool=tool,
+                             result="ok" if result.returncode == 0 else "error"
+                             )
+
+        # Return Result
+        return result
+
+    # Close Connections and Worker Sessions
+    def close(self) -> None:
+        # Close native Registry Client
+        self.registry_client.close()
+
+        # Close Worker Sessions
+        if self.tool_sessions is not None:
+            self.tool_sessions.close()
+
+        # Close State Store
+        if self.state_store is not None:
+            self.state_store.close()
+            self.state_store = None
+
+    # Get Manifest Hash (and keep Track of the Latency of each Registry)
     def get_manifest_hash(self,
                           full_artifact_reference: str
                           ) -> (str, subprocess.CompletedProcess, int):
 
+        # Get Registry
+        registry = get_registry(full_artifact_reference)
+
+        # Skip the Query if the Registry failed too many Times in a Row
+        if self.health.is_open(registry):
+            result = subprocess.CompletedProcess(args=["CIRCUIT_OPEN", full_artifact_reference],
+                                                 returncode=1,
+                                                 stdout="",
+                                                 stderr=f"Registry {registry} is unavailable (Circuit Breaker open): skip {full_artifact_reference}"
+                                                 )
+            result.response = None
+            result.circuit_open = True
+
+            # Return Result
+            return ("", result, result.returncode)
+
+        attempt = 0
+        while True:
+            # Get Start Time
+            start = time.monotonic()
+
+            with self.tracer.span("get_manifest_hash", category="registry", reference=full_artifact_reference, attempt=attempt):
+                hash_value, result, retcode = self.query_manifest_hash(full_artifact_reference=full_artifact_reference)
+
+            self.metrics.observe("manifest_request_duration_seconds",
+                                 time.monotonic() - start,
+                                 registry=registry,
+                                 result="ok" if retcode == 0 else "error"
+                                 )
+
+            # Only transient Errors (429, 5xx, Network Errors) are retried
+            outcome = classify_result(result)
+            if outcome != "transient":
+                break
+
+            retry_after = get_retry_after(result)
+            if not self.health.should_retry(attempt, retry_after):
+                break
+
+            # Wait before retrying
+            delay = self.health.get_backoff(attempt, retry_after)
+            self.health.record_retry(registry)
+
+            # Debug
+            if self.config.get("DEBUG_LEVEL") > 3:
+                print(f"[DEBUG] Manifest Query for {full_artifact_reference} failed ({result.stderr.strip()}). Retry in {delay:.1f} Seconds.")
+
+            time.sleep(delay)
+            attempt += 1
+
+        # Only transient Errors count against the Registry (a missing Image or a denied Request still means that it is reachable)
+        self.health.record(registry, success=outcome != "transient")
+
+        # Return Result
+        return (hash_value, result, retcode)
+
+    # Query Manifest Hash
+    def query_manifest_hash(self,
+                            full_artifact_reference: str
+                            ) -> (str, subprocess.CompletedProcess, int):
+
+        # Use the native Registry Client if configured
+        if self.config.get("MANIFEST_BACKEND") == "native":
+            hash_value, result, retcode = self.registry_client.get_manifest_hash(full_artifact_reference=full_artifact_reference)
+
+            # Keep track of the Rate Limit Budget reported by the Registry
+            if result.response is not None:
+                if result.response.status_code == 429:
+                    self.ratelimit.exhaust(get_registry(full_artifact_reference), result.response.headers)
+                else:
+                    self.ratelimit.update_from_headers(get_registry(full_artifact_reference), result.response.headers)
+
+            return (hash_value, result, retcode)
+
         command = COMMAND_REGCTL.copy()
         command.extend(["manifest", "head", full_artifact_reference])
 
-        result = subprocess.run(command,
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                                universal_newlines=True,
-                                text=True
-                                )
+        result = self.run_command(command)
 
         # Get Command Output
         text = result.stdout.rsplit("\n")
@@ -747,11 +1985,105 @@ class SyncRegistries:
         # Return Result
         return (hash_value, result, result.returncode)
 
-    
+    # Get a Manifest using the configured Backend
+    # Returns (Manifest, Media Type, Result), the Manifest is None if it could not be retrieved or is not valid JSON
+    def query_manifest(self,
+                       full_artifact_reference: str
+                       ) -> tuple[dict[str, Any] | None, str, subprocess.CompletedProcess]:
+
+        # Media Type reported by the Registry (the native Backend only)
+        media_type = ""
+
+        if self.config.get("MANIFEST_BACKEND") == "native":
+            try:
+                response = self.registry_client.get_manifest(full_artifact_reference)
+            except requests.RequestException as e:
+                # Network Error
+                result = subprocess.CompletedProcess(args=["GET", full_artifact_reference], returncode=1, stdout="", stderr=str(e))
+                result.response = None
+                return (None, media_type, result)
+
+            result = completed_process_from_response(["GET", full_artifact_reference], response)
+            media_type = response.headers.get("Content-Type", "").split(";")[0].strip()
+
+            # Keep track of the Rate Limit Budget reported by the Registry
+            if response.status_code == 429:
+                self.ratelimit.exhaust(get_registry(full_artifact_reference), response.headers)
+            else:
+                self.ratelimit.update_from_headers(get_registry(full_artifact_reference), response.headers)
+        else:
+            command = COMMAND_REGCTL.copy()
+            command.extend(["manifest", "get", "--format", "raw-body", full_artifact_reference])
+
+            result = self.run_command(command)
+
+        if result.returncode != 0:
+            return (None, media_type, result)
+
+        try:
+            manifest = json.loads(result.stdout)
+
+            if not isinstance(manifest, dict):
+                raise ValueError("not a JSON Object")
+        except ValueError as e:
+            # e.g. HTML Error Page of a Proxy or empty Body
+            result.returncode = 1
+            result.stderr = f"Invalid Manifest for {full_artifact_reference}: {e}"
+            return (None, media_type, result)
+
+        # Return Result
+        return (manifest, media_type or manifest.get("mediaType", ""), result)
+
+    # Upload a Manifest using the configured Backend
+    def upload_manifest(self,
+                        full_artifact_reference: str,
+                        body: bytes,
+                        media_type: str
+                        ) -> subprocess.CompletedProcess:
+
+        if self.config.get("MANIFEST_BACKEND") == "native":
+            try:
+                response = self.registry_client.put_manifest(full_artifact_reference,
+                                                             body=body,
+                                                             media_type=media_type
+                                                             )
+            except requests.RequestException as e:
+                # Network Error
+                return subprocess.CompletedProcess(args=["PUT", full_artifact_reference], returncode=1, stdout="", stderr=str(e))
+
+            result = completed_process_from_response(["PUT", full_artifact_reference], response)
+            result.stdout = response.headers.get("Docker-Content-Digest", "")
+            return result
+
+        # Regctl reads the Manifest from the standard Input
+        command = COMMAND_REGCTL.copy()
+        command.extend(["manifest", "put", "--content-type", media_type, full_artifact_reference])
+
+        # Return Result
+        return self.run_command(command, input=body.decode())
+
+    # Check whether a Manifest Query was rejected because of the Rate Limit
+    def is_rate_limited(self,
+                        result: subprocess.CompletedProcess
+                        ) -> bool:
+
+        # Deferred because no Pull is left in the Rate Limit Budget
+        if getattr(result, "rate_limited", False):
+            return True
+
+        # Native Backend exposes the HTTP Response
+        response = getattr(result, "response", None)
+        if response is not None:
+            return response.status_code == 429
+
+        # Regctl reports the Error Code in its Output
+        return result.returncode != 0 and ("429" in result.stderr or "toomanyrequests" in result.stderr.lower())
 
     # Scan Images Manifest Digest and Compare Source with Destination
     def scan_images_manifest_digest(self,
-                                    images: list[dict[str, Any]]
+                                    images: list[dict[str, Any]],
+                                    report_load: bool = True,
+                                    check_all: bool = False
                                     ) -> list[dict[str, Any]]:
 
         # Display Images that have been Registered
@@ -759,26 +2091,20 @@ class SyncRegistries:
         if self.config.get("DEBUG_LEVEL") > 3:
             print("[DEBUG] Requested Images to be synchronized")
 
-            # Create Dataframe and add all Images to it
-            df_images = pd.DataFrame.from_records(images)
-
-            if df_images.empty is False:
-                # Hide some Columns in order to fit properly on Screen
-                pandas_drop_column_from_dataframe(df_images, column_name="Registry")
-                pandas_drop_column_from_dataframe(df_images, column_name="SourceShortArtifactReference")
-                pandas_drop_column_from_dataframe(df_images, column_name="SourceHash")
-                pandas_drop_column_from_dataframe(df_images, column_name="DestinationHash")
-                pandas_drop_column_from_dataframe(df_images, column_name="Namespace")
-                pandas_drop_column_from_dataframe(df_images, column_name="Repository")
-                pandas_drop_column_from_dataframe(df_images, column_name="ImageName")
-                pandas_drop_column_from_dataframe(df_images, column_name="Tag")
-
-                # Format UNIX Timestamp as String
-                df_images.LastCheck.apply(lambda x: unixtimestamp_to_str(x))
-                df_images.LastUpdate.apply(lambda x: unixtimestamp_to_str(x))
-
-                # Diplay Dataframe
-                display(df_images)
+            # Display Images (hide some Columns in order to fit properly on Screen)
+            if len(images) > 0:
+                print(format_table(images,
+                                   hide_columns=["Registry",
+                                                 "SourceShortArtifactReference",
+                                                 "SourceHash",
+                                                 "DestinationHash",
+                                                 "Namespace",
+                                                 "Repository",
+                                                 "ImageName",
+                                                 "Tag"],
+                                   timestamp_columns=["LastCheck", "LastUpdate"]
+                                   )
+                      )
 
         # Define Manifest Digest Hashes
         comparison = []
@@ -792,126 +2118,543 @@ class SyncRegistries:
                                   LastUpdate=0
                                   )
 
-        # Iterate Over All Images
-        # for index, row in df_images.iterrows():
-        for index, row in enumerate(images):
-            # Debug
-            # print(row['Registry'], row['Namespace'])
-
-            # Fully Qualified Artifact References
-            sourcefullartifactreference = row["SourceFullArtifactReference"]
-            destinationfullartifactreference = self.config.get("DESTINATION_REGISTRY_HOSTNAME") + "/" + sourcefullartifactreference
-
-            # Get Time since last Check
-            lastCheckTimestamp = row["LastCheck"]
+        # Planned Checks (one Item per Image, in the original Order)
+        plans = []
 
-            # Compute delta Time since last Check
-            deltaTimeLastCheck = int(datetime.now().timestamp()) - lastCheckTimestamp
+        # Limit the Number of concurrent Manifest Queries globally and for each Registry
+        executor = RegistryExecutor(global_limit=self.config.get("SCAN_WORKERS"),
+                                    registry_limits=parse_limits(self.config.get("SCAN_REGISTRY_LIMITS")),
+                                    default_limit=self.config.get("SCAN_REGISTRY_LIMIT_DEFAULT"),
+                                    name="scan"
+                                    )
 
-            # Add some Randomization in order to avoid to Synchronize the entire Block at once
-            randomOffset = random.randint(0, int(self.config.get("SYNC_RANDOM_OFFSET_MAX")))
-            deltaTimeLastCheckWithRandomization = deltaTimeLastCheck + random.randint(0, randomOffset)
+        # All Images are scheduled against the same Time
+        now = int(datetime.now().timestamp())
 
-            # Get Data from Database
-            database_index = self.get_database_index(source_fully_qualified_artifact_reference=sourcefullartifactreference)
+        # Interval between two Checks of each Image
+        intervals = [self.get_check_interval(row["SourceFullArtifactReference"], now) for row in images]
 
-            if database_index is not None:
-                # Get Database Item
-                database_item = self.database[database_index]
-            else:
-                # Default to empty Dictionary
-                database_item = dict()
+        # Decide which Images are due
+        due = [check_all or self.scheduler.is_due(row["SourceFullArtifactReference"], row["LastCheck"], now, intervals[index]) for index, row in enumerate(images)]
 
-            # Get Last Update Timestamp
-            lastUpdateTimestamp = database_item.get("LastUpdate")
+        # List the Tags of the Destination Repositories once, instead of one HEAD Request per Image
+        if self.destination_snapshot is not None:
+            self.refresh_destination_snapshot([self.config.get("DESTINATION_REGISTRY_HOSTNAME") + "/" + row["SourceFullArtifactReference"] for index, row in enumerate(images) if due[index]])
 
-            if deltaTimeLastCheckWithRandomization > self.config.get("SYNC_INTERVAL"):
+        with executor:
+            # Iterate Over All Images and submit the Manifest Queries that are due
+            # for index, row in df_images.iterrows():
+            for index, row in enumerate(images):
                 # Debug
-                if self.config.get("DEBUG_LEVEL") > 3:
-                    print(f"[DEBUG] [{index+1} / {len(images)}] Check if Image {sourcefullartifactreference} has an updated Image available")
+                # print(row['Registry'], row['Namespace'])
+
+                # Fully Qualified Artifact References
+                sourcefullartifactreference = row["SourceFullArtifactReference"]
+                destinationfullartifactreference = self.config.get("DESTINATION_REGISTRY_HOSTNAME") + "/" + sourcefullartifactreference
 
-                # Query the Source Repository
-                source_hash, source_result, source_retcode = self.get_manifest_hash(full_artifact_reference=sourcefullartifactreference)
+                # Get Time since last Check
+                lastCheckTimestamp = row["LastCheck"]
 
-                # Query the Destination Repository
-                destination_hash, destination_result, destination_retcode = self.get_manifest_hash(full_artifact_reference=destinationfullartifactreference)
+                # Compute delta Time since last Check
+                deltaTimeLastCheck = now - lastCheckTimestamp
 
-                # Set Time for LastCheck
-                lastCheckTimestamp = int(datetime.now().timestamp())
+                # Get Data from Database
+                database_index = self.get_database_index(source_fully_qualified_artifact_reference=sourcefullartifactreference)
 
-                if (source_retcode == 0) and (destination_retcode == 0):
-                    if source_hash == destination_hash:
-                        syncStatus = "OK"
+                if database_index is not None:
+                    # Get Database Item
+                    database_item = self.database[database_index]
+                else:
+                    # Default to empty Dictionary
+                    database_item = dict()
+
+                # Declare Plan for the current Image
+                plan = dict(Row=row,
+                            Interval=intervals[index],
+                            Platforms=self.get_platforms(sourcefullartifactreference),
+                            SourceFullArtifactReference=sourcefullartifactreference,
+                            DestinationFullArtifactReference=destinationfullartifactreference,
+                            DeltaTimeLastCheck=deltaTimeLastCheck,
+                            DatabaseItem=database_item,
+                            SourceFuture=None,
+                            DestinationFuture=None,
+                            MirrorFutures=dict()
+                            )
+
+                if due[index]:
+                    # Debug
+                    if self.config.get("DEBUG_LEVEL") > 3:
+                        print(f"[DEBUG] [{index+1} / {len(images)}] Check if Image {sourcefullartifactreference} has an updated Image available")
+
+                    # Query the Source Repository
+                    if plan["Platforms"] is not None:
+                        # Compare the Manifests of the selected Platforms instead of the Index
+                        plan["SourceFuture"] = executor.submit(get_registry(sourcefullartifactreference),
+                                                               self.get_platform_manifest_hash,
+                                                               full_artifact_reference=sourcefullartifactreference,
+                                                               known_hash=database_item.get("SourceHash"),
+                                                               known_platforms=database_item.get("SourcePlatforms")
+                                                               )
                     else:
+                        plan["SourceFuture"] = executor.submit(get_registry(sourcefullartifactreference),
+                                                               self.get_manifest_hash,
+                                                               full_artifact_reference=sourcefullartifactreference
+                                                               )
+
+                    # Query the Destination Repository
+                    plan["DestinationFuture"] = self.submit_destination_check(executor,
+                                                                              destinationfullartifactreference,
+                                                                              now,
+                                                                              platform_filter=plan["Platforms"] is not None,
+                                                                              known_hash=database_item.get("DestinationHash"),
+                                                                              known_platforms=database_item.get("DestinationPlatforms")
+                                                                              )
+
+                # Append to List
+                plans.append(plan)
+
+            # Report planned and actual Load of this Run
+            if report_load:
+                self.report_scheduler_load(plans, now)
+
+            # Collect Results in the original Order
+            for index, plan in enumerate(plans):
+                # Get Plan Information
+                row = plan["Row"]
+                sourcefullartifactreference = plan["SourceFullArtifactReference"]
+                destinationfullartifactreference = plan["DestinationFullArtifactReference"]
+                database_item = plan["DatabaseItem"]
+
+                # Get Last Update Timestamp
+                lastUpdateTimestamp = database_item.get("LastUpdate")
+
+                # Get History of the Source Digest
+                digest_history = database_item.get("DigestHistory")
+
+                # Get Digests of the Platforms (only known for Images synchronized with a Platform Filter)
+                source_platforms = database_item.get("SourcePlatforms")
+                destination_platforms = database_item.get("DestinationPlatforms")
+
+                if plan["SourceFuture"] is not None:
+                    # Wait for the Source Repository
+                    source_hash, source_result, source_retcode = plan["SourceFuture"].result()
+
+                    # Wait for the Destination Repository
+                    destination_hash, destination_result, destination_retcode = plan["DestinationFuture"].result()
+
+                    # Set Time for LastCheck
+                    checkTimestamp = int(datetime.now().timestamp())
+                    lastCheckTimestamp = checkTimestamp
+
+                    if self.is_rate_limited(source_result):
+                        # Do not count this as a Check, so that the Image is checked again in the next Run
+                        syncStatus = "DEFERRED_RATE_LIMIT"
+                        lastCheckTimestamp = database_item.get("LastCheck", 0)
+                        source_hash = database_item.get("SourceHash")
+                    elif getattr(source_result, "circuit_open", False) or getattr(destination_result, "circuit_open", False):
+                        # Registry unavailable: keep the previous Values and check the Image again in the next Run
+                        syncStatus = "SKIPPED_REGISTRY_UNAVAILABLE"
+                        lastCheckTimestamp = database_item.get("LastCheck", 0)
+                        source_hash = database_item.get("SourceHash")
+                        destination_hash = database_item.get("DestinationHash")
+                    elif (source_retcode == 0) and (destination_retcode == 0):
+                        if self.compare_manifests(source_hash, source_result, destination_hash, destination_result, plan["Platforms"]):
+                            syncStatus = "OK"
+                        else:
+                            syncStatus = "SYNC_NEEDED"
+                    elif (source_retcode == 0) and classify_result(destination_result) == "not_found":
+                        # Image not synchronized yet
                         syncStatus = "SYNC_NEEDED"
-                else:
-                    if source_retcode == 0:
-                        syncStatus = "ERROR_RETRIEVING_MANIFEST_FROM_DESTINATION"
                     else:
-                        if destination_retcode == 0:
-                            syncStatus = "ERROR_RETRIEVING_MANIFEST_FROM_SOURCE"
+                        if source_retcode == 0:
+                            syncStatus = "ERROR_RETRIEVING_MANIFEST_FROM_DESTINATION"
                         else:
-                            syncStatus = "ERROR_RETRIEVING_MANIFEST_FROM_BOTH"
+                            if destination_retcode == 0:
+                                syncStatus = "ERROR_RETRIEVING_MANIFEST_FROM_SOURCE"
+                            else:
+                                syncStatus = "ERROR_RETRIEVING_MANIFEST_FROM_BOTH"
 
-                if syncStatus != "OK":
-                    print(f"[INFO] [{index+1} / {len(images)}] Image {sourcefullartifactreference} has an updated Image available. Register Image in Synchronization List.")
-            else:
-                # Debug
-                if self.config.get("DEBUG_LEVEL") > 3:
-                    print(f"[DEBUG] [{index+1} / {len(images)}] Recent Check was {deltaTimeLastCheck} Seconds ago (< {self.config.get('SYNC_INTERVAL')} Seconds) ago: use Database Values for {sourcefullartifactreference}")
+                        # Do not count this as a Check, so that the Image is checked again in the next Run
+                        # A Source Image that does not exist (anymore) is only checked again after its normal Interval
+                        if source_retcode == 0 or classify_result(source_result) != "not_found":
+                            lastCheckTimestamp = database_item.get("LastCheck", 0)
 
-                # Get Source Hash
-                source_hash = database_item.get("SourceHash")
+                    # Keep Track of the Changes of the Source Digest (at the Time of this Check)
+                    if source_retcode == 0 and syncStatus not in ["DEFERRED_RATE_LIMIT", "SKIPPED_REGISTRY_UNAVAILABLE"]:
+                        digest_history = update_digest_history(digest_history, source_hash, checkTimestamp)
 
-                # Get Destination Hash
-                destination_hash = database_item.get("DestinationHash")
+                    # Keep the Digests of the Platforms for the next Check
+                    if source_retcode == 0:
+                        source_platforms = getattr(source_result, "platforms", None)
+                    if destination_retcode == 0:
+                        destination_platforms = getattr(destination_result, "platforms", None)
+
+                    if syncStatus == "DEFERRED_RATE_LIMIT":
+                        print(f"[WARNING] [{index+1} / {len(images)}] Rate Limit reached while checking Image {sourcefullartifactreference}. Defer Check to the next Run.")
+                    elif syncStatus == "SKIPPED_REGISTRY_UNAVAILABLE":
+                        # Debug
+                        if self.config.get("DEBUG_LEVEL") > 3:
+                            print(f"[DEBUG] [{index+1} / {len(images)}] Registry unavailable while checking Image {sourcefullartifactreference}. Skip Check until the next Run.")
+                    elif syncStatus == "SYNC_NEEDED":
+                        print(f"[INFO] [{index+1} / {len(images)}] Image {sourcefullartifactreference} has an updated Image available. Register Image in Synchronization List.")
+
+                        # Query the Mirrors while the remaining Checks complete, so that the Sync Phase can start transferring right away
+                        # Only Images that need to be synchronized are probed
+                        for mirror in self.mirrors.get_candidates(sourcefullartifactreference):
+                            plan["MirrorFutures"][mirror] = executor.submit(get_registry(self.mirrors.get_mirror_reference(sourcefullartifactreference, mirror)),
+                                                                            self.mirrors.probe,
+                                                                            sourcefullartifactreference,
+                                                                            mirror,
+                                                                            self.get_manifest_hash
+                                                                            )
+                    elif syncStatus != "OK":
+                        print(f"[WARNING] [{index+1} / {len(images)}] {syncStatus} for Image {sourcefullartifactreference}. Check again in the next Run.")
+                        print(source_result.stderr.strip() if source_retcode != 0 else destination_result.stderr.strip())
+                else:
+                    # Debug
+                    if self.config.get("DEBUG_LEVEL") > 3:
+                        print(f"[DEBUG] [{index+1} / {len(images)}] Recent Check was {plan['DeltaTimeLastCheck']} Seconds ago (Image not due within its Interval of {plan['Interval']} Seconds): use Database Values for {sourcefullartifactreference}")
+
+                    # Get Source Hash
+                    source_hash = database_item.get("SourceHash")
+
+                    # Get Destination Hash
+                    destination_hash = database_item.get("DestinationHash")
+
+                    # Get Last Check Timestamp
+                    lastCheckTimestamp = database_item.get("LastCheck")
+
+                    # Copy Status from previous Run
+                    syncStatus = database_item.get("Status")
+
+                # Current Comparison
+                currentcomparison = comparisonTemplate.copy()
+                currentcomparison["SourceShortArtifactReference"] = row["SourceShortArtifactReference"]
+                currentcomparison["SourceFullArtifactReference"] = sourcefullartifactreference
+                currentcomparison["SourceHash"] = source_hash
+                currentcomparison["DestinationFullArtifactReference"] = destinationfullartifactreference
+                currentcomparison["DestinationHash"] = destination_hash
+                currentcomparison["LastCheck"] = lastCheckTimestamp
+                currentcomparison["LastUpdate"] = lastUpdateTimestamp
+                currentcomparison["Status"] = syncStatus
+                currentcomparison["DigestHistory"] = digest_history
+
+                # Store the Digests of the Platforms, so that the Indexes are only retrieved again when they change
+                if plan["Platforms"] is not None:
+                    currentcomparison["SourcePlatforms"] = source_platforms
+                    currentcomparison["DestinationPlatforms"] = destination_platforms
+
+                # Debug current Comparison
+                if self.config.get("DEBUG_LEVEL") > 5:
+                    print(f"[DEBUG] Comparison View for Item {sourcefullartifactreference}")
+                    print(currentcomparison)
+
+                # Append to List
+                comparison.append(currentcomparison)
+
+                # Persist the Result of the Check right away
+                if plan["SourceFuture"] is not None:
+                    self.checkpoint.add(currentcomparison)
+
+            # Wait for the Mirrors and store the Probes, so that the Sync Phase does not need to query the Mirrors again
+            for plan, currentcomparison in zip(plans, comparison):
+                if len(plan["MirrorFutures"]) > 0:
+                    mirror_results = {mirror: future.result() for mirror, future in plan["MirrorFutures"].items()}
+                    currentcomparison["MirrorHashes"] = {mirror: result[0] for mirror, result in mirror_results.items()}
+                    currentcomparison["Mirror"] = self.mirrors.choose(currentcomparison["SourceHash"], mirror_results)
+
+            # Persist remaining Checkpoints
+            self.checkpoint.flush()
 
-                # Get Last Check Timestamp
-                lastCheckTimestamp = database_item.get("LastCheck")
+        # Info
+        for registry, stats in self.health.dump().items():
+            if stats["Retries"] > 0 or stats["Failures"] > 0 or stats["Skipped"] > 0:
+                print(f"[INFO] Registry {registry}: {stats['Requests']} Request(s), {stats['Retries']} Retry(ies), {stats['Failures']} Failure(s), {stats['Skipped']} Request(s) skipped"
+                      + (f" (unavailable until {unixtimestamp_to_str(int(stats['OpenUntil']))})" if stats["OpenUntil"] > 0 else ""))
 
-                # Copy Status from previous Run
-                syncStatus = database_item.get("Status")
+        # Info
+        if self.destination_snapshot is not None:
+            stats = self.destination_snapshot.stats
+            print(f"[INFO] Destination Snapshot: {stats['Lists']} Tag List(s), {stats['Cached']} Digest(s) from Cache, {stats['Missing']} Tag(s) missing, {stats['Unknown']} Image(s) queried")
 
-            # Current Comparison
-            currentcomparison = comparisonTemplate.copy()
-            currentcomparison["SourceShortArtifactReference"] = row["SourceShortArtifactReference"]
-            currentcomparison["SourceFullArtifactReference"] = sourcefullartifactreference
-            currentcomparison["SourceHash"] = source_hash
-            currentcomparison["DestinationFullArtifactReference"] = destinationfullartifactreference
-            currentcomparison["DestinationHash"] = destination_hash
-            currentcomparison["LastCheck"] = lastCheckTimestamp
-            currentcomparison["LastUpdate"] = lastUpdateTimestamp
-            currentcomparison["Status"] = syncStatus
+        # Debug Comparison
+        if self.config.get("DEBUG_LEVEL") > 3:
+            # Display Comparison (hide some Columns in order to fit properly on Screen)
+            if len(comparison) > 0:
+                print("[DEBUG] Overall Comparison:")
+                print(format_table(comparison,
+                                   hide_columns=["SourceShortArtifactReference",
+                                                 "SourceHash",
+                                                 "DestinationHash",
+                                                 "DigestHistory",
+                                                 "SourcePlatforms",
+                                                 "DestinationPlatforms"],
+                                   timestamp_columns=["LastCheck", "LastUpdate"]
+                                   )
+                      )
 
-            # Debug current Comparison
-            if self.config.get("DEBUG_LEVEL") > 5:
-                print(f"[DEBUG] Comparison View for Item {sourcefullartifactreference}")
-                print(currentcomparison)
+        # Return Result
+        return comparison
 
-            # Append to List
-            comparison.append(currentcomparison)
+    # Check if the Destination Image matches the Source Image
+    # With a Platform Filter only the Manifests of the selected Platforms are compared, since the Index of the Destination only lists these Platforms
+    def compare_manifests(self,
+                          source_hash: str,
+                          source_result: subprocess.CompletedProcess,
+                          destination_hash: str,
+                          destination_result: subprocess.CompletedProcess,
+                          platforms: list[str] | None
+                          ) -> bool:
 
-        # Debug Comparison
-        if self.config.get("DEBUG_LEVEL") > 3:
-            # Create Dataframe and add all Images to it
-            df_comparison = pd.DataFrame.from_records(comparison)
+        # Get Digests of the Platforms (empty for single Platform Images)
+        source_platforms = getattr(source_result, "platforms", None)
+        destination_platforms = getattr(destination_result, "platforms", None)
 
-            if df_comparison.empty is False:
-                # Hide some Columns in order to fit properly on Screen
-                pandas_drop_column_from_dataframe(df_comparison, column_name="SourceShortArtifactReference")
-                pandas_drop_column_from_dataframe(df_comparison, column_name="SourceHash")
-                pandas_drop_column_from_dataframe(df_comparison, column_name="DestinationHash")
+        if platforms is not None and source_platforms and destination_platforms:
+            return select_platform_digests(source_platforms, platforms) == select_platform_digests(destination_platforms, platforms)
 
-                # Format UNIX Timestamp as String
-                df_comparison.LastCheck.apply(lambda x: unixtimestamp_to_str(x))
-                df_comparison.LastUpdate.apply(lambda x: unixtimestamp_to_str(x))
+        # Return Value
+        return source_hash == destination_hash
 
-                # Display Comparison
-                print("[DEBUG] Overall Comparison:")
-                print(df_comparison)
+    # List the Tags of the Destination Repositories used by the given Images
+    def refresh_destination_snapshot(self,
+                                     destination_full_artifact_references: list[str]
+                                     ) -> None:
+
+        # Get Destination Repositories
+        repositories = [parse_reference(reference)[1] for reference in destination_full_artifact_references]
+
+        if len(repositories) == 0:
+            return
+
+        # Walk the Repositories (Tag Lists are fetched concurrently)
+        walker = InventoryWalker(client=self.registry_client,
+                                 registry=self.config.get("DESTINATION_REGISTRY_HOSTNAME"),
+                                 page_size=self.config.get("INVENTORY_PAGE_SIZE"),
+                                 workers=self.config.get("INVENTORY_WORKERS")
+                                 )
+
+        try:
+            self.destination_snapshot.refresh(walker, repositories)
+        except (InventoryError, requests.RequestException) as e:
+            # Display Warning & Error Message (Images of Repositories that could not be listed are queried one by one)
+            print("[WARNING] Listing the Destination Repositories failed. Query each Image instead.")
+            print(e)
+
+    # Submit the Query of a Destination Image
+    # The Destination Snapshot answers directly if it knows that the Tag is missing or has a fresh Digest
+    # Platform Digests are only queried for Images synchronized with a Platform Filter
+    def submit_destination_check(self,
+                                 executor: RegistryExecutor,
+                                 destination_full_artifact_reference: str,
+                                 now: int,
+                                 platform_filter: bool = False,
+                                 known_hash: str | None = None,
+                                 known_platforms: dict[str, str] | None = None
+                                 ) -> Future:
+
+        if self.destination_snapshot is not None:
+            state, digest = self.destination_snapshot.lookup(destination_full_artifact_reference, now)
+
+            # The Platform Digests of a cached Digest are only known if the Index did not change since the previous Check
+            if platform_filter and state == "cached" and (digest != known_hash or known_platforms is None):
+                state = "unknown"
+
+            if state != "unknown":
+                # Build a Result compatible with get_manifest_hash()
+                if state == "cached":
+                    result = subprocess.CompletedProcess(args=["SNAPSHOT", destination_full_artifact_reference],
+                                                         returncode=0,
+                                                         stdout=digest + "\n",
+                                                         stderr=""
+                                                         )
+                else:
+                    result = subprocess.CompletedProcess(args=["SNAPSHOT", destination_full_artifact_reference],
+                                                         returncode=1,
+                                                         stdout="",
+                                                         stderr=f"Tag of {destination_full_artifact_reference} not found in the Destination Repository"
+                                                         )
+
+                result.response = None
+
+                if platform_filter and state == "cached":
+                    result.platforms = known_platforms
+
+                # Return an already completed Future
+                future = Future()
+                future.set_result((digest if digest is not None else "", result, result.returncode))
+                return future
+
+        # Query the Destination Repository
+        if platform_filter:
+            future = executor.submit(get_registry(destination_full_artifact_reference),
+                                     self.get_platform_manifest_hash,
+                                     full_artifact_reference=destination_full_artifact_reference,
+                                     known_hash=known_hash,
+                                     known_platforms=known_platforms
+                                     )
+        else:
+            future = executor.submit(get_registry(destination_full_artifact_reference),
+                                     self.get_manifest_hash,
+                                     full_artifact_reference=destination_full_artifact_reference
+                                     )
+
+        # Remember the Digest for the next Runs
+        if self.destination_snapshot is not None:
+            future.add_done_callback(lambda future: self.destination_snapshot.update(destination_full_artifact_reference, future.result()[0], now) if not future.exception() and future.result()[2] == 0 else None)
+
+        # Return Value
+        return future
+
+    # Remember the Digest of a Destination Image after a successful Transfer
+    def record_destination_digest(self,
+                                  index: int
+                                  ) -> None:
+
+        # Images synchronized with a Platform Filter have their own Index at the Destination
+        if "DestinationPlatforms" in self.current[index]:
+            digest = self.current[index].get("DestinationHash")
+        else:
+            digest = self.current[index].get("SourceHash")
+
+        if self.destination_snapshot is not None and digest:
+            self.destination_snapshot.update(self.current[index]["DestinationFullArtifactReference"],
+                                             digest,
+                                             int(datetime.now().timestamp())
+                                             )
+
+    # Get the Platforms to synchronize for an Image (None synchronizes all Platforms)
+    def get_platforms(self,
+                      source_full_artifact_reference: str
+                      ) -> list[str] | None:
+
+        # Configured Image
+        image = self.images_by_source_reference.get(source_full_artifact_reference, dict())
+
+        # Settings of the Configuration Files override SYNC_PLATFORMS ("all" disables the Filter)
+        platforms = image.get("Platforms")
+        if platforms is None:
+            platforms = self.platforms
+
+        # Return Value
+        return platforms or None
+
+    # Get the Manifest Digest of an Image together with the Digest of each of its Platforms
+    # The Platform Digests are exposed as "platforms" Attribute of the Result (empty for single Platform Images)
+    # The Index is only retrieved if its Digest differs from the one of the previous Check
+    def get_platform_manifest_hash(self,
+                                   full_artifact_reference: str,
+                                   known_hash: str | None = None,
+                                   known_platforms: dict[str, str] | None = None
+                                   ) -> (str, subprocess.CompletedProcess, int):
+
+        # Query the Digest of the Index
+        hash_value, result, retcode = self.get_manifest_hash(full_artifact_reference=full_artifact_reference)
+
+        if retcode == 0:
+            result.platforms = self.get_index_platforms(full_artifact_reference, hash_value, result, known_hash, known_platforms)
+
+            if getattr(result, "platforms_error", None) is not None:
+                # Report the Error as if the Query failed
+                hash_value = ""
+                retcode = result.returncode = 1
+                result.stderr = result.platforms_error
 
         # Return Result
-        return comparison
+        return (hash_value, result, retcode)
+
+    # Get the Digest of each Platform of the Index with the given Digest
+    # Errors are reported as "platforms_error" Attribute of the Result
+    def get_index_platforms(self,
+                            full_artifact_reference: str,
+                            hash_value: str,
+                            result: subprocess.CompletedProcess,
+                            known_hash: str | None = None,
+                            known_platforms: dict[str, str] | None = None
+                            ) -> dict[str, str] | None:
+
+        # The Index did not change since the previous Check
+        if hash_value == known_hash and known_platforms is not None:
+            return known_platforms
+
+        # Retrieving the Index counts as a Pull (e.g. on Docker Hub): defer the Check if no Pull is left
+        registry, repository, _ = parse_reference(full_artifact_reference)
+
+        if not self.ratelimit.try_acquire(registry):
+            result.rate_limited = True
+            result.platforms_error = f"Not enough Pulls left in the Rate Limit Budget of {registry} to retrieve the Index of {full_artifact_reference}"
+            return None
+
+        try:
+            # Retrieve the Index by Digest, so that it matches the queried Digest
+            manifest, _, manifest_result = self.query_manifest(f"{registry}/{repository}@{hash_value}")
+        finally:
+            # Release Reservation
+            self.ratelimit.release(registry)
+
+        # Expose Response to the Caller for further Inspection (Headers, Status Code)
+        if hasattr(manifest_result, "response"):
+            result.response = manifest_result.response
+
+        if manifest is None:
+            result.platforms_error = manifest_result.stderr
+            return None
+
+        # Single Platform Images have no Platform Digests
+        digests = get_platform_digests(manifest)
+
+        # Return Result
+        return digests if digests is not None else dict()
+
+    # Get the Interval between two Checks of an Image
+    def get_check_interval(self,
+                           source_full_artifact_reference: str,
+                           now: int
+                           ) -> int:
+
+        # Configured Image & Database Item
+        image = self.images_by_source_reference.get(source_full_artifact_reference, dict())
+        database_item = self.database_by_source_reference.get(source_full_artifact_reference, dict())
+
+        # Return Value
+        return self.intervals.get_interval(tag=image.get("Tag") or source_full_artifact_reference.rsplit(":", 1)[-1],
+                                           history=database_item.get("DigestHistory"),
+                                           now=now,
+                                           override=image.get("Interval")
+                                           )
+
+    # Report planned and actual Load of the current Run and keep a short History
+    def report_scheduler_load(self,
+                              plans: list[dict[str, Any]],
+                              now: int
+                              ) -> None:
+
+        # Get Scheduler State of previous Runs
+        state = self.get_state("scheduler", dict())
+
+        # Time elapsed since the previous Run (fall back to the configured Period for the first Run)
+        elapsed = now - state["LastRun"] if state.get("LastRun") else self.scheduler.run_period
+
+        # Compute Load
+        planned = self.scheduler.get_planned_load(len(plans), elapsed, [plan["Interval"] for plan in plans])
+        actual = sum(1 for plan in plans if plan["SourceFuture"] is not None)
+
+        # Info
+        print(f"[INFO] Scheduler ({self.config.get('SYNC_SCHEDULER')}): {actual} / {len(plans)} Image(s) due in this Run "
+              f"(planned {planned:.1f} for {elapsed} Seconds since the previous Run, SYNC_INTERVAL = {self.scheduler.interval} Seconds)")
+
+        # Info
+        if self.intervals.enabled and len(plans) > 0:
+            intervals = sorted(plan["Interval"] for plan in plans)
+            print(f"[INFO] Adaptive Intervals: median {intervals[len(intervals) // 2]} Seconds (min {intervals[0]}, max {intervals[-1]}), "
+                  f"{sum(1 for interval in intervals if interval > self.scheduler.interval)} / {len(plans)} Image(s) checked less often than every SYNC_INTERVAL")
+
+        # Keep the History of the last Runs
+        history = state.get("History", [])
+        history.append(dict(Time=now, Images=len(plans), Elapsed=elapsed, Planned=round(planned, 1), Actual=actual))
+
+        # Save Scheduler State
+        self.set_state("scheduler", dict(LastRun=now, History=history[-48:]))
 
     # Get Database Index
     def get_database_index(self,
@@ -919,6 +2662,18 @@ class SyncRegistries:
                            destination_fully_qualified_artifact_reference: str | None = None,
                            ) -> int:
 
+        # Resolve Destination Reference using the indexed Lookup of the State Store
+        if source_fully_qualified_artifact_reference is None and destination_fully_qualified_artifact_reference is not None:
+            if self.config.get("DATABASE_BACKEND") != "sqlite":
+                return None
+
+            destination_item = self.get_state_store().get_by_destination(destination_fully_qualified_artifact_reference)
+
+            if destination_item is None:
+                return None
+
+            source_fully_qualified_artifact_reference = destination_item["SourceFullArtifactReference"]
+
         # Get Dict Item by Key
         item = self.database_by_source_reference.get(source_fully_qualified_artifact_reference)
 
@@ -930,11 +2685,22 @@ class SyncRegistries:
             return None
 
     # Sync Image
+    # All Platforms are synchronized, unless a List of Platforms is given
     def sync_image(self,
                    source_full_artifact_reference: str,
-                   destination_full_artifact_reference: str
+                   destination_full_artifact_reference: str,
+                   platforms: list[str] | None = None,
+                   acquire: Callable[[int], bool] | None = None
                    ) -> subprocess.CompletedProcess:
 
+        # Only copy the selected Platforms
+        if platforms is not None:
+            return self.sync_image_platforms(source_full_artifact_reference=source_full_artifact_reference,
+                                             destination_full_artifact_reference=destination_full_artifact_reference,
+                                             platforms=platforms,
+                                             acquire=acquire
+                                             )
+
         # Get SYNC_TOOL
         sync_tool = self.config.get("SYNC_TOOL")
 
@@ -979,6 +2745,16 @@ class SyncRegistries:
                 print("[DEBUG] Perform Synchronization using Crane")
                 print(f"[DEBUG] Run Command: {' '.join(command_sync)}")
 
+        elif sync_tool == "native":
+            # Debug
+            if self.config.get("DEBUG_LEVEL") > 3:
+                print("[DEBUG] Perform Synchronization using the native Copy")
+
+            # Copy all Platforms (mounting Blobs that are already stored in the Destination Registry)
+            return self.copier.copy_image(source_full_artifact_reference=source_full_artifact_reference,
+                                          destination_full_artifact_reference=destination_full_artifact_reference
+                                          )
+
         elif sync_tool == "regctl":
             # These additional Options might be required in some Cases
             # "--include-external",
@@ -1005,110 +2781,512 @@ class SyncRegistries:
             print(f"[ERROR] Invalid Setting for SYNC_TOOL: {sync_tool}")
             sys.exit(1)
 
-        result_sync = subprocess.run(command_sync,
-                                     stdout=subprocess.PIPE,
-                                     stderr=subprocess.PIPE,
-                                     universal_newlines=True,
-                                     text=True
-                                     )
+        result_sync = self.run_command(command_sync)
 
         # Return Result
         return result_sync
 
+    # Sync the selected Platforms of an Image
+    # The Manifest of each selected Platform is copied by Digest using SYNC_TOOL, then an Index only listing these Platforms is uploaded
+    # The Digest of this Index differs from the Source, so the Digests of the Platforms are exposed as "platforms" Attribute of the Result
+    # The Pulls of the Manifests to copy are reserved using acquire(Count) once the Index is known
+    # If no Pull is left, the Result has the Attribute "deferred" set
+    def sync_image_platforms(self,
+                             source_full_artifact_reference: str,
+                             destination_full_artifact_reference: str,
+                             platforms: list[str],
+                             acquire: Callable[[int], bool] | None = None
+                             ) -> subprocess.CompletedProcess:
+
+        # Description of the Operation (used as "args" of the Result)
+        args = ["COPY", source_full_artifact_reference, destination_full_artifact_reference, "--platforms", ",".join(platforms)]
+
+        # Split References
+        source_registry, source_repository, _ = parse_reference(source_full_artifact_reference)
+        destination_registry, destination_repository, _ = parse_reference(destination_full_artifact_reference)
+
+        # Get the Index of the Source
+        manifest, media_type, result = self.query_manifest(source_full_artifact_reference)
+
+        if manifest is None:
+            return result
+
+        if get_platform_digests(manifest) is None:
+            # Single Platform Image: nothing to filter, copy it as it is
+            if acquire is not None and not acquire(1):
+                return self.deferred_result(args, source_full_artifact_reference)
+
+            result = self.sync_image(source_full_artifact_reference=source_full_artifact_reference,
+                                     destination_full_artifact_reference=destination_full_artifact_reference
+                                     )
+
+            # The Digest is preserved by the Copy
+            result.platforms = dict()
+            result.digest = None
+            return result
+
+        # Only keep the selected Platforms
+        index = filter_index(manifest, platforms)
+        digests = get_platform_digests(index)
+
+        if len(digests) == 0:
+            return subprocess.CompletedProcess(args=args,
+                                               returncode=1,
+                                               stdout="",
+                                               stderr=f"None of the Platforms {', '.join(platforms)} is available for {source_full_artifact_reference} (available: {', '.join(get_platform_digests(manifest))})"
+                                               )
+
+        # Reserve one Pull for each Manifest to copy (a Platform of the Filter might match several Variants, Attestations are copied as well)
+        if acquire is not None and not acquire(len(index["manifests"])):
+            return self.deferred_result(args, source_full_artifact_reference)
+
+        # Debug
+        if self.config.get("DEBUG_LEVEL") > 3:
+            print(f"[DEBUG] Copy {len(digests)} / {len(get_platform_digests(manifest))} Platform(s) of {source_full_artifact_reference}: {', '.join(digests)}")
+
+        # Copy the Manifest of each Platform (and its Attestations) by Digest
+        for descriptor in index["manifests"]:
+            result = self.copy_artifact(source_full_artifact_reference=f"{source_registry}/{source_repository}@{descriptor['digest']}",
+                                        destination_full_artifact_reference=f"{destination_registry}/{destination_repository}@{descriptor['digest']}"
+                                        )
+
+            if result.returncode != 0:
+                return result
+
+        # Upload the filtered Index
+        body = json.dumps(index, indent=3).encode()
+        result = self.upload_manifest(destination_full_artifact_reference, body, media_type or "application/vnd.oci.image.index.v1+json")
+
+        if result.returncode != 0:
+            return result
+
+        # Digest of the filtered Index
+        digest = result.stdout.strip() or "sha256:" + hashlib.sha256(body).hexdigest()
+
+        # Return Result
+        result = subprocess.CompletedProcess(args=args,
+                                             returncode=0,
+                                             stdout=digest + "\n",
+                                             stderr=""
+                                             )
+
+        result.platforms = digests
+        result.digest = digest
+        return result
+
+    # Result of a Transfer deferred because no Pull is left in the Rate Limit Budget
+    def deferred_result(self,
+                        args: list[str],
+                        source_full_artifact_reference: str
+                        ) -> subprocess.CompletedProcess:
+
+        result = subprocess.CompletedProcess(args=args,
+                                             returncode=1,
+                                             stdout="",
+                                             stderr=f"Not enough Pulls left in the Rate Limit Budget of {get_registry(source_full_artifact_reference)}"
+                                             )
+
+        result.deferred = True
+        return result
+
+    # Sync Image while respecting the Rate Limit Budget of the Source Registry
+    # Returns None if the Transfer must be deferred to a later Run
+    def sync_image_within_budget(self,
+                                 source_full_artifact_reference: str,
+                                 destination_full_artifact_reference: str,
+                                 platforms: list[str] | None = None
+                                 ) -> subprocess.CompletedProcess | None:
+
+        # Get Source Registry
+        registry = get_registry(source_full_artifact_reference)
+
+        # Number of Pulls reserved: the Image (or the Source Index of a filtered Copy) ...
+        reserved = [1]
+
+        # ... and, for a filtered Copy, each Manifest to copy once the Index is known
+        def acquire(count: int) -> bool:
+            if not self.ratelimit.try_acquire(registry, count):
+                return False
+
+            reserved.append(count)
+            return True
+
+        # Reserve Pulls
+        if not self.ratelimit.try_acquire(registry, 1):
+            return None
+
+        # Get Start Time
+        start = time.monotonic()
+
+        try:
+            # Perform Sync
+            with self.tracer.span("sync_image", category="transfer", source=source_full_artifact_reference, destination=destination_full_artifact_reference):
+                result = self.sync_image(source_full_artifact_reference=source_full_artifact_reference,
+                                         destination_full_artifact_reference=destination_full_artifact_reference,
+                                         platforms=platforms,
+                                         acquire=acquire
+                                         )
+        finally:
+            # Release Reservation
+            self.ratelimit.release(registry, sum(reserved))
+
+        # Not enough Pulls left for the Manifests of the selected Platforms
+        if getattr(result, "deferred", False):
+            return None
+
+        # Keep Track of the Duration of each Transfer
+        self.metrics.observe("transfer_duration_seconds",
+                             time.monotonic() - start,
+                             registry=registry,
+                             result="ok" if result.returncode == 0 else "error"
+                             )
+
+        # Return Result
+        return result
+
+    # Create an additional Tag at the Destination from an Image that is already there
+    # No Data is pulled from the Source Registry
+    def retag_image(self,
+                    source_full_artifact_reference: str,
+                    destination_full_artifact_reference: str
+                    ) -> subprocess.CompletedProcess:
+
+        # Split References
+        source_registry, source_repository, _ = parse_reference(source_full_artifact_reference)
+        destination_registry, destination_repository, _ = parse_reference(destination_full_artifact_reference)
+
+        if self.config.get("MANIFEST_BACKEND") == "native" and (source_registry, source_repository) == (destination_registry, destination_repository):
+            # Same Repository: a Manifest-only PUT is enough
+            return self.registry_client.tag_manifest(source_full_artifact_reference=source_full_artifact_reference,
+                                                     destination_full_artifact_reference=destination_full_artifact_reference
+                                                     )
+
+        # Different Repository: copy within the Destination Registry (Blobs are mounted or copied locally, not pulled from the Source)
+        return self.copy_artifact(source_full_artifact_reference=source_full_artifact_reference,
+                                  destination_full_artifact_reference=destination_full_artifact_reference
+                                  )
+
+    # Copy an Artifact (Tag or Digest) as it is using SYNC_TOOL
+    def copy_artifact(self,
+                      source_full_artifact_reference: str,
+                      destination_full_artifact_reference: str
+                      ) -> subprocess.CompletedProcess:
+
+        # Get SYNC_TOOL
+        sync_tool = self.config.get("SYNC_TOOL")
+
+        if sync_tool == "native":
+            return self.copier.copy_image(source_full_artifact_reference=source_full_artifact_reference,
+                                          destination_full_artifact_reference=destination_full_artifact_reference
+                                          )
+        elif sync_tool == "skopeo":
+            command_copy = COMMAND_SKOPEO.copy()
+            command_copy.extend(
+                                [
+                                    "copy",
+                                    "--all",
+                                    "--preserve-digests",
+                                    f"docker://{source_full_artifact_reference}",
+                                    f"docker://{destination_full_artifact_reference}"
+                                ]
+                                )
+        elif sync_tool == "crane":
+            command_copy = COMMAND_CRANE.copy()
+            command_copy.extend(
+                                [
+                                    "copy",
+                                    source_full_artifact_reference,
+                                    destination_full_artifact_reference
+                                ]
+                                )
+        else:
+            command_copy = COMMAND_REGCTL.copy()
+            command_copy.extend(
+                                [
+                                    "image",
+                                    "copy",
+                                    source_full_artifact_reference,
+                                    destination_full_artifact_reference
+                                ]
+                                )
+
+        # Debug
+        if self.config.get("DEBUG_LEVEL") > 3:
+            print(f"[DEBUG] Run Command: {' '.join(command_copy)}")
+
+        # Return Result
+        return self.run_command(command_copy)
+
+    # Defer the Synchronization of an Image to the next Run
+    def defer_image(self,
+                    index: int
+                    ) -> None:
+
+        # Echo
+        print(f"[WARNING] [{index+1}/{len(self.current)}] Rate Limit Budget of {get_registry(self.current[index]['SourceFullArtifactReference'])} exhausted. Defer Synchronization of Image {self.current[index]['SourceFullArtifactReference']} to the next Run.")
+
+        # Set the Status and do not count this as a Check, so that the Image is checked and synchronized in the next Run
+        self.current[index]["Status"] = "DEFERRED_RATE_LIMIT"
+        self.current[index]["LastCheck"] = 0
+
     # Synchronize Images based on Manifest Digest Comparison
-    # This will synchronize ALL Architectures / Platforms
+    # This will synchronize ALL Architectures / Platforms, unless Platforms are selected using SYNC_PLATFORMS or "platforms" in the Configuration Files
     def sync_images_based_on_manifest_digest(self):
 
         # Debug
         if self.config.get("DEBUG_LEVEL") > 3:
-            # Create Dataframe from current Data
-            df_debug = pd.DataFrame.from_records(self.current)
+            # Filter Images that need to be synchronized
+            filtered = [row for row in self.current if row["Status"] == "SYNC_NEEDED"]
 
-            if df_debug.empty is False:
-                # Filter Dataframe
-                df_filtered = df_debug[df_debug["Status"] != "OK"]
-
-                # Display List of Images to be synchronized
-                display(df_filtered)
+            # Display List of Images to be synchronized
+            if len(filtered) > 0:
+                print(format_table(filtered, timestamp_columns=["LastCheck", "LastUpdate"]))
 
         # Echo
         print("[INFO] Run Synchronization for Images that require it")
 
-        # Iterate Over All Images that need to be synchronized
-        # Move away from Dataframe df_comparison.iterrows():
+        # Display Rate Limit Budgets
+        for registry, budget in self.ratelimit.dump().items():
+            print(f"[INFO] Rate Limit Budget for {registry}: {budget['Remaining']} / {budget['Limit']} Pulls remaining (Window of {budget['Window']} Seconds, Reset at the latest on {unixtimestamp_to_str(budget['ResetAt'])})")
+
+        # Limit the Number of concurrent Transfers globally and (optionally) for each Source Registry
+        executor = RegistryExecutor(global_limit=self.config.get("SYNC_WORKERS"),
+                                    registry_limits=parse_limits(self.config.get("SYNC_REGISTRY_LIMITS")),
+                                    default_limit=self.config.get("SYNC_WORKERS"),
+                                    name="sync"
+                                    )
+
+        # Group Images that need to be synchronized (Images with the same Source Manifest Digest are transferred only once)
+        groups = dict()
         for index, row in enumerate(self.current):
+            # Images that could not be checked (Errors, Rate Limits, unavailable Registries) are checked again in the next Run instead
             syncStatus = row["Status"]
-            if syncStatus != "OK":
-                # Define Source Full Artifact Reference
-                original_source_full_artifact_reference = str(row['SourceFullArtifactReference'])
-                source_full_artifact_reference = original_source_full_artifact_reference
+            if syncStatus == "SYNC_NEEDED":
+                if self.config.get("SYNC_DEDUPLICATE") == "true" and row.get("SourceHash"):
+                    # Images synchronized with different Platforms do not share the same Destination Index
+                    key = (row["SourceHash"], tuple(self.get_platforms(row["SourceFullArtifactReference"]) or []))
+                else:
+                    key = index
+
+                groups.setdefault(key, []).append(index)
+
+        # Submitted Transfers
+        futures = dict()
+
+        with executor:
+            # Iterate Over All Images that need to be synchronized
+            # Move away from Dataframe df_comparison.iterrows():
+            for indexes in groups.values():
+                index = indexes[0]
+                futures[index] = executor.submit(get_registry(str(self.current[index]["SourceFullArtifactReference"])),
+                                                 self.sync_image_group,
+                                                 indexes=indexes
+                                                 )
+
+                # Persist the Result of the Transfers as soon as they complete
+                futures[index].add_done_callback(lambda future, indexes=indexes: [self.checkpoint.add(self.current[index]) for index in indexes])
+
+            # Wait for all Transfers to complete
+            for index, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    # Display Error Message
+                    print(f"[ERROR] [{index+1}/{len(self.current)}] Synchronization of Image {self.current[index]['SourceFullArtifactReference']} failed unexpectedly")
+                    print(e)
+
+            # Persist remaining Checkpoints
+            self.checkpoint.flush()
+
+        # Save the cached Digests of the Destination Images
+        if self.destination_snapshot is not None:
+            self.set_state("destination_snapshot", self.destination_snapshot.dump())
+
+        # Save Statistics of the Mirrors
+        mirror_stats = self.mirrors.dump()
+        if len(mirror_stats) > 0:
+            self.set_state("mirrors", mirror_stats)
+
+            # Info
+            for mirror, stats in mirror_stats.items():
+                print(f"[INFO] Mirror {mirror}: {stats['Matches']} / {stats['Probes']} Probe(s) matching, {stats['Transfers'] - stats['TransferFailures']} / {stats['Transfers']} Transfer(s) successful"
+                      + (f", average Latency {stats['Latency'] * 1000:.0f} ms" if stats["Latency"] is not None else ""))
+
+        if self.config.get("SYNC_TOOL") == "native":
+            # Info
+            stats = self.copier.stats
+            print(f"[INFO] Native Copy: {stats['Mounted']} Blob(s) mounted, {stats['Existing']} Blob(s) already present, {stats['Uploaded']} Blob(s) uploaded ({stats['BytesUploaded'] / 1024 / 1024:.1f} MiB)")
+
+            # Save Location of the Blobs stored in the Destination Registry
+            if self.copier.blob_index.dirty:
+                self.set_state("blobs", self.copier.blob_index.dump())
+                self.copier.blob_index.dirty = False
+
+    # Synchronize a Group of Images sharing the same Source Manifest Digest
+    # The first Image is transferred from the Source, the other ones are tagged at the Destination
+    def sync_image_group(self,
+                         indexes: list[int]
+                         ) -> None:
+
+        # Transfer the first Image
+        leader_index = indexes[0]
+        self.sync_single_image(index=leader_index, row=self.current[leader_index])
+
+        for index in indexes[1:]:
+            if self.current[leader_index]["Status"] == "OK":
+                # Echo
+                print(f"[INFO] [{index+1}/{len(self.current)}] Image {self.current[index]['SourceFullArtifactReference']} has the same Digest as {self.current[leader_index]['SourceFullArtifactReference']}. Tag it at the Destination instead of transferring it again.")
+
+                # Tag at the Destination
+                with self.tracer.span("retag_image", category="transfer", source=self.current[leader_index]["DestinationFullArtifactReference"], destination=self.current[index]["DestinationFullArtifactReference"]):
+                    result_retag = self.retag_image(source_full_artifact_reference=self.current[leader_index]["DestinationFullArtifactReference"],
+                                                    destination_full_artifact_reference=self.current[index]["DestinationFullArtifactReference"]
+                                                    )
+
+                if result_retag.returncode == 0:
+                    # Set the Status to OK
+                    self.current[index]["Status"] = "OK"
+
+                    # Set the LastUpdate Field to the current Timestamp
+                    self.current[index]["LastUpdate"] = int(datetime.now().timestamp())
+
+                    # The filtered Index of the first Image has been copied as it is
+                    if "DestinationPlatforms" in self.current[leader_index]:
+                        self.current[index]["DestinationHash"] = self.current[leader_index]["DestinationHash"]
+                        self.current[index]["DestinationPlatforms"] = self.current[leader_index]["DestinationPlatforms"]
+
+                    # Remember the new Digest of the Destination Image
+                    self.record_destination_digest(index)
+
+                    continue
+
+                # Display Error Message
+                print(f"[ERROR] [{index+1}/{len(self.current)}] {result_retag.stderr}")
 
-                # Define Destination Artifact Reference for use with Skopeo requires removing the actual Image Name and Tag, while only keeping the Registry + Repository
-                destination_full_artifact_reference = str(row['DestinationFullArtifactReference'])
-                # destination_artifact_parts = str(row['DestinationFullArtifactReference']).split("/")
-                # destination_artifact_skopeo = "/".join(destination_artifact_parts[0:-1])
+            # Fall back to a full Transfer
+            self.sync_single_image(index=index, row=self.current[index])
 
-                # Define Source Hash
-                source_hash = str(row['SourceHash'])
+    # Synchronize a single Image
+    # Updates the Status and LastUpdate Fields of the corresponding Item in self.current
+    def sync_single_image(self,
+                          index: int,
+                          row: dict[str, Any]
+                          ) -> None:
+
+        # Get Status
+        syncStatus = row["Status"]
+
+        # Define Source Full Artifact Reference
+        original_source_full_artifact_reference = str(row['SourceFullArtifactReference'])
+        source_full_artifact_reference = original_source_full_artifact_reference
+
+        # Define Destination Artifact Reference for use with Skopeo requires removing the actual Image Name and Tag, while only keeping the Registry + Repository
+        destination_full_artifact_reference = str(row['DestinationFullArtifactReference'])
+        # destination_artifact_parts = str(row['DestinationFullArtifactReference']).split("/")
+        # destination_artifact_skopeo = "/".join(destination_artifact_parts[0:-1])
+
+        # Define Source Hash
+        source_hash = str(row['SourceHash'])
+
+        # Platforms to synchronize (None synchronizes all Platforms)
+        platforms = self.get_platforms(original_source_full_artifact_reference)
+
+        # Echo
+        print(f"[INFO] [{index+1}/{len(self.current)}] {syncStatus} Perform Synchronization for Image {source_full_artifact_reference}")
+
+        # Mirror used for the Transfer (None if the Image is downloaded from the Source Registry)
+        mirror = None
+
+        # Try to see if the Manifest Digest is the same on a Mirror (e.g. mirror.gcr.io for docker.io, since there is no Rate Limit there)
+        if "MirrorHashes" in row:
+            # Mirrors were already probed during the Scan
+            if row.get("Mirror") is not None and not self.mirrors.is_demoted(row["Mirror"]):
+                mirror = row["Mirror"]
+
+                # Update Source
+                source_full_artifact_reference = self.mirrors.get_mirror_reference(original_source_full_artifact_reference, mirror)
 
                 # Echo
-                print(f"[INFO] [{index+1}/{len(self.current)}] {syncStatus} Perform Synchronization for Image {source_full_artifact_reference}")
-
-                if self.config.get("ENABLE_DOCKER_HUB_MIRROR"):
-                    # For docker.io, try to see if the Manifest Digest is the same on mirror.gcr.io, since there is no Rate Limit there
-                    if str(row['SourceFullArtifactReference']).startswith("docker.io"):
-                        # Echo
-                        print(f"[INFO] [{index+1}/{len(self.current)}] Check if {source_full_artifact_reference} can be downloaded from mirror.gcr.io")
-
-                        # Mirror Full Artifact Reference
-                        mirror_full_artifact_reference = source_full_artifact_reference.replace("docker.io", "mirror.gcr.io")
-
-                        # Query the Mirror Repository
-                        mirror_hash, mirror_result, mirror_retcode = self.get_manifest_hash(full_artifact_reference=mirror_full_artifact_reference)
-
-                        # If Image could be found on the Mirror
-                        if (mirror_retcode == 0):
-                            # If Hashes are the same, switch over to mirror.gcr.io, otherwise leave it as it is
-                            if mirror_hash == source_hash:
-                                # Update Source
-                                source_full_artifact_reference = mirror_full_artifact_reference
-
-                                # Echo
-                                print(f"[INFO] [{index+1}/{len(self.current)}] Image Hash matches. Image {original_source_full_artifact_reference} will be downloaded from {source_full_artifact_reference} using mirror.gcr.io instead.")
-                                print(f"[INFO] [{index+1}/{len(self.current)}] Image {original_source_full_artifact_reference} will be synced to {destination_full_artifact_reference}.")
-
-                # Perform Sync
-                result_sync = self.sync_image(source_full_artifact_reference=source_full_artifact_reference,
-                                              destination_full_artifact_reference=destination_full_artifact_reference
-                                              )
+                print(f"[INFO] [{index+1}/{len(self.current)}] Image Hash matches. Image {original_source_full_artifact_reference} will be downloaded from {source_full_artifact_reference} using {mirror} instead.")
+        elif len(self.mirrors.get_candidates(original_source_full_artifact_reference)) > 0:
+            # Echo
+            print(f"[INFO] [{index+1}/{len(self.current)}] Check if {source_full_artifact_reference} can be downloaded from a Mirror ({', '.join(self.mirrors.get_candidates(original_source_full_artifact_reference))})")
+
+            # Query all Mirrors in parallel
+            mirror_results = self.mirrors.probe_all(original_source_full_artifact_reference, self.get_manifest_hash)
+
+            # If Hashes are the same, switch over to the best Mirror, otherwise leave it as it is
+            mirror = self.mirrors.choose(source_hash, mirror_results)
+
+            if mirror is not None:
+                # Update Source
+                source_full_artifact_reference = self.mirrors.get_mirror_reference(original_source_full_artifact_reference, mirror)
+
+                # Echo
+                print(f"[INFO] [{index+1}/{len(self.current)}] Image Hash matches. Image {original_source_full_artifact_reference} will be downloaded from {source_full_artifact_reference} using {mirror} instead.")
+                print(f"[INFO] [{index+1}/{len(self.current)}] Image {original_source_full_artifact_reference} will be synced to {destination_full_artifact_reference}.")
+
+        # Perform Sync
+        result_sync = self.sync_image_within_budget(source_full_artifact_reference=source_full_artifact_reference,
+                                                    destination_full_artifact_reference=destination_full_artifact_reference,
+                                                    platforms=platforms
+                                                    )
+
+        if result_sync is None:
+            # Not enough Pulls left: defer the Transfer to the next Run
+            self.defer_image(index)
+            return
+
+        # Keep Track of the Transfers performed using a Mirror
+        if mirror is not None:
+            self.mirrors.record_transfer(mirror, success=result_sync.returncode == 0)
+
+        if result_sync.returncode != 0:
+            # text_sync = result_sync.stderr.rsplit("\n")
+            print(f"[ERROR] [{index+1}/{len(self.current)}] {result_sync.stderr}")
+
+            # If we were using a Mirror (e.g. mirror.gcr.io), it's possible that will not work, since --preserve-manifest seems to fail on some Repositories
+            # Try again by pulling the original Image
+            if original_source_full_artifact_reference != source_full_artifact_reference:
+                # Echo
+                print(f"[INFO] [{index+1}/{len(self.current)}] Try to download Image {original_source_full_artifact_reference} directly without using Mirror.")
+                print(f"[INFO] [{index+1}/{len(self.current)}] Image {original_source_full_artifact_reference} will be synced to {destination_full_artifact_reference}.")
+
+                result_sync = self.sync_image_within_budget(source_full_artifact_reference=original_source_full_artifact_reference,
+                                                            destination_full_artifact_reference=destination_full_artifact_reference,
+                                                            platforms=platforms
+                                                            )
+
+                if result_sync is None:
+                    # Not enough Pulls left: defer the Transfer to the next Run
+                    self.defer_image(index)
+                    return
 
                 if result_sync.returncode != 0:
-                    # text_sync = result_sync.stderr.rsplit("\n")
                     print(f"[ERROR] [{index+1}/{len(self.current)}] {result_sync.stderr}")
 
-                    # If we were using mirror.gcr.io, it's possible that will not work, since --preserve-manifest seems to fail on some Repositories
-                    # Try again by pulling the original docker.io Image
-                    if original_source_full_artifact_reference != source_full_artifact_reference:
-                        # Echo
-                        print(f"[INFO] [{index+1}/{len(self.current)}] Try to download Image {original_source_full_artifact_reference} directly without using Mirror.")
-                        print(f"[INFO] [{index+1}/{len(self.current)}] Image {original_source_full_artifact_reference} will be synced to {destination_full_artifact_reference}.")
+        # Update Bookkeeping if the Synchronization (possibly after the Fallback) succeeded
+        if result_sync.returncode == 0:
+            # Set the LastUpdate Field to the current Timestamp
+            # df_comparison.loc[index, 'LastUpdate'] = int(datetime.now().timestamp())
 
-                        result_sync = self.sync_image(source_full_artifact_reference=original_source_full_artifact_reference,
-                                                      destination_full_artifact_reference=destination_full_artifact_reference
-                                                      )
-                else:
-                    # Set the LastUpdate Field to the current Timestamp
-                    # df_comparison.loc[index, 'LastUpdate'] = int(datetime.now().timestamp())
+            # Set the Status to OK
+            self.current[index]["Status"] = "OK"
 
-                    # Set the Status to OK
-                    self.current[index]["Status"] = "OK"
+            # Set the LastUpdate Field to the current Timestamp
+            self.current[index]["LastUpdate"] = int(datetime.now().timestamp())
 
-                    # Set the LastUpdate Field to the current Timestamp
-                    self.current[index]["LastUpdate"] = int(datetime.now().timestamp())
+            # The Index of a filtered Copy differs from the Source
+            if hasattr(result_sync, "platforms"):
+                self.current[index]["DestinationHash"] = result_sync.digest or self.current[index]["SourceHash"]
+                self.current[index]["DestinationPlatforms"] = result_sync.platforms
 
-                    # text_sync = result_sync.stdout.rsplit("\n")
-                    # Debug
-                    # print(text_sync)
+            # Remember the new Digest of the Destination Image
+            self.record_destination_digest(index)
+
+            # text_sync = result_sync.stdout.rsplit("\n")
+            # Debug
+            # print(text_sync)
 
     # Format Command
     def format_command(self,
@@ -1157,58 +3335,75 @@ class SyncRegistries:
         # Debug
         # print(f"Command: {command}")
 
-        result = subprocess.run(command,
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE,
-                                universal_newlines=True,
-                                text=True
-                                )
+        result = self.run_command(command)
 
         output = result.stdout
 
         # Return
         return result
 
-    # Get Repositories from a Registry
+    # List a paginated Regctl Listing ("repo ls" / "tag ls") and return the Items stored under the given Key
+    def regctl_list(self,
+                    kind: str,
+                    reference: str,
+                    key: str,
+                    limit: int = 1000
+                    ) -> list[str]:
+
+        # Declare List
+        items = []
+
+        # Last Item of the previous Page
+        last = None
+
+        while True:
+            # Perform Command
+            result = self.regctl(kind,
+                                 "ls",
+                                 reference,
+                                 "--limit",
+                                 limit,
+                                 ["--last", last] if last is not None else [],
+                                 # Make sure **NOT** to add Quotes around the Format Parameter
+                                 # Do **NOT** use "--format='{{json .}}'" as this will add a Literal single Quote at the Beginning and End of the Output !
+                                 "--format={{json .}}"
+                                 )
+
+            if result.returncode != 0:
+                raise InventoryError(result.stderr.strip())
+
+            try:
+                page = json.loads(result.stdout).get(key) or []
+            except (ValueError, AttributeError) as e:
+                raise InventoryError(f"Invalid Output of regctl {kind} ls {reference}: {e}")
+
+            items.extend(page)
+
+            # Last Page
+            if len(page) < int(limit):
+                break
+
+            last = page[-1]
+
+        # Return Result
+        return items
+
+    # Get Repositories from a Registry (using regctl)
     def get_repositories(self,
                          registry: str,
                          limit: int = 1000
-                         ) -> subprocess.CompletedProcess:
-
-        # Perform Command
-        result = self.regctl("repo",
-                             "ls",
-                             registry,
-                             "--limit",
-                             limit,
-                             # Make sure **NOT** to add Quotes around the Format Parameter
-                             # Do **NOT** use "--format='{{json .}}'" as this will add a Literal single Quote at the Beginning and End of the Output !
-                             "--format={{json .}}"
-                             )
+                         ) -> list[str]:
 
-        # Return Result
-        return result
+        return self.regctl_list("repo", registry, "repositories", limit)
 
-    # Get Tags from a given Repository
+    # Get Tags from a given Repository (using regctl)
     def get_tags(self,
                  registry: str,
                  repository: str,
                  limit: int = 1000
-                 ) -> subprocess.CompletedProcess:
-
-        # Perform Command
-        result = self.regctl("tag",
-                             "ls",
-                             f"{registry}/{repository}",
-                             "--limit",
-                             limit,
-                             # Make sure **NOT** to add Quotes around the Format Parameter
-                             # Do **NOT** use "--format='{{json .}}'" as this will add a Literal single Quote at the Beginning and End of the Output !
-                             "--format={{json .}}"
-                             )
+                 ) -> list[str]:
 
-        # Return Result
-        return result
+        return self.regctl_list("tag", f"{registry}/{repository}", "tags", limit)
 
     # Pretty JSON Print
     def json_print(self,
@@ -1223,6 +3418,10 @@ class SyncRegistries:
 
     # Find Old Images
     def find_old_images(self) -> None:
+        # Read All Configuration
+        if len(self.images) == 0:
+            self.read_images_config_all()
+
         # Print Currently selected Artifacts
         print("[INFO] Currently selected Artifacts")
 
@@ -1230,46 +3429,48 @@ class SyncRegistries:
         for selected_artifact in sorted(selected_artifacts):
             print(f"\t- {selected_artifact}")
 
-        # Initialize Artifact Dict
-        destination_artifacts = dict()
-
         # Get Destination Registry
         destination_registry = self.config.get("DESTINATION_REGISTRY_HOSTNAME")
 
-        # Get all Repositories on the Destination Server
-        destination_repositories_result = self.get_repositories(registry=destination_registry)
-
-        # Get data from json
-        destination_repositories = json.loads(destination_repositories_result.stdout)["repositories"]
-
-        # Print Images
-        # self.json_print(destination_repositories)
-
-        # Loop over Repositories
-        for repo in destination_repositories:
-            # Get all Tags
-            repo_tags_result = self.get_tags(registry=destination_registry,
-                                             repository=repo
-                                             )
+        # Walk all Repositories on the Destination Server (following Pagination, Tag Lists are fetched concurrently)
+        if self.config.get("MANIFEST_BACKEND") == "native":
+            walker = InventoryWalker(client=self.registry_client,
+                                     registry=destination_registry,
+                                     page_size=self.config.get("INVENTORY_PAGE_SIZE"),
+                                     workers=self.config.get("INVENTORY_WORKERS")
+                                     )
+        else:
+            # Use regctl (and its Credentials)
+            walker = CommandInventoryWalker(registry=destination_registry,
+                                            list_repositories=lambda: self.get_repositories(registry=destination_registry, limit=self.config.get("INVENTORY_PAGE_SIZE")),
+                                            list_tags=lambda repository: self.get_tags(registry=destination_registry, repository=repository, limit=self.config.get("INVENTORY_PAGE_SIZE")),
+                                            workers=self.config.get("INVENTORY_WORKERS")
+                                            )
 
-            repo_tags = json.loads(repo_tags_result.stdout)["tags"]
+        # Check which Artifact is NOT in the currently selected List
+        print("[INFO] These Images seem to be old and not desired anymore")
 
-            # Print Tags
-            # self.json_print(repo_tags)
+        # Statistics
+        repositories_count = 0
+        artifacts_count = 0
 
-            for repo_tag in repo_tags:
-                # Build Fully Qualified Artifact Name
-                fully_qualified = f"{destination_registry}/{repo}:{repo_tag}"
+        try:
+            # Loop over Repositories
+            for repo, repo_tags in walker.walk():
+                repositories_count += 1
 
-                # Print
-                # print(fully_qualified)
+                for repo_tag in sorted(repo_tags):
+                    artifacts_count += 1
 
-                # Add to Dictionary
-                destination_artifacts[fully_qualified] = dict()
+                    # Build Fully Qualified Artifact Name
+                    fully_qualified = f"{destination_registry}/{repo}:{repo_tag}"
 
-        # Check which Artifact is NOT in the currently selected List
-        print("[INFO] These Images seem to be old and not desired anymore")
+                    if fully_qualified not in selected_artifacts:
+                        print(f"\t- {fully_qualified}")
+        except (InventoryError, requests.RequestException) as e:
+            # Display Error Message
+            print(f"[ERROR] Listing Images of {destination_registry} failed")
+            print(e)
 
-        for destination_artifact in sorted(destination_artifacts):
-            if destination_artifact not in selected_artifacts:
-                print(f"\t- {destination_artifact}")
+        # Info
+        print(f"[INFO] Found {artifacts_count} Image(s) in {repositories_count} Repositories on {destination_registry}")
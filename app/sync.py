@@ -1,10 +1,29 @@
 #!/usr/bin/env python3
 
+# Argument Parser Library
+import argparse
+
+# OS Library
+import os
+
 # Import Library
 from docker_sync_registries.utils import SyncRegistries
 
 # Main Method (execution as a Script)
 if __name__ == "__main__":
+    # Parse Arguments
+    parser = argparse.ArgumentParser(description="Synchronize Images from the Source Registries to the Destination Registry")
+    parser.add_argument("--profile", default=None, metavar="FILE", help="Write a Trace of each Phase and external Call (Chrome Trace Event Format, same as PROFILE_OUTPUT)")
+    parser.add_argument("--cprofile", default=None, metavar="FILE", help="Write cProfile Statistics of all Threads (same as PROFILE_CPROFILE_OUTPUT)")
+    args = parser.parse_args()
+
+    # Command Line Options override the Environment
+    if args.profile is not None:
+        os.environ["PROFILE_OUTPUT"] = args.profile
+
+    if args.cprofile is not None:
+        os.environ["PROFILE_CPROFILE_OUTPUT"] = args.cprofile
+
     # Initialize Object
     app = SyncRegistries()
 
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+
+# Import Library
+from docker_sync_registries.utils import SyncRegistries
+from docker_sync_registries.daemon import SyncDaemon
+
+# Main Method (execution as a Script)
+if __name__ == "__main__":
+    # Initialize Object
+    app = SyncRegistries()
+
+    # Initialize Daemon
+    daemon = SyncDaemon(app)
+
+    # Run Daemon (until SIGTERM is received)
+    daemon.run()
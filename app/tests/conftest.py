@@ -0,0 +1,46 @@
+# Datetime Module
+from datetime import datetime
+
+# Time Library
+import time
+
+# pytest Library
+import pytest
+
+
+class FakeClock:
+    # Class Constructor
+    def __init__(self,
+                 value: float
+                 ) -> None:
+
+        # Current Time (Seconds since the Epoch), advanced by the Tests
+        self.value = value
+
+        # Replacement of the datetime Class (only now() is supported)
+        clock = self
+
+        class FakeDatetime:
+            @staticmethod
+            def now() -> datetime:
+                return datetime.fromtimestamp(clock.value)
+
+        self.datetime = FakeDatetime
+
+    def time(self) -> float:
+        return self.value
+
+    def monotonic(self) -> float:
+        return self.value
+
+
+# Controllable Clock replacing time.time() and time.monotonic()
+# The Start Time can be set using indirect Parametrization, e.g. @pytest.mark.parametrize("clock", [100000], indirect=True)
+@pytest.fixture
+def clock(request, monkeypatch) -> FakeClock:
+    fake = FakeClock(float(getattr(request, "param", 1000.0)))
+
+    monkeypatch.setattr(time, "time", fake.time)
+    monkeypatch.setattr(time, "monotonic", fake.monotonic)
+
+    return fake
@@ -0,0 +1,118 @@
+# OS Library
+import os
+
+# Subprocess Python Module
+import subprocess
+
+# sys Library
+import sys
+
+# pytest Library
+import pytest
+
+# Checkpoints & Lock File
+from docker_sync_registries import utils
+from docker_sync_registries.checkpoint import CheckpointWriter
+
+
+# Item of the Database
+def make_item(name: str,
+              status: str = "OK"
+              ) -> dict:
+
+    return dict(SourceFullArtifactReference=f"docker.io/library/{name}:latest", Status=status)
+
+
+def test_flush_after_batch_size(clock):
+    batches = []
+    writer = CheckpointWriter(flush_function=batches.append, batch_size=2, interval=60)
+
+    writer.add(make_item("a"))
+    assert batches == []
+
+    writer.add(make_item("b"))
+    assert [[item["SourceFullArtifactReference"] for item in batch] for batch in batches] == [["docker.io/library/a:latest", "docker.io/library/b:latest"]]
+    assert writer.written == 2
+
+
+def test_flush_after_interval(clock):
+    batches = []
+    writer = CheckpointWriter(flush_function=batches.append, batch_size=100, interval=10)
+
+    writer.add(make_item("a"))
+    clock.value += 9
+    writer.add(make_item("b"))
+    assert batches == []
+
+    clock.value += 1
+    writer.add(make_item("c"))
+    assert len(batches) == 1 and len(batches[0]) == 3
+
+
+def test_only_latest_version_is_flushed(clock):
+    batches = []
+    writer = CheckpointWriter(flush_function=batches.append, batch_size=100, interval=60)
+
+    item = make_item("a", status="SYNC_NEEDED")
+    writer.add(item)
+
+    # Later in-Memory Changes do not affect the pending Copy
+    item["Status"] = "CHANGED"
+    assert writer.pending["docker.io/library/a:latest"]["Status"] == "SYNC_NEEDED"
+
+    writer.add(make_item("a", status="OK"))
+    writer.flush()
+    writer.flush()
+
+    assert batches == [[make_item("a", status="OK")]]
+    assert writer.written == 1
+
+
+@pytest.fixture
+def lock_file(tmp_path, monkeypatch):
+    # Lock File used by the Application
+    filepath = str(tmp_path / "sync.lock")
+    monkeypatch.setattr(utils, "LOCK_FILE", filepath)
+
+    return filepath
+
+
+# Check if the Lock File is stale (the Method only depends on the Lock File)
+def is_lock_stale() -> bool:
+    return utils.SyncRegistries.is_lock_stale(object.__new__(utils.SyncRegistries))
+
+
+# Process ID that is not used anymore
+def get_dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+
+    return process.pid
+
+
+@pytest.mark.parametrize("contents", [
+    # Legacy Lock File (Timestamp only)
+    "1760000000",
+    # Truncated or edited Lock Files
+    "1760000000\n",
+    "1760000000\nabc\n",
+    "1760000000\n-1\n",
+    # Lock of the current Process
+    f"1760000000\n{os.getpid()}\n",
+])
+def test_lock_is_not_stale(lock_file, contents):
+    with open(lock_file, "w") as lock_handle:
+        lock_handle.write(contents)
+
+    assert not is_lock_stale()
+
+
+def test_lock_of_dead_process_is_stale(lock_file):
+    with open(lock_file, "w") as lock_handle:
+        lock_handle.write(f"1760000000\n{get_dead_pid()}\n")
+
+    assert is_lock_stale()
+
+
+def test_missing_lock_is_not_stale(lock_file):
+    assert not is_lock_stale()
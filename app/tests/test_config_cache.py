@@ -0,0 +1,157 @@
+# OS Library
+import os
+
+# JSON Module
+import json
+
+# Configuration Cache
+from docker_sync_registries.config_cache import CONFIG_CACHE_VERSION, ConfigCache
+
+
+# Images stored by the Tests
+IMAGES = [dict(Source="docker.io/library/nginx:latest", Destination="registry.local/library/nginx:latest")]
+
+
+# Write a Configuration File and return its Path
+def write_config(tmp_path, contents: str, name: str = "images.yml") -> str:
+    filepath = str(tmp_path / name)
+
+    with open(filepath, "w", encoding="UTF-8") as config_file_handle:
+        config_file_handle.write(contents)
+
+    return filepath
+
+
+# Parse a Configuration File through the Cache (the Images are stored on a Miss)
+def lookup_and_store(cache: ConfigCache, filepath: str) -> list:
+    images, contents, content_hash = cache.lookup(filepath)
+
+    if images is None:
+        assert contents is not None
+        cache.store(filepath, content_hash, IMAGES)
+        return IMAGES
+
+    return images
+
+
+def test_unchanged_file_is_not_read(tmp_path):
+    filepath = write_config(tmp_path, "images: []\n")
+    cache = ConfigCache(str(tmp_path / "cache.json"))
+
+    assert cache.lookup(filepath)[0] is None
+    assert cache.misses == 1
+
+    lookup_and_store(cache, filepath)
+    images, contents, content_hash = cache.lookup(filepath)
+    assert images == IMAGES
+    assert contents is None
+    assert content_hash is not None
+    assert cache.hits == 1
+
+
+def test_touched_file_is_not_parsed(tmp_path):
+    filepath = write_config(tmp_path, "images: []\n")
+    cache = ConfigCache(str(tmp_path / "cache.json"))
+    lookup_and_store(cache, filepath)
+    cache.save()
+
+    # Same Contents with a new Modification Time
+    stat = os.stat(filepath)
+    os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    images, contents, _ = cache.lookup(filepath)
+    assert images == IMAGES
+    assert contents == b"images: []\n"
+    assert cache.hits == 1
+    assert cache.dirty
+
+    # The new Modification Time is remembered
+    assert cache.lookup(filepath)[1] is None
+
+
+def test_modified_file_is_parsed_again(tmp_path):
+    filepath = write_config(tmp_path, "images: []\n")
+    cache = ConfigCache(str(tmp_path / "cache.json"))
+    lookup_and_store(cache, filepath)
+    first_hash = cache.files[filepath]["Hash"]
+
+    write_config(tmp_path, "images:\n  - nginx\n")
+    stat = os.stat(filepath)
+    os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    images, contents, content_hash = cache.lookup(filepath)
+    assert images is None
+    assert contents == b"images:\n  - nginx\n"
+    assert content_hash != first_hash
+    assert cache.misses == 2
+
+
+def test_save_and_load(tmp_path):
+    filepath = write_config(tmp_path, "images: []\n")
+    cache_filepath = str(tmp_path / "cache.json")
+
+    cache = ConfigCache(cache_filepath)
+    lookup_and_store(cache, filepath)
+    cache.save()
+    assert not cache.dirty
+    assert not os.path.exists(cache_filepath + ".tmp")
+
+    reloaded = ConfigCache(cache_filepath)
+    reloaded.load()
+    assert reloaded.lookup(filepath)[0] == IMAGES
+    assert reloaded.hits == 1
+
+
+def test_save_only_when_dirty(tmp_path):
+    cache_filepath = str(tmp_path / "cache.json")
+
+    ConfigCache(cache_filepath).save()
+    assert not os.path.exists(cache_filepath)
+
+
+def test_other_version_is_discarded(tmp_path):
+    filepath = write_config(tmp_path, "images: []\n")
+    cache_filepath = str(tmp_path / "cache.json")
+
+    cache = ConfigCache(cache_filepath)
+    lookup_and_store(cache, filepath)
+    cache.save()
+
+    with open(cache_filepath, "r", encoding="UTF-8") as cache_file_handle:
+        data = json.load(cache_file_handle)
+
+    data["Version"] = CONFIG_CACHE_VERSION - 1
+
+    with open(cache_filepath, "w", encoding="UTF-8") as cache_file_handle:
+        json.dump(data, cache_file_handle)
+
+    reloaded = ConfigCache(cache_filepath)
+    reloaded.load()
+    assert reloaded.files == dict()
+    assert reloaded.lookup(filepath)[0] is None
+
+
+def test_corrupt_cache_is_ignored(tmp_path, capsys):
+    cache_filepath = str(tmp_path / "cache.json")
+
+    with open(cache_filepath, "w", encoding="UTF-8") as cache_file_handle:
+        cache_file_handle.write("{")
+
+    cache = ConfigCache(cache_filepath)
+    cache.load()
+    assert cache.files == dict()
+    assert "[WARNING]" in capsys.readouterr().out
+
+
+def test_prune_removed_files(tmp_path):
+    first = write_config(tmp_path, "images: []\n", "first.yml")
+    second = write_config(tmp_path, "images: []\n", "second.yml")
+
+    cache = ConfigCache(str(tmp_path / "cache.json"))
+    lookup_and_store(cache, first)
+    lookup_and_store(cache, second)
+    cache.save()
+
+    cache.prune([first])
+    assert list(cache.files.keys()) == [first]
+    assert cache.dirty
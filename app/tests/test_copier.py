@@ -0,0 +1,252 @@
+# JSON Module
+import json
+
+# Threading Library
+import threading
+
+# Hash Library
+import hashlib
+
+# Native Copy
+from docker_sync_registries.copier import BLOB_INDEX_MAX_REPOSITORIES, BlobIndex, ImageCopier
+
+
+class FakeResponse:
+    # Class Constructor
+    def __init__(self,
+                 status_code: int,
+                 content: bytes = b"",
+                 headers: dict[str, str] | None = None
+                 ) -> None:
+
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or dict()
+        self.reason = "Fake"
+        self.url = "https://registry.local/fake"
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def iter_content(self, chunk_size: int):
+        yield self.content
+
+    def close(self) -> None:
+        pass
+
+
+class FakeRegistryClient:
+    # Class Constructor
+    def __init__(self,
+                 mount: bool = True
+                 ) -> None:
+
+        # Blobs stored in each Repository keyed by (Registry, Repository)
+        self.blobs = dict()
+
+        # Manifests keyed by (Registry, Repository, Reference)
+        self.manifests = dict()
+
+        # Whether the Registry accepts cross-Repository Mounts
+        self.mount = mount
+
+        # Repositories that do not exist anymore (Mounts from them fail)
+        self.deleted = set()
+
+        # Requests received (Method, Path, Parameters)
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def add_blob(self, registry: str, repository: str, content: bytes) -> dict:
+        digest = "sha256:" + hashlib.sha256(content).hexdigest()
+        self.blobs.setdefault((registry, repository), dict())[digest] = content
+        return dict(digest=digest, size=len(content))
+
+    def add_image(self, registry: str, repository: str, tag: str, layers: list[bytes]) -> None:
+        blobs = [self.add_blob(registry, repository, layer) for layer in [b"config"] + layers]
+        manifest = dict(mediaType="application/vnd.oci.image.manifest.v1+json", config=blobs[0], layers=blobs[1:])
+        self.manifests[(registry, repository, tag)] = json.dumps(manifest).encode("UTF-8")
+
+    def get_manifest(self, reference: str) -> FakeResponse:
+        registry, rest = reference.split("/", 1)
+        repository, tag = rest.rsplit(":", 1)
+        body = self.manifests.get((registry, repository, tag))
+
+        if body is None:
+            return FakeResponse(404)
+
+        return FakeResponse(200, body, {"Content-Type": "application/vnd.oci.image.manifest.v1+json"})
+
+    def put_manifest(self, reference: str, body: bytes, media_type: str) -> FakeResponse:
+        registry, rest = reference.split("/", 1)
+        repository, tag = rest.rsplit(":", 1)
+        self.manifests[(registry, repository, tag)] = body
+        return FakeResponse(201, headers={"Docker-Content-Digest": "sha256:" + hashlib.sha256(body).hexdigest()})
+
+    def request(self, method: str, registry: str, path: str, headers: dict | None = None, scope: str | None = None, **kwargs) -> FakeResponse:
+        params = kwargs.get("params") or dict()
+
+        with self.lock:
+            self.requests.append((method, path, dict(params)))
+
+        repository = path[len("/v2/"):].split("/blobs/")[0] if path.startswith("/v2/") else None
+
+        if method in ["HEAD", "GET"]:
+            digest = path.rsplit("/", 1)[1]
+            content = self.blobs.get((registry, repository), dict()).get(digest)
+            return FakeResponse(200, content) if content is not None else FakeResponse(404)
+
+        if method == "POST":
+            if params.get("from") in self.deleted:
+                return FakeResponse(404)
+
+            if "mount" in params:
+                content = self.blobs.get((registry, params["from"]), dict()).get(params["mount"])
+
+                if self.mount and content is not None:
+                    self.blobs.setdefault((registry, repository), dict())[params["mount"]] = content
+                    return FakeResponse(201)
+
+            return FakeResponse(202, headers={"Location": f"/upload/{repository}"})
+
+        if method == "PUT":
+            content = b"".join(kwargs["data"])
+            self.blobs.setdefault((registry, path[len("/upload/"):]), dict())[params["digest"]] = content
+            return FakeResponse(201)
+
+        return FakeResponse(405)
+
+    def count_requests(self, method: str, mount: bool | None = None) -> int:
+        return len([item for item in self.requests if item[0] == method and (mount is None or ("mount" in item[2]) == mount)])
+
+
+def test_blob_index_add_and_remove():
+    index = BlobIndex()
+
+    index.add("sha256:a", "library/nginx")
+    index.add("sha256:a", "library/alpine")
+    assert index.get("sha256:a") == ["library/alpine", "library/nginx"]
+
+    # Most recently seen Repository first, limited Number of Repositories
+    for number in range(10):
+        index.add("sha256:a", f"repository{number}")
+
+    assert index.get("sha256:a")[0] == "repository9"
+    assert len(index.get("sha256:a")) == BLOB_INDEX_MAX_REPOSITORIES
+
+    for repository in index.get("sha256:a"):
+        index.remove("sha256:a", repository)
+
+    assert index.get("sha256:a") == []
+    assert "sha256:a" not in index.dump()
+
+
+def test_blob_index_load_and_dump():
+    index = BlobIndex()
+    index.load({"sha256:a": ["library/nginx"]})
+    assert not index.dirty
+
+    # Adding a known Location again does not change the Index
+    index.add("sha256:a", "library/nginx")
+    assert not index.dirty
+
+    index.add("sha256:b", "library/alpine")
+    assert index.dirty
+    assert index.dump() == {"sha256:a": ["library/nginx"], "sha256:b": ["library/alpine"]}
+
+
+def test_copy_uploads_missing_blobs():
+    client = FakeRegistryClient()
+    client.add_image("docker.io", "library/nginx", "latest", [b"layer1", b"layer2"])
+    copier = ImageCopier(client)
+
+    result = copier.copy_image("docker.io/library/nginx:latest", "registry.local/library/nginx:latest")
+
+    assert result.returncode == 0
+    assert result.stdout.startswith("sha256:")
+    assert copier.stats["Uploaded"] == 3
+    assert copier.stats["BytesUploaded"] == len(b"config") + len(b"layer1") + len(b"layer2")
+    assert client.manifests[("registry.local", "library/nginx", "latest")] == client.manifests[("docker.io", "library/nginx", "latest")]
+
+    # Copying again only checks the existing Blobs
+    copier.copy_image("docker.io/library/nginx:latest", "registry.local/library/nginx:latest")
+    assert copier.stats["Existing"] == 3
+    assert client.count_requests("PUT") == 3
+
+
+def test_copy_mounts_blobs_from_other_repositories():
+    client = FakeRegistryClient()
+    client.add_image("docker.io", "library/nginx", "latest", [b"shared"])
+    client.add_image("docker.io", "library/custom", "latest", [b"shared", b"own"])
+    copier = ImageCopier(client)
+
+    copier.copy_image("docker.io/library/nginx:latest", "registry.local/mirror/nginx:latest")
+    copier.copy_image("docker.io/library/custom:latest", "registry.local/mirror/custom:latest")
+
+    # The Configuration and the shared Layer are mounted, only the own Layer is uploaded
+    assert copier.stats["Mounted"] == 2
+    assert copier.stats["Uploaded"] == 3
+    assert "mirror/custom" in copier.blob_index.get(client.add_blob("docker.io", "library/custom", b"shared")["digest"])
+
+
+def test_refused_mount_falls_back_to_upload():
+    client = FakeRegistryClient(mount=False)
+    client.add_image("docker.io", "library/nginx", "latest", [b"shared"])
+    copier = ImageCopier(client)
+    copier.copy_image("docker.io/library/nginx:latest", "registry.local/mirror/nginx:latest")
+
+    result = copier.copy_image("docker.io/library/nginx:latest", "registry.local/mirror/other:latest")
+
+    # The Upload Session opened by the refused Mount is used for the Upload
+    assert result.returncode == 0
+    assert copier.stats["Mounted"] == 0
+    assert copier.stats["Uploaded"] == 4
+    assert client.count_requests("POST", mount=True) == 2
+    assert client.count_requests("POST", mount=False) == 2
+
+
+def test_stale_index_entry_is_removed():
+    client = FakeRegistryClient()
+    client.add_image("docker.io", "library/nginx", "latest", [b"layer"])
+    digest = client.add_blob("docker.io", "library/nginx", b"layer")["digest"]
+
+    # The Index points to a deleted Repository and to a Repository refusing the Mount
+    client.deleted.add("mirror/deleted")
+    index = BlobIndex()
+    index.load({digest: ["mirror/deleted", "mirror/other"]})
+
+    copier = ImageCopier(client, index)
+    result = copier.copy_image("docker.io/library/nginx:latest", "registry.local/mirror/nginx:latest")
+
+    # Only the Repository answering with an Error is forgotten
+    assert result.returncode == 0
+    assert index.get(digest) == ["mirror/nginx", "mirror/other"]
+
+
+def test_copy_of_missing_image_fails():
+    copier = ImageCopier(FakeRegistryClient())
+
+    result = copier.copy_image("docker.io/library/missing:latest", "registry.local/library/missing:latest")
+
+    assert result.returncode == 1
+    assert "HTTP 404" in result.stderr
+
+
+def test_shared_blob_uploaded_once():
+    count = 4
+    client = FakeRegistryClient(mount=False)
+    client.add_image("docker.io", "library/nginx", "latest", [b"shared"])
+    copier = ImageCopier(client)
+
+    threads = [threading.Thread(target=copier.copy_image, args=("docker.io/library/nginx:latest", "registry.local/library/nginx:latest")) for _ in range(count)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    # Concurrent Copies of the same Blob wait for each other instead of uploading it again
+    assert copier.stats["Uploaded"] == 2
+    assert copier.stats["Existing"] == 2 * (count - 1)
@@ -0,0 +1,122 @@
+# JSON Module
+import json
+
+# OS Library
+import os
+
+# pytest Library
+import pytest
+
+# State Store
+from docker_sync_registries.database import StateStore, replay_journal
+
+
+# Item of the Database
+def make_item(name: str,
+              **kwargs
+              ) -> dict:
+
+    item = dict(SourceFullArtifactReference=f"docker.io/library/{name}:latest",
+                DestinationFullArtifactReference=f"docker.example.com/docker.io/library/{name}:latest",
+                Status="OK",
+                SourceHash="sha256:" + name,
+                LastCheck=1000
+                )
+
+    return dict(item, **kwargs)
+
+
+@pytest.fixture
+def store(tmp_path):
+    state_store = StateStore(filepath=str(tmp_path / "db.sqlite"))
+    yield state_store
+    state_store.close()
+
+
+# Write Lines to a File
+def write_lines(filepath: str,
+                lines: list[str]
+                ) -> None:
+
+    with open(filepath, "w", encoding="UTF-8") as file_handle:
+        file_handle.write("".join(line + "\n" for line in lines))
+
+
+def test_upsert_keeps_extra_fields(store):
+    store.upsert([make_item("nginx", DigestHistory=dict(FirstSeen=1000, Changes=[]))])
+    store.upsert([make_item("nginx", Status="SYNC_NEEDED", DigestHistory=dict(FirstSeen=1000, Changes=[2000]))])
+
+    assert store.count() == 1
+    assert store.get_by_source("docker.io/library/nginx:latest")["Status"] == "SYNC_NEEDED"
+    assert store.get_by_destination("docker.example.com/docker.io/library/nginx:latest")["DigestHistory"]["Changes"] == [2000]
+
+
+def test_prune_removes_images_that_are_not_configured(store):
+    store.upsert([make_item("nginx"), make_item("redis"), make_item("alpine")])
+
+    assert store.prune({"docker.io/library/nginx:latest", "docker.io/library/alpine:latest"}) == 1
+    assert [item["SourceFullArtifactReference"] for item in store.load_all()] == ["docker.io/library/nginx:latest", "docker.io/library/alpine:latest"]
+    assert store.prune({"docker.io/library/nginx:latest", "docker.io/library/alpine:latest"}) == 0
+
+
+def test_migrate_from_json_replays_journal(store, tmp_path):
+    database_filepath = str(tmp_path / "db.json")
+    journal_filepath = str(tmp_path / "db.journal")
+    ratelimit_filepath = str(tmp_path / "ratelimit.json")
+
+    with open(database_filepath, "w", encoding="UTF-8") as file_handle:
+        json.dump([make_item("nginx", Status="SYNC_NEEDED"), make_item("redis")], file_handle)
+
+    # Checkpoints of an interrupted Run (the last Line was not written completely)
+    write_lines(journal_filepath, [json.dumps(make_item("nginx", Status="OK")), json.dumps(make_item("alpine")), '{"SourceFull'])
+
+    with open(ratelimit_filepath, "w", encoding="UTF-8") as file_handle:
+        json.dump({"docker.io": dict(Limit=100, Remaining=50)}, file_handle)
+
+    assert store.migrate_from_json(database_filepath, ratelimit_filepath, journal_filepath) == 3
+
+    assert {item["SourceFullArtifactReference"]: item["Status"] for item in store.load_all()} == {"docker.io/library/nginx:latest": "OK",
+                                                                                                  "docker.io/library/redis:latest": "OK",
+                                                                                                  "docker.io/library/alpine:latest": "OK"
+                                                                                                  }
+    assert store.get_state("ratelimit") == {"docker.io": dict(Limit=100, Remaining=50)}
+
+    # Legacy Files are kept as Backup and not migrated again
+    assert sorted(filename for filename in os.listdir(tmp_path) if not filename.startswith("db.sqlite")) == ["db.journal.migrated", "db.json.migrated", "ratelimit.json.migrated"]
+    assert store.migrate_from_json(database_filepath, ratelimit_filepath, journal_filepath) == 0
+
+
+def test_migrate_journal_without_database(store, tmp_path):
+    journal_filepath = str(tmp_path / "db.journal")
+    write_lines(journal_filepath, [json.dumps(make_item("nginx"))])
+
+    assert store.migrate_from_json(str(tmp_path / "db.json"), journal_filepath=journal_filepath) == 1
+    assert store.count() == 1
+
+
+def test_migrate_corrupt_database(store, tmp_path):
+    database_filepath = str(tmp_path / "db.json")
+    write_lines(database_filepath, ['[{"SourceFullArtifactReference": "docker.io/'])
+
+    assert store.migrate_from_json(database_filepath) == 0
+    assert store.count() == 0
+    assert os.path.exists(database_filepath + ".corrupt")
+
+
+def test_migration_skipped_if_store_is_not_empty(store, tmp_path):
+    database_filepath = str(tmp_path / "db.json")
+    write_lines(database_filepath, [json.dumps([make_item("redis")])])
+
+    store.upsert([make_item("nginx")])
+
+    assert store.migrate_from_json(database_filepath) == 0
+    assert os.path.exists(database_filepath)
+
+
+def test_replay_journal(tmp_path):
+    journal_filepath = str(tmp_path / "db.journal")
+    write_lines(journal_filepath, [json.dumps(make_item("nginx", Status="OK")), "[]", json.dumps(make_item("redis"))])
+
+    data = replay_journal([make_item("nginx", Status="SYNC_NEEDED")], journal_filepath)
+
+    assert [(item["SourceFullArtifactReference"], item["Status"]) for item in data] == [("docker.io/library/nginx:latest", "OK"), ("docker.io/library/redis:latest", "OK")]
@@ -0,0 +1,132 @@
+# Subprocess Python Module
+import subprocess
+
+# Types Library
+from types import SimpleNamespace
+
+# pytest Library
+import pytest
+
+# Registry Health
+from docker_sync_registries.health import RegistryHealth, classify_result, get_retry_after
+
+
+# Result of the native Backend (exposes the HTTP Response)
+def native_result(status_code: int | None,
+                  headers: dict[str, str] | None = None
+                  ) -> subprocess.CompletedProcess:
+
+    result = subprocess.CompletedProcess(args=["HEAD"], returncode=0 if status_code == 200 else 1, stdout="", stderr="")
+    result.response = SimpleNamespace(status_code=status_code, headers=headers or dict()) if status_code is not None else None
+
+    return result
+
+
+# Result of a command line Tool
+def tool_result(returncode: int,
+                stderr: str = ""
+                ) -> subprocess.CompletedProcess:
+
+    return subprocess.CompletedProcess(args=["regctl"], returncode=returncode, stdout="", stderr=stderr)
+
+
+@pytest.mark.parametrize("result, expected", [
+    (native_result(200), "ok"),
+    (native_result(404), "not_found"),
+    (native_result(429), "transient"),
+    (native_result(503), "transient"),
+    (native_result(401), "error"),
+    (native_result(None), "transient"),
+    (tool_result(0), "ok"),
+    (tool_result(1, "manifest unknown: manifest unknown"), "not_found"),
+    (tool_result(1, "failed to request manifest head: HTTP 502"), "transient"),
+    (tool_result(1, "toomanyrequests: You have reached your pull rate limit"), "transient"),
+    (tool_result(1, "dial tcp 10.0.0.1:443: connect: connection refused"), "transient"),
+    (tool_result(1, "unauthorized: authentication required"), "error"),
+])
+def test_classify_result(result, expected):
+    assert classify_result(result) == expected
+
+
+def test_get_retry_after():
+    assert get_retry_after(native_result(429, {"Retry-After": "12"})) == 12.0
+    assert get_retry_after(native_result(429, {"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"})) is None
+    assert get_retry_after(tool_result(1, "HTTP 429")) is None
+
+
+def test_circuit_opens_after_consecutive_failures(clock):
+    registry_health = RegistryHealth(failure_threshold=3, open_time=60)
+
+    registry_health.record("docker.io", success=False)
+    registry_health.record("docker.io", success=False)
+    registry_health.record("docker.io", success=True)
+    registry_health.record("docker.io", success=False)
+    registry_health.record("docker.io", success=False)
+    assert not registry_health.is_open("docker.io")
+
+    registry_health.record("docker.io", success=False)
+    assert registry_health.is_open("docker.io")
+    assert registry_health.is_open("docker.io", now=1059)
+    assert not registry_health.is_open("ghcr.io")
+
+    stats = registry_health.dump()["docker.io"]
+    assert stats["Skipped"] == 2
+    assert stats["Failures"] == 5
+    assert stats["OpenUntil"] == 1060
+
+
+def test_failures_while_open_do_not_extend_the_circuit(clock):
+    registry_health = RegistryHealth(failure_threshold=1, open_time=60)
+
+    registry_health.record("docker.io", success=False)
+
+    # Requests that were in Flight when the Circuit opened
+    clock.value = 1030
+    registry_health.record("docker.io", success=False)
+
+    assert registry_health.dump()["docker.io"]["OpenUntil"] == 1060
+
+
+def test_half_open_circuit_closes_after_success(clock):
+    registry_health = RegistryHealth(failure_threshold=3, open_time=60)
+
+    for _ in range(3):
+        registry_health.record("docker.io", success=False)
+
+    # Open Time elapsed: Requests are let through again
+    clock.value = 1060
+    assert not registry_health.is_open("docker.io")
+
+    registry_health.record("docker.io", success=True)
+    registry_health.record("docker.io", success=False)
+    registry_health.record("docker.io", success=False)
+    assert not registry_health.is_open("docker.io")
+
+
+def test_half_open_circuit_reopens_after_single_failure(clock):
+    registry_health = RegistryHealth(failure_threshold=3, open_time=60)
+
+    for _ in range(3):
+        registry_health.record("docker.io", success=False)
+
+    clock.value = 1060
+    assert not registry_health.is_open("docker.io")
+
+    registry_health.record("docker.io", success=False)
+    assert registry_health.is_open("docker.io")
+    assert registry_health.dump()["docker.io"]["OpenUntil"] == 1120
+
+
+def test_retries_and_backoff():
+    registry_health = RegistryHealth(max_retries=2, backoff_base=1.0, backoff_max=30.0)
+
+    assert registry_health.should_retry(0)
+    assert registry_health.should_retry(1)
+    assert not registry_health.should_retry(2)
+
+    # Rate Limit Windows longer than backoff_max are not waited for
+    assert not registry_health.should_retry(0, retry_after=3600)
+
+    assert 2.0 <= registry_health.get_backoff(2) <= 4.0
+    assert registry_health.get_backoff(10) <= 30.0
+    assert registry_health.get_backoff(0, retry_after=20) == 20
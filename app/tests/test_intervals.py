@@ -0,0 +1,80 @@
+# pytest Library
+import pytest
+
+# Adaptive Intervals
+from docker_sync_registries.intervals import IntervalEstimator, is_immutable_tag, update_digest_history
+
+
+# Estimator used by the Tests (Intervals in Seconds)
+def make_estimator(enabled: bool = True) -> IntervalEstimator:
+    return IntervalEstimator(default_interval=1800,
+                             min_interval=1800,
+                             max_interval=86400,
+                             immutable_interval=604800,
+                             factor=0.05,
+                             enabled=enabled
+                             )
+
+
+@pytest.mark.parametrize("tag", [
+    "1.2.3",
+    "v2.10.2",
+    "1.2.3+build.5",
+    "sha256-" + "a" * 64,
+    "sha256-" + "0123456789abcdef" * 4 + ".sig",
+    "sha512:" + "f" * 128,
+])
+def test_immutable_tags(tag):
+    assert is_immutable_tag(tag)
+
+
+@pytest.mark.parametrize("tag", [
+    "latest",
+    "alpine",
+    "2.10",
+    "1.25.3-alpine",
+    "3.12.1-slim",
+    "1.2.3-rc1",
+    "v1.2",
+    "sha256-abc",
+    "sha256-" + "A" * 64,
+])
+def test_moving_tags(tag):
+    assert not is_immutable_tag(tag)
+
+
+def test_immutable_tag_keeps_long_interval_until_it_changes():
+    estimator = make_estimator()
+
+    history = update_digest_history(None, "sha256:1", 1000)
+    assert estimator.get_interval("v2.10.2", history, 2000) == 604800
+
+    history = update_digest_history(history, "sha256:2", 3000)
+    assert history["Changes"] == [3000]
+    assert estimator.get_interval("v2.10.2", history, 3000) == 1800
+
+
+def test_variant_tag_uses_adaptive_interval():
+    estimator = make_estimator()
+
+    history = update_digest_history(None, "sha256:1", 1000)
+    assert estimator.get_interval("1.25.3-alpine", history, 2000) == 1800
+    assert estimator.get_interval("1.25.3-alpine", history, 1001000) == 50000
+
+
+def test_interval_from_changes_is_bounded():
+    estimator = make_estimator()
+
+    history = dict(FirstSeen=1000, Digest="sha256:3", Changes=[100000, 200000])
+    assert estimator.get_interval("latest", history, 401000) == 10000
+
+    history = dict(FirstSeen=1000, Digest="sha256:3", Changes=[1050])
+    assert estimator.get_interval("latest", history, 1100) == 1800
+    assert estimator.get_interval("latest", history, 10 ** 9) == 86400
+
+
+def test_disabled_estimator_and_override():
+    estimator = make_estimator(enabled=False)
+
+    assert estimator.get_interval("v2.10.2", None, 0) == 1800
+    assert estimator.get_interval("v2.10.2", None, 0, override=60) == 60
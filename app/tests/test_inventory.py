@@ -0,0 +1,197 @@
+# JSON Module
+import json
+
+# Subprocess Python Module
+import subprocess
+
+# Threading Library
+import threading
+
+# Time Library
+import time
+
+# pytest Library
+import pytest
+
+# Destination Inventory
+from docker_sync_registries import utils
+from docker_sync_registries.inventory import CommandInventoryWalker, InventoryError, InventoryWalker
+
+
+class FakeResponse:
+    # Class Constructor
+    def __init__(self,
+                 status_code: int,
+                 data: dict | None = None,
+                 next_url: str | None = None
+                 ) -> None:
+
+        self.status_code = status_code
+        self.data = data
+        self.links = {"next": {"url": next_url}} if next_url is not None else dict()
+        self.reason = "Fake"
+        self.url = "https://registry.local/fake"
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def json(self) -> dict:
+        return self.data
+
+
+class FakeRegistryClient:
+    # Class Constructor
+    def __init__(self,
+                 repositories: dict[str, list[str] | None]
+                 ) -> None:
+
+        # Tags of each Repository (None for Repositories returning "tags": null)
+        self.repositories = repositories
+
+        # Requests received (Path, Parameters)
+        self.requests = []
+
+        # Number of Tag Lists being fetched (and the Maximum seen)
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    # Return one Page of Items, with a Link to the next Page (Registries ignore "n" on the Link)
+    def page(self, key: str, items: list[str] | None, path: str, params: dict | None) -> FakeResponse:
+        if params is not None:
+            start, size = 0, params["n"]
+        else:
+            path, query = path.split("?")
+            values = dict(item.split("=") for item in query.split("&"))
+            start, size = int(values["start"]), int(values["n"])
+
+        if items is None:
+            return FakeResponse(200, {key: None})
+
+        next_url = f"{path}?n={size}&start={start + size}" if start + size < len(items) else None
+        return FakeResponse(200, {key: items[start:start + size]}, next_url)
+
+    def request(self, method: str, registry: str, path: str, headers: dict | None = None, scope: str | None = None, **kwargs) -> FakeResponse:
+        params = kwargs.get("params")
+
+        with self.lock:
+            self.requests.append((path, params))
+
+        if path.startswith("/v2/_catalog"):
+            return self.page("repositories", list(self.repositories.keys()), path, params)
+
+        repository = path[len("/v2/"):].split("/tags/list")[0]
+
+        if repository == "broken":
+            return FakeResponse(500)
+
+        if repository not in self.repositories:
+            return FakeResponse(404)
+
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+        try:
+            # Later Repositories answer faster
+            time.sleep(0.001 * (len(self.repositories) - list(self.repositories.keys()).index(repository)))
+            return self.page("tags", self.repositories[repository], path, params)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def test_pagination_follows_links():
+    tags = [f"1.{number}" for number in range(25)]
+    client = FakeRegistryClient({"library/nginx": tags})
+    walker = InventoryWalker(client, "registry.local", page_size=10)
+
+    assert walker.get_tags("library/nginx") == tags
+
+    # Three Pages, the first one requested with the Page Size
+    tag_requests = [item for item in client.requests if "tags/list" in item[0]]
+    assert len(tag_requests) == 3
+    assert tag_requests[0][1] == {"n": 10}
+    assert tag_requests[1] == ("/v2/library/nginx/tags/list?n=10&start=10", None)
+
+
+def test_empty_and_missing_repositories():
+    client = FakeRegistryClient({"library/empty": None})
+    walker = InventoryWalker(client, "registry.local")
+
+    assert walker.get_tags("library/empty") == []
+    assert walker.get_tags("library/missing") == []
+
+
+def test_errors_are_raised():
+    walker = InventoryWalker(FakeRegistryClient(dict()), "registry.local")
+
+    with pytest.raises(InventoryError):
+        walker.get_tags("broken")
+
+
+def test_walk_keeps_order_with_bounded_concurrency():
+    repositories = {f"library/image{number:02d}": [f"{number}.0", "latest"] for number in range(30)}
+    client = FakeRegistryClient(repositories)
+    walker = InventoryWalker(client, "registry.local", page_size=7, workers=3)
+
+    result = list(walker.walk())
+
+    assert result == [(repository, tags) for repository, tags in repositories.items()]
+    assert 1 < client.max_active <= 3
+
+    # The Catalog is paginated as well
+    assert len([item for item in client.requests if item[0].startswith("/v2/_catalog")]) == 5
+
+
+def test_walk_given_repositories():
+    client = FakeRegistryClient({"library/nginx": ["latest"], "library/alpine": ["3.20"]})
+    walker = InventoryWalker(client, "registry.local")
+
+    assert list(walker.walk(["library/alpine"])) == [("library/alpine", ["3.20"])]
+    assert not any(item[0].startswith("/v2/_catalog") for item in client.requests)
+
+
+def test_command_walker():
+    walker = CommandInventoryWalker("registry.local",
+                                    list_repositories=lambda: ["library/nginx", "library/alpine"],
+                                    list_tags=lambda repository: [repository.split("/")[1]],
+                                    workers=2
+                                    )
+
+    assert list(walker.walk()) == [("library/nginx", ["nginx"]), ("library/alpine", ["alpine"])]
+
+
+# Fake "regctl <kind> ls" returning Pages of the given Items after the "--last" Item
+def make_regctl(items: list[str], key: str, calls: list):
+    def regctl(*args) -> subprocess.CompletedProcess:
+        flat = [str(arg) for item in args for arg in (item if isinstance(item, list) else [item])]
+        calls.append(flat)
+
+        limit = int(flat[flat.index("--limit") + 1])
+        start = items.index(flat[flat.index("--last") + 1]) + 1 if "--last" in flat else 0
+
+        return subprocess.CompletedProcess(args=flat, returncode=0, stdout=json.dumps({key: items[start:start + limit]}), stderr="")
+
+    return regctl
+
+
+@pytest.mark.parametrize("count", [0, 3, 5, 12])
+def test_regctl_list_pagination(count):
+    sync = object.__new__(utils.SyncRegistries)
+    tags = [f"1.{number}" for number in range(count)]
+    calls = []
+    sync.regctl = make_regctl(tags, "tags", calls)
+
+    assert sync.get_tags("registry.local", "library/nginx", limit=5) == tags
+    assert len(calls) == count // 5 + 1
+    assert calls[0][0:3] == ["tag", "ls", "registry.local/library/nginx"]
+
+
+def test_regctl_list_error():
+    sync = object.__new__(utils.SyncRegistries)
+    sync.regctl = lambda *args: subprocess.CompletedProcess(args=args, returncode=1, stdout="", stderr="unauthorized\n")
+
+    with pytest.raises(InventoryError, match="unauthorized"):
+        sync.get_repositories("registry.local")
@@ -0,0 +1,112 @@
+# pytest Library
+import pytest
+
+# Mirror Selection
+from docker_sync_registries.mirrors import MirrorSelector, parse_mirrors
+
+
+# Selector with two Mirrors of docker.io
+def make_selector() -> MirrorSelector:
+    return MirrorSelector(mirrors={"docker.io": ["mirror.gcr.io", "cache.example.com/dockerhub"]},
+                          failure_threshold=2,
+                          demotion_time=3600
+                          )
+
+
+def test_parse_mirrors():
+    mirrors = parse_mirrors("docker.io=mirror.gcr.io, docker.io=cache.example.com/dockerhub/,ghcr.io=cache.example.com/ghcr,invalid,docker.io=mirror.gcr.io")
+
+    assert mirrors == {"docker.io": ["mirror.gcr.io", "cache.example.com/dockerhub"], "ghcr.io": ["cache.example.com/ghcr"]}
+    assert parse_mirrors(None) == dict()
+
+
+def test_mirror_reference():
+    selector = make_selector()
+
+    assert selector.get_mirror_reference("docker.io/library/nginx:latest", "cache.example.com/dockerhub") == "cache.example.com/dockerhub/library/nginx:latest"
+    assert selector.get_mirrors("ghcr.io/owner/app:1") == []
+
+
+def test_probe_records_latency_and_errors(clock):
+    selector = make_selector()
+
+    def probe_function(full_artifact_reference: str) -> tuple:
+        if full_artifact_reference.startswith("mirror.gcr.io/"):
+            clock.value += 0.1
+            return ("sha256:a", None, 0)
+
+        return ("", None, 1)
+
+    results = selector.probe_all("docker.io/library/nginx:latest", probe_function)
+
+    assert results["mirror.gcr.io"][0:2] == ("sha256:a", 0)
+    assert results["cache.example.com/dockerhub"][1] == 1
+
+    stats = selector.dump()
+    assert stats["mirror.gcr.io"]["Probes"] == 1
+    assert stats["mirror.gcr.io"]["Latency"] == pytest.approx(0.1)
+    assert stats["cache.example.com/dockerhub"]["Errors"] == 1
+    assert stats["cache.example.com/dockerhub"]["Latency"] is None
+
+
+def test_choose_prefers_success_rate_then_latency():
+    selector = make_selector()
+
+    # Fastest Mirror serving the same Digest
+    results = {"mirror.gcr.io": ("sha256:a", 0, 0.5), "cache.example.com/dockerhub": ("sha256:a", 0, 0.1)}
+    assert selector.choose("sha256:a", results) == "cache.example.com/dockerhub"
+
+    # A Mirror whose Transfers fail is only used if no other Mirror matches
+    selector.record_transfer("cache.example.com/dockerhub", success=False)
+    assert selector.choose("sha256:a", results) == "mirror.gcr.io"
+
+    # Mirrors with a different Digest or failed Probes are never used
+    assert selector.choose("sha256:a", {"mirror.gcr.io": ("sha256:b", 0, 0.1), "cache.example.com/dockerhub": ("", 1, 0.1)}) is None
+
+
+def test_matches_are_counted_separately_from_transfers():
+    selector = make_selector()
+
+    selector.choose("sha256:a", {"mirror.gcr.io": ("sha256:a", 0, 0.1)})
+    selector.choose("sha256:a", {"mirror.gcr.io": ("sha256:b", 0, 0.1)})
+    selector.choose("sha256:a", {"mirror.gcr.io": ("sha256:a", 0, 0.1)})
+    selector.record_transfer("mirror.gcr.io", success=True)
+
+    stats = selector.dump()["mirror.gcr.io"]
+    assert stats["Matches"] == 2
+    assert stats["Transfers"] == 1
+
+
+def test_demotion_and_readmission(clock):
+    selector = make_selector()
+
+    selector.record_transfer("mirror.gcr.io", success=False)
+    assert selector.get_candidates("docker.io/library/nginx:latest") == ["mirror.gcr.io", "cache.example.com/dockerhub"]
+
+    # Demoted after 2 consecutive Failures
+    selector.record_transfer("mirror.gcr.io", success=False)
+    assert selector.is_demoted("mirror.gcr.io")
+    assert selector.get_candidates("docker.io/library/nginx:latest") == ["cache.example.com/dockerhub"]
+
+    # Re-admitted once the Demotion Time elapsed, a single Failure demotes it again
+    clock.value += 3600
+    assert not selector.is_demoted("mirror.gcr.io")
+    selector.record_transfer("mirror.gcr.io", success=False)
+    assert selector.is_demoted("mirror.gcr.io")
+
+    # A successful Transfer resets the Failures
+    clock.value += 3600
+    assert not selector.is_demoted("mirror.gcr.io")
+    selector.record_transfer("mirror.gcr.io", success=True)
+    selector.record_transfer("mirror.gcr.io", success=False)
+    assert not selector.is_demoted("mirror.gcr.io")
+
+
+def test_load_and_dump():
+    selector = make_selector()
+    selector.record_transfer("mirror.gcr.io", success=True)
+
+    restored = make_selector()
+    restored.load(selector.dump())
+
+    assert restored.dump() == selector.dump()
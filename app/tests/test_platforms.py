@@ -0,0 +1,104 @@
+# pytest Library
+import pytest
+
+# Platforms
+from docker_sync_registries.platforms import filter_index, format_platform, get_platform_digests, match_platform, parse_platforms
+
+
+# Descriptor of an Image Index Entry
+def descriptor(digest: str,
+               platform: dict[str, str] | None = None,
+               reference: str | None = None
+               ) -> dict:
+
+    entry = dict(mediaType="application/vnd.oci.image.manifest.v1+json", digest=digest, size=1)
+
+    if platform is not None:
+        entry["platform"] = platform
+
+    # Attestation describing another Entry
+    if reference is not None:
+        entry["annotations"] = {"vnd.docker.reference.digest": reference, "vnd.docker.reference.type": "attestation-manifest"}
+
+    return entry
+
+
+# Image Index used by the Tests
+INDEX = dict(schemaVersion=2,
+             mediaType="application/vnd.oci.image.index.v1+json",
+             manifests=[descriptor("sha256:amd64", dict(os="linux", architecture="amd64")),
+                        descriptor("sha256:armv6", dict(os="linux", architecture="arm", variant="v6")),
+                        descriptor("sha256:armv7", dict(os="linux", architecture="arm", variant="v7")),
+                        descriptor("sha256:arm64", dict(os="linux", architecture="arm64", variant="v8")),
+                        descriptor("sha256:windows", {"os": "windows", "architecture": "amd64", "os.version": "10.0.17763.5458"}),
+                        descriptor("sha256:att-amd64", dict(os="unknown", architecture="unknown"), reference="sha256:amd64"),
+                        descriptor("sha256:att-armv7", dict(os="unknown", architecture="unknown"), reference="sha256:armv7"),
+                        ]
+             )
+
+
+@pytest.mark.parametrize("platform, allowed, expected", [
+    ("linux/amd64", ["linux/amd64"], True),
+    ("linux/arm64/v8", ["linux/arm64"], True),
+    ("linux/arm/v7", ["linux/arm/v7"], True),
+    ("linux/arm/v6", ["linux/arm/v7"], False),
+    ("linux/arm/v7", ["linux/arm"], True),
+    ("linux/arm64/v8", ["linux/arm"], False),
+    ("linux/amd64/v2", ["linux/amd64"], True),
+    ("linux/amd64", ["linux/amd64/v2"], False),
+    ("windows/amd64:10.0.17763.5458", ["windows/amd64"], True),
+    ("windows/amd64:10.0.17763.5458", ["windows/amd64:10.0.17763.5458"], True),
+    ("windows/amd64:10.0.20348.2340", ["windows/amd64:10.0.17763.5458"], False),
+    ("linux/amd64", [], False),
+])
+def test_match_platform(platform, allowed, expected):
+    assert match_platform(platform, allowed) is expected
+
+
+def test_format_platform():
+    assert format_platform(dict(os="linux", architecture="arm64", variant="v8")) == "linux/arm64/v8"
+    assert format_platform({"os": "Windows", "architecture": "amd64", "os.version": "10.0.17763.5458"}) == "windows/amd64:10.0.17763.5458"
+
+
+def test_parse_platforms():
+    assert parse_platforms(None) is None
+    assert parse_platforms("") is None
+    assert parse_platforms("linux/amd64, Linux/ARM64,linux/amd64") == ["linux/amd64", "linux/arm64"]
+    assert parse_platforms(["linux/arm/v7", "all"]) == []
+
+    with pytest.raises(ValueError):
+        parse_platforms("amd64")
+
+
+def test_get_platform_digests_ignores_attestations():
+    digests = get_platform_digests(INDEX)
+
+    assert digests == {"linux/amd64": "sha256:amd64",
+                       "linux/arm/v6": "sha256:armv6",
+                       "linux/arm/v7": "sha256:armv7",
+                       "linux/arm64/v8": "sha256:arm64",
+                       "windows/amd64:10.0.17763.5458": "sha256:windows"
+                       }
+
+    # Single Platform Image
+    assert get_platform_digests(dict(schemaVersion=2, config=dict(), layers=[])) is None
+
+
+def test_filter_index_keeps_variants_and_their_attestations():
+    filtered = filter_index(INDEX, ["linux/amd64", "linux/arm/v7"])
+
+    assert [entry["digest"] for entry in filtered["manifests"]] == ["sha256:amd64", "sha256:armv7", "sha256:att-amd64", "sha256:att-armv7"]
+    assert filtered["mediaType"] == INDEX["mediaType"]
+
+    # The original Index is not modified
+    assert len(INDEX["manifests"]) == 7
+
+
+def test_filter_index_all_variants_of_an_architecture():
+    filtered = filter_index(INDEX, ["linux/arm"])
+
+    assert [entry["digest"] for entry in filtered["manifests"]] == ["sha256:armv6", "sha256:armv7", "sha256:att-armv7"]
+
+
+def test_filter_index_without_match():
+    assert filter_index(INDEX, ["linux/s390x"])["manifests"] == []
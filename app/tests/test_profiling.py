@@ -0,0 +1,33 @@
+# Concurrent Futures Library
+from concurrent.futures import ThreadPoolExecutor
+
+# Statistics of the Profiler
+import pstats
+
+# Profiling
+from docker_sync_registries.profiling import ThreadProfiler
+
+
+# Function run by the Workers of the Thread Pool
+def profiled_worker(n: int) -> int:
+    return sum(range(n))
+
+
+def test_thread_pool_is_profiled(tmp_path):
+    profiler = ThreadProfiler()
+    profiler.start()
+
+    try:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(profiled_worker, 1000) for _ in range(3)]
+
+            # Workers must not die while enabling their Profiler
+            results = [future.result(timeout=10) for future in futures]
+    finally:
+        profiler.dump(str(tmp_path / "profile.out"))
+
+    assert results == [499500] * 3
+
+    stats = pstats.Stats(str(tmp_path / "profile.out"))
+    calls = sum(values[1] for (_, _, name), values in stats.stats.items() if name == "profiled_worker")
+    assert calls == 3
@@ -0,0 +1,98 @@
+# pytest Library
+import pytest
+
+# Rate Limit Budget
+from docker_sync_registries import ratelimit
+from docker_sync_registries.ratelimit import RATELIMIT_DEFAULT_WINDOW, RateLimitTracker, parse_ratelimit_header
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("76;w=21600", (76, 21600)),
+    ("100;w=3600", (100, 3600)),
+    (" 76 ; w=21600", (76, 21600)),
+    ("100", (100, RATELIMIT_DEFAULT_WINDOW)),
+    ("100;w=", (100, RATELIMIT_DEFAULT_WINDOW)),
+    ("0;w=21600", (0, 21600)),
+    ("abc", None),
+    ("", None),
+    (None, None),
+])
+def test_parse_ratelimit_header(value, expected):
+    assert parse_ratelimit_header(value) == expected
+
+
+@pytest.fixture(autouse=True)
+def fake_datetime(request, monkeypatch):
+    # The Budgets use datetime.now() instead of time.time()
+    if "clock" in request.fixturenames:
+        monkeypatch.setattr(ratelimit, "datetime", request.getfixturevalue("clock").datetime)
+
+
+@pytest.mark.parametrize("clock", [100000], indirect=True)
+def test_update_from_headers(clock):
+    tracker = RateLimitTracker(reserve=10)
+
+    assert not tracker.update_from_headers("docker.io", dict())
+    assert tracker.available("docker.io") is None
+
+    assert tracker.update_from_headers("docker.io", {"ratelimit-limit": "100;w=21600", "ratelimit-remaining": "76;w=21600"})
+    assert tracker.available("docker.io") == 66
+
+    budget = tracker.dump()["docker.io"]
+    assert budget["Limit"] == 100
+    assert budget["Window"] == 21600
+    assert budget["ResetAt"] == 100000 + 21600
+
+
+def test_acquire_and_release(clock):
+    tracker = RateLimitTracker(reserve=2, pull_cost=1)
+    tracker.update_from_headers("docker.io", {"ratelimit-limit": "10;w=600", "ratelimit-remaining": "6;w=600"})
+
+    # One Pull per Platform
+    assert tracker.try_acquire("docker.io", count=3)
+    assert tracker.available("docker.io") == 1
+    assert not tracker.try_acquire("docker.io", count=2)
+    assert tracker.try_acquire("docker.io")
+    assert not tracker.try_acquire("docker.io")
+
+    # The Registry reports the completed Pulls: only the Transfers in Progress stay reserved
+    tracker.release("docker.io", count=3)
+    tracker.update_from_headers("docker.io", {"ratelimit-limit": "10;w=600", "ratelimit-remaining": "3;w=600"})
+    assert tracker.available("docker.io") == 0
+
+    # Registries without Rate Limit Information are not limited
+    assert tracker.try_acquire("ghcr.io", count=100)
+
+
+def test_window_elapsed_restores_limit(clock):
+    tracker = RateLimitTracker()
+    tracker.update_from_headers("docker.io", {"ratelimit-limit": "100;w=3600", "ratelimit-remaining": "0;w=3600"})
+    assert tracker.available("docker.io") == 0
+
+    clock.value += 3600
+    assert tracker.available("docker.io") == 100
+
+
+def test_exhaust(clock):
+    tracker = RateLimitTracker()
+
+    # HTTP 429 without Rate Limit Headers
+    tracker.exhaust("docker.io")
+    assert tracker.available("docker.io") == 0
+    assert tracker.dump()["docker.io"]["Window"] == RATELIMIT_DEFAULT_WINDOW
+
+    # The Limit is unknown: the Budget is unknown again once the Window elapsed
+    clock.value += RATELIMIT_DEFAULT_WINDOW
+    assert tracker.available("docker.io") is None
+
+    # HTTP 429 with Rate Limit Headers
+    tracker.exhaust("ghcr.io", {"ratelimit-limit": "200;w=60", "ratelimit-remaining": "0;w=60"})
+    assert tracker.dump()["ghcr.io"]["Window"] == 60
+
+
+def test_load_and_dump(clock):
+    tracker = RateLimitTracker()
+    tracker.load({"docker.io": dict(Limit=100, Remaining=50, Window=21600, ObservedAt=clock.value - 60, Consumed=5)})
+
+    assert tracker.available("docker.io") == 45
+    assert tracker.dump()["docker.io"]["ResetAt"] == clock.value - 60 + 21600
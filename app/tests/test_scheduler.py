@@ -0,0 +1,76 @@
+# pytest Library
+import pytest
+
+# Check Scheduling
+from docker_sync_registries.scheduler import SlotScheduler
+
+
+# References used by the Tests
+REFERENCES = [f"docker.io/library/image{index}:latest" for index in range(200)]
+
+
+def test_never_checked_is_due():
+    scheduler = SlotScheduler(interval=3600, run_period=300)
+
+    assert scheduler.is_due(REFERENCES[0], None, 1000000)
+    assert scheduler.is_due(REFERENCES[0], 0, 1000000)
+    assert scheduler.get_next_check(REFERENCES[0], None) == 0
+
+
+@pytest.mark.parametrize("reference", REFERENCES[0:20])
+def test_due_once_per_interval(reference):
+    scheduler = SlotScheduler(interval=3600, run_period=300)
+    last_check = 1000000
+
+    # Due exactly when the next Slot Boundary is crossed
+    next_check = scheduler.get_next_check(reference, last_check)
+    assert last_check < next_check <= last_check + 3600
+    assert not scheduler.is_due(reference, last_check, next_check - 1)
+    assert scheduler.is_due(reference, last_check, next_check)
+
+    # Always due once a full Interval elapsed
+    assert scheduler.is_due(reference, last_check, last_check + 3600)
+
+
+def test_late_checks_do_not_drift():
+    scheduler = SlotScheduler(interval=3600, run_period=300)
+    reference = REFERENCES[0]
+    boundary = scheduler.get_next_check(reference, 1000000)
+
+    # A Check performed late (e.g. deferred) keeps the same Boundaries
+    late_check = boundary + 1800
+    assert scheduler.get_next_check(reference, late_check) == boundary + 3600
+    assert not scheduler.is_due(reference, late_check, boundary + 3600 - 1)
+    assert scheduler.is_due(reference, late_check, boundary + 3600)
+
+
+def test_phase_is_stable_and_spread():
+    scheduler = SlotScheduler(interval=3600, run_period=300)
+
+    # The Phase only depends on the Reference
+    assert scheduler.get_phase(REFERENCES[0]) == SlotScheduler(interval=3600, run_period=60).get_phase(REFERENCES[0])
+
+    # Each Run only checks a Fraction of the Images
+    last_check = 1000000
+    due = [reference for reference in REFERENCES if scheduler.is_due(reference, last_check, last_check + 300)]
+    assert 0 < len(due) < len(REFERENCES) / 4
+
+
+def test_image_interval_overrides_global_interval():
+    scheduler = SlotScheduler(interval=3600, run_period=300)
+    reference = REFERENCES[0]
+    last_check = 1000000
+
+    next_check = scheduler.get_next_check(reference, last_check, interval=86400)
+    assert last_check < next_check <= last_check + 86400
+    assert (next_check - scheduler.get_phase(reference, 86400)) % 86400 == 0
+    assert not scheduler.is_due(reference, last_check, next_check - 1, interval=86400)
+    assert scheduler.is_due(reference, last_check, next_check, interval=86400)
+
+
+def test_planned_load():
+    scheduler = SlotScheduler(interval=3600, run_period=300)
+
+    assert scheduler.get_planned_load(120) == pytest.approx(10)
+    assert scheduler.get_planned_load(120, elapsed=7200) == pytest.approx(120)
+    assert scheduler.get_planned_load(0, elapsed=300, intervals=[600, 3000]) == pytest.approx(0.6)
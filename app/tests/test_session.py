@@ -0,0 +1,150 @@
+# OS Library
+import os
+
+# pytest Library
+import pytest
+
+# Tool Sessions
+from docker_sync_registries.session import ToolSession, ToolSessionPool, is_idempotent
+
+
+# Fake Tool counting its Runs and killing the Worker (its Parent Shell) during the first Run
+FAKE_TOOL = """#!/bin/sh
+echo run >> "$FAKE_TOOL_RUNS"
+if [ ! -e "$FAKE_TOOL_RUNS.killed" ]; then
+    touch "$FAKE_TOOL_RUNS.killed"
+    kill -9 $PPID
+fi
+echo "$@"
+"""
+
+
+@pytest.fixture
+def fake_tools(tmp_path, monkeypatch) -> str:
+    # Install the Fake Tool as regctl and skopeo in front of the PATH
+    for name in ["regctl", "skopeo"]:
+        filepath = tmp_path / name
+        filepath.write_text(FAKE_TOOL)
+        filepath.chmod(0o755)
+
+    runs_filepath = str(tmp_path / "runs")
+    monkeypatch.setenv("PATH", str(tmp_path) + os.pathsep + os.environ["PATH"])
+    monkeypatch.setenv("FAKE_TOOL_RUNS", runs_filepath)
+
+    return runs_filepath
+
+
+# Number of Times the Fake Tool was started
+def count_runs(runs_filepath: str) -> int:
+    with open(runs_filepath, "r", encoding="UTF-8") as runs_file_handle:
+        return len(runs_file_handle.readlines())
+
+
+@pytest.mark.parametrize("args, expected", [
+    (["regctl", "manifest", "head", "docker.io/library/nginx:latest"], True),
+    (["regctl", "tag", "ls", "--limit", "100", "docker.io/library/nginx"], True),
+    (["/usr/local/bin/skopeo", "inspect", "--raw", "docker://nginx"], True),
+    (["skopeo", "--version"], True),
+    (["crane", "digest", "nginx"], True),
+    (["regctl", "image", "copy", "nginx", "registry.local/nginx"], False),
+    (["skopeo", "copy", "docker://nginx", "docker://registry.local/nginx"], False),
+    (["crane", "copy", "nginx", "registry.local/nginx"], False),
+    (["regctl", "--version"], False),
+    # Option Values in front of the Subcommands are not recognised: the Command is not sent again
+    (["regctl", "--verbosity", "error", "tag", "ls", "docker.io/library/nginx"], False),
+    ([], False),
+])
+def test_is_idempotent(args, expected):
+    assert is_idempotent(args) == expected
+
+
+def test_run_reuses_worker():
+    session = ToolSession([], timeout=10)
+
+    try:
+        first = session.run(["echo", "hello world"])
+        process = session.process
+
+        second = session.run(["sh", "-c", "printf 'out'; printf 'err' >&2; exit 3"])
+
+        assert first.returncode == 0
+        assert first.stdout == "hello world\n"
+        assert second.returncode == 3
+        assert second.stdout == "out"
+        assert second.stderr == "err"
+        assert session.process is process
+    finally:
+        session.close()
+
+
+def test_idempotent_command_is_sent_again(fake_tools):
+    session = ToolSession([], timeout=10)
+
+    try:
+        result = session.run(["regctl", "manifest", "head", "nginx"])
+
+        assert result.returncode == 0
+        assert result.stdout == "manifest head nginx\n"
+        assert count_runs(fake_tools) == 2
+        assert session.is_alive()
+    finally:
+        session.close()
+
+
+def test_other_command_is_not_sent_again(fake_tools):
+    session = ToolSession([], timeout=10)
+
+    try:
+        result = session.run(["skopeo", "copy", "docker://nginx", "docker://registry.local/nginx"])
+
+        assert result.returncode == 1
+        assert "Tool Session failed while running skopeo copy" in result.stderr
+        assert count_runs(fake_tools) == 1
+
+        # The next Command starts a new Worker
+        assert session.run(["echo", "ok"]).stdout == "ok\n"
+    finally:
+        session.close()
+
+
+def test_dead_worker_is_restarted():
+    session = ToolSession([], timeout=10)
+
+    try:
+        session.run(["true"])
+        session.process.kill()
+        session.process.wait()
+
+        # The Command was not received by the dead Worker and is sent again
+        result = session.run(["echo", "restarted"])
+        assert result.returncode == 0
+        assert result.stdout == "restarted\n"
+    finally:
+        session.close()
+
+
+def test_stuck_worker_times_out():
+    session = ToolSession([], timeout=1)
+
+    try:
+        result = session.run(["sleep", "30"])
+
+        assert result.returncode == 1
+        assert "did not answer within 1 Seconds" in result.stderr
+        assert session.process is None
+
+        assert session.run(["echo", "ok"]).stdout == "ok\n"
+    finally:
+        session.close()
+
+
+def test_pool_runs_commands():
+    pool = ToolSessionPool([], size=2, timeout=10)
+
+    try:
+        assert [pool.run(["echo", str(index)]).stdout for index in range(4)] == ["0\n", "1\n", "2\n", "3\n"]
+
+        # Sequential Commands only start one Worker
+        assert len([session for session in pool.all_sessions if session.is_alive()]) == 1
+    finally:
+        pool.close()
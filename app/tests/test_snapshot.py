@@ -0,0 +1,70 @@
+# Destination Snapshot
+from docker_sync_registries.inventory import CommandInventoryWalker
+from docker_sync_registries.snapshot import DestinationSnapshot
+
+
+# Tags of the Destination Registry used by the Tests
+TAGS = {"library/nginx": ["latest", "1.27"], "library/alpine": []}
+
+
+# Walker listing the given Tags instead of querying a Registry
+def make_walker(tags: dict[str, list[str]]) -> CommandInventoryWalker:
+    return CommandInventoryWalker("registry.local",
+                                  list_repositories=lambda: list(tags.keys()),
+                                  list_tags=lambda repository: list(tags.get(repository, [])),
+                                  workers=2
+                                  )
+
+
+def test_lookup_of_unlisted_repository():
+    snapshot = DestinationSnapshot()
+
+    assert snapshot.lookup("registry.local/library/nginx:latest", 1000) == ("unknown", None)
+    assert snapshot.stats["Unknown"] == 1
+
+
+def test_lookup_of_missing_tag():
+    snapshot = DestinationSnapshot()
+    snapshot.refresh(make_walker(TAGS), ["library/nginx", "library/alpine", "library/nginx"])
+
+    assert snapshot.stats["Lists"] == 2
+    assert snapshot.lookup("registry.local/library/nginx:1.26", 1000) == ("missing", None)
+    assert snapshot.lookup("registry.local/library/alpine:latest", 1000) == ("missing", None)
+    assert snapshot.stats["Missing"] == 2
+
+
+def test_lookup_of_cached_digest():
+    snapshot = DestinationSnapshot(ttl=600)
+    snapshot.load({"library/nginx": {"latest": ["sha256:a", 1000]}})
+    snapshot.refresh(make_walker(TAGS), ["library/nginx"])
+
+    # Existing Tag without a known Digest
+    assert snapshot.lookup("registry.local/library/nginx:1.27", 1000) == ("unknown", None)
+
+    # Fresh and stale Digest
+    assert snapshot.lookup("registry.local/library/nginx:latest", 1600) == ("cached", "sha256:a")
+    assert snapshot.lookup("registry.local/library/nginx:latest", 1601) == ("unknown", None)
+    assert snapshot.stats == dict(Lists=1, Cached=1, Missing=0, Unknown=2)
+
+
+def test_update_after_transfer():
+    snapshot = DestinationSnapshot()
+    snapshot.refresh(make_walker(TAGS), ["library/nginx"])
+
+    # A Tag created during the Run is known afterwards
+    snapshot.update("registry.local/library/nginx:1.26", "sha256:b", 1000)
+    assert snapshot.lookup("registry.local/library/nginx:1.26", 1000) == ("cached", "sha256:b")
+
+    # Repositories that were not listed stay unknown
+    snapshot.update("registry.local/library/redis:latest", "sha256:c", 1000)
+    assert snapshot.lookup("registry.local/library/redis:latest", 1000) == ("unknown", None)
+
+
+def test_refresh_forgets_deleted_tags():
+    snapshot = DestinationSnapshot()
+    snapshot.load({"library/nginx": {"latest": ["sha256:a", 1000], "1.25": ["sha256:old", 1000]}})
+
+    snapshot.refresh(make_walker(TAGS), ["library/nginx"])
+
+    assert snapshot.dump() == {"library/nginx": {"latest": ["sha256:a", 1000]}}
+    assert snapshot.lookup("registry.local/library/nginx:1.25", 1000) == ("missing", None)
@@ -0,0 +1,102 @@
+# pytest Library
+import pytest
+
+# Tag Selector
+from docker_sync_registries.tag_selector import TagSelector, parse_semver_range, version_key
+
+
+# Check if a Version is within a Semantic Versioning Range
+def in_range(text: str,
+             version: tuple[int, int, int]
+             ) -> bool:
+
+    return all(predicate(version) for predicate in parse_semver_range(text))
+
+
+@pytest.mark.parametrize("text, version, expected", [
+    # Prefix Matches
+    ("1.25", (1, 25, 0), True),
+    ("1.25.x", (1, 25, 9), True),
+    ("1.25.*", (1, 26, 0), False),
+    ("=1", (1, 99, 99), True),
+    ("!=1.25", (1, 25, 3), False),
+    ("!=1.25", (1, 24, 3), True),
+
+    # Comparisons (missing Parts are 0)
+    (">=1.24, <2", (1, 24, 0), True),
+    (">=1.24 <2", (2, 0, 0), False),
+    (">1.24", (1, 24, 0), False),
+    (">1.24", (1, 24, 1), True),
+    ("<=1.24", (1, 24, 0), True),
+    ("<=1.24", (1, 24, 1), False),
+
+    # Caret Ranges: same left-most non-zero Part
+    ("^1.2.3", (1, 9, 0), True),
+    ("^1.2.3", (2, 0, 0), False),
+    ("^1.2.3", (1, 2, 2), False),
+    ("^0.2.3", (0, 2, 9), True),
+    ("^0.2.3", (0, 3, 0), False),
+    ("^0.0.3", (0, 0, 3), True),
+    ("^0.0.3", (0, 0, 4), False),
+    ("^0", (0, 9, 9), True),
+    ("^0", (1, 0, 0), False),
+
+    # Tilde Ranges: same Minor Version (or Major if only the Major Version is given)
+    ("~1.25", (1, 25, 9), True),
+    ("~1.25", (1, 26, 0), False),
+    ("~1.25.3", (1, 25, 2), False),
+    ("~1", (1, 99, 0), True),
+    ("~1", (2, 0, 0), False),
+
+    # Wildcards and empty Ranges match anything
+    ("*", (0, 0, 1), True),
+    ("", (9, 9, 9), True),
+])
+def test_semver_range(text, version, expected):
+    assert in_range(text, version) is expected
+
+
+@pytest.mark.parametrize("text", ["abc", ">=1.2.3.4", "^latest", ">= 1.2"])
+def test_invalid_semver_range(text):
+    with pytest.raises(ValueError):
+        parse_semver_range(text)
+
+
+def test_version_key_orders_pre_releases_before_releases():
+    tags = ["1.10.0", "1.10.0-rc2", "1.9.0", "1.10.0-rc1", "v1.10.1", "1.10.0+build.5", "latest"]
+
+    assert sorted(tags, key=version_key) == ["latest", "1.9.0", "1.10.0-rc1", "1.10.0-rc2", "1.10.0", "1.10.0+build.5", "v1.10.1"]
+
+
+def test_version_key_orders_numerically():
+    assert sorted(["1.25.10", "1.25.9", "v1.25.11"], key=version_key) == ["1.25.9", "1.25.10", "v1.25.11"]
+
+
+def test_select_skips_variants_and_non_versions():
+    selector = TagSelector(semver=">=1.24, <2")
+
+    assert selector.select(["1.23.9", "1.24.0", "v1.30.1", "2.0.0", "1.25.3-alpine", "1.25.4-rc1", "latest"]) == ["1.24.0", "v1.30.1"]
+
+
+def test_select_variants_using_regex():
+    selector = TagSelector(regex=r"1\.25\.\d+-alpine", semver="~1.25", newest=2)
+
+    assert selector.select(["1.25.3-alpine", "1.25.10-alpine", "1.25.9-alpine", "1.25.3", "1.26.0-alpine"]) == ["1.25.9-alpine", "1.25.10-alpine"]
+
+
+def test_newest_prefers_release_over_pre_release():
+    selector = TagSelector(regex=r"[\d.]+(-rc\d+)?", newest=1)
+
+    assert selector.select(["1.10.0-rc1", "1.10.0", "1.9.0"]) == ["1.10.0"]
+
+
+def test_regex_must_match_entire_tag():
+    selector = TagSelector(regex=r"stable")
+
+    assert selector.select(["stable", "stable-slim", "unstable"]) == ["stable"]
+
+
+@pytest.mark.parametrize("definition", [dict(), dict(unknown=1), dict(newest=0), dict(regex="(")])
+def test_invalid_definition(definition):
+    with pytest.raises(ValueError):
+        TagSelector.from_config(definition)
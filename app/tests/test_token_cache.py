@@ -0,0 +1,94 @@
+# Threading Library
+import threading
+
+# Registry Client
+from docker_sync_registries.registry import TokenCache
+
+
+# Token Server returning numbered Tokens
+class TokenServer:
+    def __init__(self,
+                 expires_in: float | None = 300,
+                 key: str = "token"
+                 ) -> None:
+
+        self.expires_in = expires_in
+        self.key = key
+        self.requests = 0
+
+    def __call__(self) -> dict:
+        self.requests += 1
+
+        data = {self.key: f"token-{self.requests}"}
+        if self.expires_in is not None:
+            data["expires_in"] = self.expires_in
+
+        return data
+
+
+def test_token_is_cached_until_refresh_margin(clock):
+    cache = TokenCache(refresh_margin=30)
+    server = TokenServer(expires_in=300)
+
+    assert cache.get("https://auth.docker.io/token", "registry.docker.io", "repository:library/nginx:pull", server) == "token-1"
+
+    clock.value += 269
+    assert cache.get("https://auth.docker.io/token", "registry.docker.io", "repository:library/nginx:pull", server) == "token-1"
+
+    # Refreshed 30 Seconds before it expires
+    clock.value += 1
+    assert cache.get("https://auth.docker.io/token", "registry.docker.io", "repository:library/nginx:pull", server) == "token-2"
+
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_default_lifetime_and_short_tokens(clock):
+    cache = TokenCache(refresh_margin=30, default_expires_in=60)
+
+    # Without "expires_in" the Token is valid for 60 Seconds (refreshed after 30 Seconds)
+    server = TokenServer(expires_in=None, key="access_token")
+    assert cache.get("realm", None, "scope", server) == "token-1"
+    clock.value += 29
+    assert cache.lookup("realm", None, "scope") == "token-1"
+    clock.value += 1
+    assert cache.lookup("realm", None, "scope") is None
+
+    # Short-lived Tokens are kept for half of their Lifetime
+    server = TokenServer(expires_in=10)
+    assert cache.get("realm", None, "other", server) == "token-1"
+    clock.value += 4.9
+    assert cache.lookup("realm", None, "other") == "token-1"
+    clock.value += 0.1
+    assert cache.lookup("realm", None, "other") is None
+
+
+def test_tokens_are_cached_per_scope_and_invalidated(clock):
+    cache = TokenCache()
+    server = TokenServer()
+
+    assert cache.get("realm", "service", "repository:a:pull", server) == "token-1"
+    assert cache.get("realm", "service", "repository:b:pull", server) == "token-2"
+    assert cache.get("realm", "service", "repository:a:pull", server) == "token-1"
+
+    cache.invalidate("realm", "service", "repository:a:pull")
+    assert cache.get("realm", "service", "repository:a:pull", server) == "token-3"
+
+
+def test_concurrent_requests_fetch_one_token(clock):
+    cache = TokenCache()
+    server = TokenServer()
+    barrier = threading.Barrier(8)
+    results = []
+
+    def worker() -> None:
+        barrier.wait()
+        results.append(cache.get("realm", "service", "scope", server))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["token-1"] * 8
+    assert server.requests == 1